@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-crawl cost of the day aggregate behind read_all_today_titles
+
+Writes a day of synthetic crawl files (--platforms x --titles per file, each
+title staying on the list for --lifetime crawls) one at a time into a
+temporary project, and after each file measures
+
+- daemon tick:   read_all_today_titles with the aggregate kept in memory
+                 (parse and fold the new file, append it to the journal)
+- fresh process: loading the persisted aggregate from disk (snapshot plus
+                 journal replay), what a cron run pays before folding
+- full re-parse: the original fold of every txt file, at checkpoints only
+
+Tick times are reported over the --window ticks before each checkpoint,
+together with the number of snapshot rewrites in that window. The aggregate
+is compared with the full re-parse at every checkpoint; a mismatch exits
+with status 1.
+
+Usage:
+    python benchmarks/bench_day_aggregate.py [--files 288] [--platforms 15]
+        [--titles 30] [--lifetime 4] [--window 24]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("CONFIG_PATH", str(ROOT / "config" / "config.yaml"))
+
+import main  # noqa: E402
+
+
+def write_crawl(txt_dir: Path, index: int, platforms: list, titles: int, lifetime: int) -> None:
+    """Write crawl number `index`; titles rotate every `lifetime` crawls"""
+    base = (index // lifetime) * titles
+    with open(txt_dir / f"{index // 60:02d}时{index % 60:02d}分.txt", "w", encoding="utf-8") as f:
+        for platform in platforms:
+            f.write(f"{platform} | Platform {platform}\n")
+            for rank in range(1, titles + 1):
+                f.write(
+                    f"{rank}. Story {base + rank} on {platform} "
+                    f"[URL:https://example.com/{platform}/{base + rank}]\n"
+                )
+            f.write("\n")
+
+
+def full_reparse(txt_dir: Path, platform_ids: list) -> tuple:
+    """The original read_all_today_titles: fold every txt file from scratch"""
+    all_results, id_to_name, title_info = {}, {}, {}
+    for file_path in sorted(txt_dir.glob("*.txt")):
+        titles_by_id, file_id_to_name = main.parse_file_titles(file_path)
+        id_to_name.update({k: v for k, v in file_id_to_name.items() if k in platform_ids})
+        for source_id, title_data in titles_by_id.items():
+            if source_id in platform_ids:
+                main.process_source_data(
+                    source_id, title_data, file_path.stem, all_results, title_info
+                )
+    return all_results, id_to_name, title_info
+
+
+def normalized(result: tuple) -> str:
+    return json.dumps(result, sort_keys=True, ensure_ascii=False)
+
+
+def main_bench():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    arg_parser.add_argument("--files", type=int, default=288)
+    arg_parser.add_argument("--platforms", type=int, default=15)
+    arg_parser.add_argument("--titles", type=int, default=30)
+    arg_parser.add_argument("--lifetime", type=int, default=4)
+    arg_parser.add_argument("--window", type=int, default=24)
+    args = arg_parser.parse_args()
+
+    platforms = [f"p{i}" for i in range(args.platforms)]
+    monitored = platforms[: max(1, args.platforms * 4 // 5)]
+    checkpoints = sorted({n for n in (48, 144, 288, 576, args.files) if n <= args.files})
+
+    compactions = []
+    write_snapshot = main.DayAggregate._write_snapshot
+
+    def counting_write_snapshot(self):
+        compactions.append(len(self.files))
+        write_snapshot(self)
+
+    main.DayAggregate._write_snapshot = counting_write_snapshot
+
+    project = Path(tempfile.mkdtemp(prefix="bench_day_"))
+    cwd = os.getcwd()
+    os.chdir(project)
+    print(
+        f"{args.platforms} platforms x {args.titles} titles per file, "
+        f"titles live {args.lifetime} crawls"
+    )
+    failed = False
+    try:
+        txt_dir = Path("output") / main.format_date_folder() / "txt"
+        txt_dir.mkdir(parents=True)
+        aggregate = main.DayAggregate(txt_dir.parent)
+        file_cache = {}
+        ticks = []
+        for index in range(args.files):
+            write_crawl(txt_dir, index, platforms, args.titles, args.lifetime)
+            start = time.perf_counter()
+            result = main.read_all_today_titles(monitored, file_cache, aggregate)
+            ticks.append(time.perf_counter() - start)
+
+            files = index + 1
+            if files not in checkpoints:
+                continue
+            window = ticks[-args.window:]
+            rewrites = sum(1 for n in compactions if n > files - len(window))
+
+            start = time.perf_counter()
+            fresh = main.DayAggregate(txt_dir.parent)
+            load_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            expected = full_reparse(txt_dir, set(monitored))
+            reparse_time = time.perf_counter() - start
+
+            same = normalized(result) == normalized(expected) == normalized(
+                fresh.view(monitored)
+            )
+            failed = failed or not same
+            print(
+                f"  {files:4d} files: daemon tick mean {statistics.mean(window) * 1000:6.2f}ms"
+                f" median {statistics.median(window) * 1000:6.2f}ms"
+                f" max {max(window) * 1000:6.2f}ms ({rewrites} snapshot rewrites),"
+                f" fresh load {load_time * 1000:7.1f}ms,"
+                f" full re-parse {reparse_time * 1000:7.1f}ms, identical: {same}"
+            )
+        print(f"  {len(compactions)} snapshot rewrites in {args.files} crawls")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(project, ignore_errors=True)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: multi-day range loading in the MCP server
+
+Copies one day of crawl output into N synthetic past days, then times the
+per-day read loop the MCP range tools run over them, cold:
+
+- sequential: RANGE_LOAD_WORKERS = 1 (parsed day by day in this process)
+- parallel:   preload_date_range through the shared process pool, then the
+              same per-day loop (which now hits the day cache)
+
+The first parallel run includes starting the pool, which a running server
+pays once; the reported times are the best of --repeat runs after it.
+Results are checked to be identical.
+
+Usage:
+    python benchmarks/bench_range_load.py [--days 14] [--workers 4]
+        [--repeat 3] [--source output/2025-11-20]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_server.services import parser_service  # noqa: E402
+from mcp_server.services.cache_service import get_cache  # noqa: E402
+from mcp_server.services.parser_service import ParserService  # noqa: E402
+
+
+def make_project(source: Path, days: int) -> tuple:
+    """Create a temporary project with `days` copies of the source day"""
+    root = Path(tempfile.mkdtemp(prefix="bench_range_"))
+    end = datetime.now() - timedelta(days=1)
+    start = end - timedelta(days=days - 1)
+    for i in range(days):
+        day = (start + timedelta(days=i)).strftime("%Y-%m-%d")
+        shutil.copytree(source / "txt", root / "output" / day / "txt")
+    return root, start, end
+
+
+def read_range(parser: ParserService, start: datetime, end: datetime) -> list:
+    results = []
+    current = start
+    while current <= end:
+        results.append(parser.read_all_titles_for_date(current))
+        current += timedelta(days=1)
+    return results
+
+
+def run(root: Path, start: datetime, end: datetime, workers: int) -> tuple:
+    parser_service.RANGE_LOAD_WORKERS = workers
+    get_cache().clear()
+    parser = ParserService(str(root))
+    t = time.perf_counter()
+    preloaded = parser.preload_date_range(start, end) if workers > 1 else 0
+    results = read_range(parser, start, end)
+    return time.perf_counter() - t, preloaded, results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    arg_parser.add_argument("--days", type=int, default=14)
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--source", default="output/2025-11-20")
+    args = arg_parser.parse_args()
+
+    source = Path(args.source)
+    root, start, end = make_project(source, args.days)
+    txt_files = len(list((source / "txt").glob("*.txt")))
+    print(f"{args.days} days x {txt_files} txt files, {os.cpu_count()} CPU(s), {args.workers} worker(s)")
+
+    try:
+        _, _, expected = run(root, start, end, 1)
+        sequential = min(run(root, start, end, 1)[0] for _ in range(args.repeat))
+        print(f"  sequential:            {sequential:.3f}s")
+
+        first, preloaded, results = run(root, start, end, args.workers)
+        print(f"  parallel (pool start): {first:.3f}s  preloaded {preloaded} days")
+        same = results == expected
+        parallel = float("inf")
+        for _ in range(args.repeat):
+            elapsed, _, results = run(root, start, end, args.workers)
+            parallel = min(parallel, elapsed)
+            same = same and results == expected
+        print(f"  parallel (warm pool):  {parallel:.3f}s  speedup {sequential / parallel:.2f}x")
+        print(f"  identical results: {same}")
+    finally:
+        parser_service.shutdown_process_pool()
+        get_cache().close()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark: frequency-word matching, per-word checks vs WordGroupMatcher
+
+Generates a seeded synthetic rule set (word groups with required/normal
+words, global filter words) and a batch of titles, then matches every title
+with
+
+- reference: the original rule-by-rule loop, `word.lower() in title.lower()`
+  for each word of each group, extended with the same term syntax
+  (alternation, [whole word], /regex/) evaluated one entry at a time
+- compiled:  frequency_rules.WordGroupMatcher (one pass per title)
+
+Both must agree on every title (filtered or not, and the first matching
+group); any mismatch is printed and the script exits with status 1, so it
+doubles as an equivalence check.
+
+Usage:
+    python benchmarks/bench_word_groups.py [--groups 1500] [--filters 200]
+        [--titles 5000] [--seed 1] [--plain]
+
+    --plain  only plain substring entries (the syntax of the original rules)
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from frequency_rules import (  # noqa: E402
+    REGEX,
+    SUBSTRING,
+    WordGroupMatcher,
+    parse_term,
+    word_boundary_regex,
+)
+
+LATIN = "abcdefghijklmnopqrstuvwxyz"
+CJK = "华为苹果特斯拉人工智能芯片手机汽车发布会议经济市场股票能源电池"
+
+
+def make_vocabulary(rng: random.Random, size: int) -> List[str]:
+    words = set()
+    while len(words) < size:
+        if rng.random() < 0.3:
+            words.add("".join(rng.choice(CJK) for _ in range(rng.randint(2, 4))))
+        else:
+            words.add("".join(rng.choice(LATIN) for _ in range(rng.randint(2, 8))))
+    return sorted(words)
+
+
+def make_entry(rng: random.Random, vocabulary: List[str], plain: bool) -> str:
+    word = rng.choice(vocabulary)
+    if rng.random() < 0.3:
+        word = word.capitalize()
+    if plain:
+        return word
+    roll = rng.random()
+    if roll < 0.1:
+        return f"[{word}]"
+    if roll < 0.15:
+        return f"/{re.escape(word)}\\d*/"
+    if roll < 0.25:
+        return "|".join([word, f"[{rng.choice(vocabulary)}]", rng.choice(vocabulary)])
+    return word
+
+
+def make_rules(
+    rng: random.Random,
+    vocabulary: List[str],
+    rare: List[str],
+    groups: int,
+    filters: int,
+    plain: bool,
+) -> Tuple[List[Dict], List[str]]:
+    word_groups = []
+    for _ in range(groups):
+        required = [make_entry(rng, vocabulary, plain) for _ in range(rng.choice([0, 0, 1, 2]))]
+        normal = [make_entry(rng, vocabulary, plain) for _ in range(rng.randint(0 if required else 1, 4))]
+        word_groups.append({"required": required, "normal": normal, "filter_words": []})
+    # Filter words come from words that titles rarely contain
+    filter_words = [make_entry(rng, rare, plain) for _ in range(filters)]
+    return word_groups, filter_words
+
+
+def make_titles(
+    rng: random.Random, vocabulary: List[str], rare: List[str], count: int
+) -> List[str]:
+    titles = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(3, 12)):
+            word = rng.choice(rare if rng.random() < 0.01 else vocabulary)
+            roll = rng.random()
+            if roll < 0.2:
+                word = word.upper()
+            elif roll < 0.3:
+                # Glued to a neighbour, so substrings match but whole words do not
+                word += rng.choice(vocabulary)
+            elif roll < 0.35:
+                word += str(rng.randint(0, 99))
+            parts.append(word)
+        titles.append(" ".join(parts))
+    return titles
+
+
+def entry_matches(entry: str, title: str) -> bool:
+    """One rule entry against one title, evaluated directly"""
+    title_lower = title.lower()
+    for kind, pattern in parse_term(entry):
+        if kind == SUBSTRING:
+            if pattern.lower() in title_lower:
+                return True
+        elif kind == REGEX:
+            try:
+                if re.search(pattern, title, re.IGNORECASE):
+                    return True
+            except re.error:
+                continue
+        elif re.search(word_boundary_regex(pattern), title, re.IGNORECASE):
+            return True
+    return False
+
+
+def reference_match(
+    title: str, word_groups: List[Dict], filter_words: List[str]
+) -> Tuple[bool, Optional[int]]:
+    """The original per-word loop: (filtered, first matching group)"""
+    if any(entry_matches(word, title) for word in filter_words):
+        return True, None
+    for index, group in enumerate(word_groups):
+        if group["required"] and not all(entry_matches(w, title) for w in group["required"]):
+            continue
+        if group["normal"] and not any(entry_matches(w, title) for w in group["normal"]):
+            continue
+        return False, index
+    return False, None
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    arg_parser.add_argument("--groups", type=int, default=1500)
+    arg_parser.add_argument("--filters", type=int, default=200)
+    arg_parser.add_argument("--titles", type=int, default=5000)
+    arg_parser.add_argument("--seed", type=int, default=1)
+    arg_parser.add_argument("--plain", action="store_true")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = make_vocabulary(rng, max(200, args.groups) + max(50, args.filters))
+    rng.shuffle(words)
+    rare, vocabulary = words[:max(50, args.filters)], words[max(50, args.filters):]
+    word_groups, filter_words = make_rules(
+        rng, vocabulary, rare, args.groups, args.filters, args.plain
+    )
+    titles = make_titles(rng, vocabulary, rare, args.titles)
+    print(
+        f"{args.groups} groups, {args.filters} filter words, {args.titles} titles"
+        f"{' (plain substrings)' if args.plain else ''}"
+    )
+
+    start = time.perf_counter()
+    expected = [reference_match(title, word_groups, filter_words) for title in titles]
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = WordGroupMatcher(word_groups, filter_words)
+    compile_time = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = [matcher.match(title) for title in titles]
+    match_time = time.perf_counter() - start
+
+    mismatches = [
+        (title, want, got) for title, want, got in zip(titles, expected, actual) if want != got
+    ]
+    matched = sum(1 for filtered, group in expected if not filtered and group is not None)
+    filtered = sum(1 for is_filtered, _ in expected if is_filtered)
+
+    print(f"  reference: {reference_time:.3f}s")
+    print(f"  compiled:  {match_time:.3f}s (+{compile_time:.3f}s compile)")
+    print(f"  {matched} matched, {filtered} filtered, {len(mismatches)} mismatches")
+    for title, want, got in mismatches[:10]:
+        print(f"    {title!r}: expected {want}, got {got}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
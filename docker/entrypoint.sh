@@ -38,6 +38,11 @@ case "${RUN_MODE:-cron}" in
     
     exec /usr/local/bin/supercronic -passthrough-logs /tmp/crontab
     ;;
+"daemon")
+    # 常驻进程，内置调度器，配置和当天数据在多次执行之间保留在内存中
+    echo "⏰ 启动常驻模式: ${CRON_SCHEDULE:-*/30 * * * *}"
+    exec /usr/local/bin/python main.py --daemon
+    ;;
 *)
     exec "$@"
     ;;
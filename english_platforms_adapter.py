@@ -8,26 +8,51 @@ Supports fetching trending news from:
 3. News API (requires API key, 100 requests/day free)
 """
 
+import json
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from http_transport import HttpCache, backoff_delay, get_transport, parse_retry_after
+
 
 class EnglishPlatformsAdapter:
     """Adapter for fetching from English news platforms"""
 
-    def __init__(self, newsapi_key: Optional[str] = None, proxy_url: Optional[str] = None):
+    # Story fields kept in the Hacker News cache
+    HN_STORY_FIELDS = ('title', 'url', 'score', 'descendants', 'by', 'time')
+
+    def __init__(
+        self,
+        newsapi_key: Optional[str] = None,
+        proxy_url: Optional[str] = None,
+        hn_max_workers: int = 10,
+        hn_cache_ttl: int = 3600,
+        cache_dir: str = "output",
+        http_cache: Optional[HttpCache] = None,
+    ):
         """
         Initialize the adapter
 
         Args:
             newsapi_key: API key for News API (optional)
             proxy_url: Proxy URL if needed (optional)
+            hn_max_workers: Max concurrent Hacker News item requests
+            hn_cache_ttl: Seconds a cached Hacker News story stays valid (0 disables the cache)
+            cache_dir: Directory holding the Hacker News story cache file
+            http_cache: Conditional request cache (defaults to one under cache_dir)
         """
         self.newsapi_key = newsapi_key
         self.proxy_url = proxy_url
-        self.proxies = {'http': proxy_url, 'https': proxy_url} if proxy_url else None
+        self.hn_max_workers = hn_max_workers
+        self.hn_cache_ttl = hn_cache_ttl
+        self.hn_cache_file = Path(cache_dir) / ".hn_story_cache.json"
+        self._hn_cache_lock = threading.Lock()
+        self.http_cache = http_cache or HttpCache(str(Path(cache_dir) / ".http_cache.json"))
 
     def fetch(self, platform_config: Dict) -> Dict:
         """
@@ -53,6 +78,45 @@ class EnglishPlatformsAdapter:
         else:
             raise ValueError(f"Unknown API type: {api_type}")
 
+    def _parse_reddit_listing(self, response: requests.Response) -> List[Dict]:
+        """
+        Build ranked items from a Reddit listing response
+
+        Args:
+            response: hot.json response
+
+        Returns:
+            List of item dicts
+        """
+        data = response.json()
+
+        items = []
+        if 'data' in data and 'children' in data['data']:
+            for idx, child in enumerate(data['data']['children'], 1):
+                post = child['data']
+
+                # Skip stickied posts
+                if post.get('stickied', False):
+                    continue
+
+                items.append({
+                    'rank': idx,
+                    'title': post.get('title', ''),
+                    'url': post.get('url', ''),
+                    'mobileUrl': post.get('url', ''),
+                    'score': post.get('score', 0),
+                    'comments': post.get('num_comments', 0),
+                    'created': post.get('created_utc', 0),
+                    'author': post.get('author', 'unknown'),
+                    'is_video': post.get('is_video', False),
+                    'is_self': post.get('is_self', False)
+                })
+
+                if len(items) >= 50:
+                    break
+
+        return items
+
     def fetch_from_reddit(self, subreddit: str) -> Dict:
         """
         Fetch trending posts from Reddit using the JSON API (unauthenticated)
@@ -61,7 +125,7 @@ class EnglishPlatformsAdapter:
             subreddit: Subreddit name (e.g., 'worldnews', 'technology')
         
         Returns:
-            Dict with format: {'id': str, 'name': str, 'items': List[Dict]}
+            Dict with format: {'id': str, 'name': str, 'items': List[Dict], 'unchanged': bool}
         """
         # Use the JSON endpoint which provides more metadata than RSS
         url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=50"
@@ -72,50 +136,38 @@ class EnglishPlatformsAdapter:
             'Accept': 'application/json'
         }
 
-        try:
-            response = requests.get(
+        def fetch_listing():
+            return get_transport().get_cached(
+                self.http_cache,
+                f"reddit:{subreddit}",
                 url,
+                self._parse_reddit_listing,
+                proxy_url=self.proxy_url,
                 headers=headers,
-                proxies=self.proxies,
-                timeout=15
+                timeout=15,
+                pace=True
             )
-            
-            # Handle specific Reddit errors
-            if response.status_code == 429:
-                print(f"Rate limited by Reddit for r/{subreddit}. Waiting and retrying...")
-                time.sleep(5)
-                response = requests.get(url, headers=headers, proxies=self.proxies, timeout=15)
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            print(f"✓ Using Reddit JSON API for r/{subreddit} (with scores & comments)")
-            
-            items = []
-            if 'data' in data and 'children' in data['data']:
-                for idx, child in enumerate(data['data']['children'], 1):
-                    post = child['data']
-                    
-                    # Skip stickied posts
-                    if post.get('stickied', False):
-                        continue
-                        
-                    items.append({
-                        'rank': idx,
-                        'title': post.get('title', ''),
-                        'url': post.get('url', ''),
-                        'mobileUrl': post.get('url', ''),
-                        'score': post.get('score', 0),
-                        'comments': post.get('num_comments', 0),
-                        'created': post.get('created_utc', 0),
-                        'author': post.get('author', 'unknown'),
-                        'is_video': post.get('is_video', False),
-                        'is_self': post.get('is_self', False)
-                    })
-                    
-                    if len(items) >= 50:
-                        break
-                
+
+        try:
+            try:
+                items, unchanged = fetch_listing()
+            except requests.HTTPError as e:
+                # Handle specific Reddit errors
+                if e.response is None or e.response.status_code != 429:
+                    raise
+                wait_time = backoff_delay(1, retry_after=parse_retry_after(e.response))
+                if wait_time is None:
+                    # Server asks for a longer pause than worth blocking on
+                    raise
+                print(f"Rate limited by Reddit for r/{subreddit}. Retrying in {wait_time:.1f}s...")
+                time.sleep(wait_time)
+                items, unchanged = fetch_listing()
+
+            if unchanged:
+                print(f"✓ Reddit r/{subreddit} unchanged since last crawl, reusing cached posts")
+            else:
+                print(f"✓ Using Reddit JSON API for r/{subreddit} (with scores & comments)")
+
                 # Log sample data to verify scores are being fetched
                 if items:
                     sample = items[0]
@@ -124,7 +176,8 @@ class EnglishPlatformsAdapter:
             return {
                 'id': f"reddit-{subreddit}",
                 'name': f"Reddit r/{subreddit}",
-                'items': items
+                'items': items,
+                'unchanged': unchanged
             }
 
         except Exception as e:
@@ -134,59 +187,137 @@ class EnglishPlatformsAdapter:
                 'id': f"reddit-{subreddit}",
                 'name': f"Reddit r/{subreddit}",
                 'items': [],
-                'error': str(e)
+                'error': str(e),
+                'retry_after': parse_retry_after(getattr(e, 'response', None))
             }
 
+    def _load_hn_cache(self) -> Dict:
+        """Load cached Hacker News stories, dropping expired entries"""
+        if self.hn_cache_ttl <= 0 or not self.hn_cache_file.exists():
+            return {}
+
+        try:
+            with open(self.hn_cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except Exception as e:
+            print(f"Failed to load Hacker News cache: {e}")
+            return {}
+
+        cutoff = time.time() - self.hn_cache_ttl
+        return {
+            story_id: entry for story_id, entry in cache.items()
+            if entry.get('fetched_at', 0) > cutoff
+        }
+
+    def _save_hn_cache(self, cache: Dict) -> None:
+        """Persist cached Hacker News stories"""
+        if self.hn_cache_ttl <= 0:
+            return
+
+        try:
+            self.hn_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.hn_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Failed to save Hacker News cache: {e}")
+
+    def _fetch_hn_story(self, story_id: int) -> Optional[Dict]:
+        """
+        Fetch a single Hacker News item
+
+        Args:
+            story_id: Hacker News item id
+
+        Returns:
+            Story dict limited to HN_STORY_FIELDS, or None on failure
+        """
+        try:
+            item_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
+            story_response = get_transport().get(
+                item_url, proxy_url=self.proxy_url, timeout=5, pace=True
+            )
+            story_response.raise_for_status()
+            story = story_response.json()
+        except Exception as e:
+            print(f"Error fetching HN story {story_id}: {e}")
+            return None
+
+        if not story:
+            return None
+        return {field: story[field] for field in self.HN_STORY_FIELDS if field in story}
+
     def fetch_from_hackernews(self) -> Dict:
         """
         Fetch top stories from Hacker News
 
+        Item details are fetched concurrently (bounded by hn_max_workers) and
+        cached by item id for hn_cache_ttl seconds, so only ids that are new
+        since the last crawl hit the network.
+
         Returns:
             Dict with format: {'id': str, 'name': str, 'items': List[Dict]}
         """
         try:
             # Get top story IDs
             ids_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-            ids_response = requests.get(ids_url, proxies=self.proxies, timeout=10)
-            ids_response.raise_for_status()
-            story_ids = ids_response.json()[:50]  # Get top 50 IDs
+            story_ids, ids_unchanged = get_transport().get_cached(
+                self.http_cache,
+                "hackernews:topstories",
+                ids_url,
+                lambda response: response.json()[:50],  # Get top 50 IDs
+                proxy_url=self.proxy_url,
+                timeout=10,
+                pace=True
+            )
+
+            with self._hn_cache_lock:
+                cache = self._load_hn_cache()
+                missing_ids = [
+                    story_id for story_id in story_ids if str(story_id) not in cache
+                ]
+
+                if missing_ids:
+                    workers = max(1, min(self.hn_max_workers, len(missing_ids)))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        fetched = list(executor.map(self._fetch_hn_story, missing_ids))
+
+                    now = time.time()
+                    for story_id, story in zip(missing_ids, fetched):
+                        if story is not None:
+                            cache[str(story_id)] = {'fetched_at': now, 'story': story}
+
+                    self._save_hn_cache(cache)
+
+            print(
+                f"Hacker News: {len(story_ids) - len(missing_ids)} stories from cache, "
+                f"{len(missing_ids)} fetched"
+            )
 
             items = []
             for idx, story_id in enumerate(story_ids, 1):
-                try:
-                    # Fetch individual story
-                    item_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                    story_response = requests.get(item_url, proxies=self.proxies, timeout=5)
-                    story_response.raise_for_status()
-                    story = story_response.json()
-
-                    if story and story.get('title'):
-                        # Use story URL if available, otherwise link to HN discussion
-                        story_url = story.get('url', f"https://news.ycombinator.com/item?id={story_id}")
-                        
-                        items.append({
-                            'rank': idx,
-                            'title': story['title'],
-                            'url': story_url,
-                            'mobileUrl': story_url,
-                            'score': story.get('score', 0),
-                            'comments': story.get('descendants', 0),
-                            'by': story.get('by', 'unknown'),
-                            'time': story.get('time', 0)
-                        })
-
-                    # Rate limiting - be nice to HN API
-                    if idx % 10 == 0:
-                        time.sleep(0.5)
-
-                except Exception as e:
-                    print(f"Error fetching HN story {story_id}: {e}")
-                    continue
+                entry = cache.get(str(story_id))
+                story = entry['story'] if entry else None
+
+                if story and story.get('title'):
+                    # Use story URL if available, otherwise link to HN discussion
+                    story_url = story.get('url', f"https://news.ycombinator.com/item?id={story_id}")
+
+                    items.append({
+                        'rank': idx,
+                        'title': story['title'],
+                        'url': story_url,
+                        'mobileUrl': story_url,
+                        'score': story.get('score', 0),
+                        'comments': story.get('descendants', 0),
+                        'by': story.get('by', 'unknown'),
+                        'time': story.get('time', 0)
+                    })
 
             return {
                 'id': 'hackernews',
                 'name': 'Hacker News',
-                'items': items
+                'items': items,
+                'unchanged': ids_unchanged and not missing_ids
             }
 
         except Exception as e:
@@ -225,11 +356,12 @@ class EnglishPlatformsAdapter:
         }
 
         try:
-            response = requests.get(
+            response = get_transport().get(
                 url,
                 params=params,
-                proxies=self.proxies,
-                timeout=15
+                proxy_url=self.proxy_url,
+                timeout=15,
+                pace=True
             )
             response.raise_for_status()
             data = response.json()
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Frequency Word Rules
+
+Parser and compiled matcher for config/frequency_words.txt, shared by
+main.py and the MCP server.
+
+Groups are separated by empty lines. Each line is one entry, optionally
+prefixed with "+" (required) or "!" (filter); entries without a prefix are
+normal words. An entry is one of:
+
+    Huawei            substring, case-insensitive
+    [AI]              whole word: not preceded or followed by a letter/digit
+                      (CJK text has no spaces between words, so CJK characters
+                      never break a boundary: [AI] matches in "使用AI技术" and
+                      [华为] behaves like the substring 华为)
+    /gpt-?\\d+/        regular expression, case-insensitive
+    华为|Huawei|[HW]   alternation of substrings and whole words
+
+All entries of all groups are compiled together: substrings and whole words
+into one Aho-Corasick automaton (whole words are confirmed at their
+boundaries only once found), regular expressions into one combined regex
+used as a gate before the individual patterns are tested. Matching a title
+costs one pass over it regardless of the number of literal rules.
+"""
+
+import re
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+SUBSTRING = "substring"
+WORD = "word"
+REGEX = "regex"
+
+# CJK scripts are written without spaces, so their characters neither
+# need nor break a whole-word boundary
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_CJK_CHAR = re.compile(rf"[{_CJK}]")
+_NOT_AFTER_WORD = rf"(?<![^\W{_CJK}])"
+_NOT_BEFORE_WORD = rf"(?![^\W{_CJK}])"
+
+
+def parse_term(entry: str) -> List[Tuple[str, str]]:
+    """
+    Split a rule entry into its alternatives
+
+    Args:
+        entry: Entry text without the +/! prefix
+
+    Returns:
+        [(kind, pattern)] with kind in substring / word / regex
+    """
+    if len(entry) >= 2 and entry.startswith("/") and entry.endswith("/"):
+        return [(REGEX, entry[1:-1])]
+
+    alternatives = []
+    parts = entry.split("|") if "|" in entry else [entry]
+    for part in parts:
+        part = part.strip() if len(parts) > 1 else part
+        if len(part) >= 3 and part.startswith("[") and part.endswith("]"):
+            alternatives.append((WORD, part[1:-1]))
+        elif part or len(parts) == 1:
+            alternatives.append((SUBSTRING, part))
+    return alternatives
+
+
+def word_boundary_regex(word: str) -> str:
+    """
+    Build the regex source confirming a whole-word match
+
+    Each end of the word that is not a CJK character must not touch a
+    letter/digit; CJK characters on either side never break the boundary.
+
+    Args:
+        word: Word text, matched literally
+
+    Returns:
+        Regex source
+    """
+    source = re.escape(word)
+    if not _CJK_CHAR.match(word[0]):
+        source = _NOT_AFTER_WORD + source
+    if not _CJK_CHAR.match(word[-1]):
+        source += _NOT_BEFORE_WORD
+    return source
+
+
+def parse_frequency_rules(content: str) -> Tuple[List[Dict], List[str]]:
+    """
+    Parse frequency words file content
+
+    Args:
+        content: File text
+
+    Returns:
+        (word_groups, filter_words); each group is
+        {required, normal, filter_words, group_key} with entries kept as
+        written, filter_words is the global filter list
+    """
+    groups = []
+    filter_words = []
+
+    for block in content.split("\n\n"):
+        words = [word.strip() for word in block.split("\n") if word.strip()]
+
+        required_words = []
+        normal_words = []
+        group_filter_words = []
+
+        for word in words:
+            if word.startswith("!"):
+                filter_words.append(word[1:])
+                group_filter_words.append(word[1:])
+            elif word.startswith("+"):
+                required_words.append(word[1:])
+            else:
+                normal_words.append(word)
+
+        if required_words or normal_words:
+            groups.append(
+                {
+                    "required": required_words,
+                    "normal": normal_words,
+                    "filter_words": group_filter_words,
+                    "group_key": " ".join(normal_words or required_words),
+                }
+            )
+
+    return groups, filter_words
+
+
+class AhoCorasick:
+    """Multi-pattern substring automaton: one pass over a text finds every pattern it contains"""
+
+    def __init__(self, patterns: List[str]):
+        """
+        Build the automaton
+
+        Args:
+            patterns: Patterns, matched literally; the pattern id is the list index
+        """
+        self.patterns = patterns
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Empty patterns are contained in every text
+        self._always = tuple(i for i, pattern in enumerate(patterns) if not pattern)
+
+        outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        # Breadth-first fail links; each state's output includes its fail chain's
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail_target if fail_target != next_state else 0
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+
+        self._output = [tuple(ids) for ids in outputs]
+        self._alphabet = {char for pattern in patterns for char in pattern}
+
+    def find_all(self, text: str) -> Set[int]:
+        """Get the ids of all patterns that occur in text"""
+        found = set(self._always)
+        goto, fail, output, alphabet = self._goto, self._fail, self._output, self._alphabet
+        state = 0
+        for char in text:
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+class TermMatcher:
+    """Set of rule entries compiled for one-pass matching
+
+    Substring and whole-word alternatives go into one Aho-Corasick automaton
+    over the lower-cased text, so substrings behave exactly like
+    `word.lower() in title.lower()`; a whole word found by the automaton is
+    then confirmed with its boundary regex. Regex alternatives are tested
+    case-insensitively behind one combined gate regex.
+    """
+
+    def __init__(self, entries: List[str]):
+        """
+        Compile entries
+
+        Args:
+            entries: Rule entries without +/! prefixes; invalid regexes are
+                reported and never match
+        """
+        self.entries: List[str] = []
+        self._entry_ids: Dict[str, int] = {}
+        substrings: List[str] = []
+        substring_ids: Dict[str, int] = {}
+        # Per substring pattern: entries it satisfies directly, and
+        # {boundary regex source: entries} for whole words that need checking
+        substring_entries: List[List[int]] = []
+        word_checks: List[Dict[str, List[int]]] = []
+        regex_sources: List[str] = []
+        regex_entries: List[List[int]] = []
+        regex_ids: Dict[str, int] = {}
+
+        def substring_id(pattern: str) -> int:
+            pattern = pattern.lower()
+            if pattern not in substring_ids:
+                substring_ids[pattern] = len(substrings)
+                substrings.append(pattern)
+                substring_entries.append([])
+                word_checks.append({})
+            return substring_ids[pattern]
+
+        for entry in entries:
+            if entry in self._entry_ids:
+                continue
+            entry_id = self._entry_ids[entry] = len(self.entries)
+            self.entries.append(entry)
+
+            for kind, pattern in parse_term(entry):
+                if kind == SUBSTRING:
+                    substring_entries[substring_id(pattern)].append(entry_id)
+                elif kind == WORD:
+                    # The automaton finds the word, the regex confirms a boundary
+                    source = word_boundary_regex(pattern)
+                    word_checks[substring_id(pattern)].setdefault(source, []).append(entry_id)
+                else:
+                    try:
+                        re.compile(pattern)
+                    except re.error as e:
+                        print(f"Invalid regex rule '{entry}', ignored: {e}")
+                        continue
+                    if pattern not in regex_ids:
+                        regex_ids[pattern] = len(regex_sources)
+                        regex_sources.append(pattern)
+                        regex_entries.append([])
+                    regex_entries[regex_ids[pattern]].append(entry_id)
+
+        self._automaton = AhoCorasick(substrings)
+        self._substring_entries = [tuple(ids) for ids in substring_entries]
+        self._word_checks = [
+            tuple((re.compile(source, re.IGNORECASE), tuple(ids)) for source, ids in checks.items())
+            for checks in word_checks
+        ]
+        self._regexes = [
+            (re.compile(source, re.IGNORECASE), tuple(ids))
+            for source, ids in zip(regex_sources, regex_entries)
+        ]
+        self._gate: Optional[re.Pattern] = None
+        if len(self._regexes) > 1:
+            try:
+                self._gate = re.compile(
+                    "|".join(f"(?:{source})" for source in regex_sources), re.IGNORECASE
+                )
+            except re.error:
+                # e.g. repeated group names across entries; test them one by one
+                self._gate = None
+
+    def entry_id(self, entry: str) -> int:
+        """Get the id of a compiled entry"""
+        return self._entry_ids[entry]
+
+    def find_ids(self, text: str) -> Set[int]:
+        """Get the ids of all entries that match text"""
+        found: Set[int] = set()
+        substring_entries, word_checks = self._substring_entries, self._word_checks
+        for pattern_id in self._automaton.find_all(text.lower()):
+            found.update(substring_entries[pattern_id])
+            for regex, entry_ids in word_checks[pattern_id]:
+                if regex.search(text):
+                    found.update(entry_ids)
+
+        if self._regexes and (self._gate is None or self._gate.search(text)):
+            for regex, entry_ids in self._regexes:
+                if regex.search(text):
+                    found.update(entry_ids)
+        return found
+
+    def find(self, text: str) -> Set[str]:
+        """Get all entries that match text"""
+        return {self.entries[entry_id] for entry_id in self.find_ids(text)}
+
+
+class WordGroupMatcher:
+    """Frequency word rules compiled into one matcher over all entries
+
+    For plain substring entries this gives exactly the answers of the
+    per-word `word.lower() in title.lower()` checks: a title is rejected
+    when any filter word occurs, otherwise the first group whose required
+    words all occur and (if it has any) one of whose normal words occurs is
+    the matching group.
+    """
+
+    def __init__(self, word_groups: List[Dict], filter_words: List[str]):
+        entries = list(filter_words)
+        for group in word_groups:
+            entries.extend(group["required"])
+            entries.extend(group["normal"])
+        self.terms = TermMatcher(entries)
+        entry_id = self.terms.entry_id
+
+        self.filter_ids: FrozenSet[int] = frozenset(entry_id(word) for word in filter_words)
+        # Per group: (required ids, normal ids)
+        self.groups: List[Tuple[FrozenSet[int], FrozenSet[int]]] = []
+        # Entry id -> indexes of the groups that use it
+        entry_groups: Dict[int, List[int]] = {}
+        for group_index, group in enumerate(word_groups):
+            required = frozenset(entry_id(word) for word in group["required"])
+            normal = frozenset(entry_id(word) for word in group["normal"])
+            self.groups.append((required, normal))
+            for term_id in required | normal:
+                entry_groups.setdefault(term_id, []).append(group_index)
+
+        self.entry_groups = entry_groups
+        # Groups without any word match every unfiltered title
+        self._wordless_groups = [
+            index for index, (required, normal) in enumerate(self.groups)
+            if not required and not normal
+        ]
+
+    def match(self, title: str) -> Tuple[bool, Optional[int]]:
+        """
+        Match a title in one pass
+
+        Args:
+            title: Title text
+
+        Returns:
+            (filtered, group_index): filtered is True when a filter word
+            occurs; group_index is the first matching group or None
+        """
+        found = self.terms.find_ids(title)
+        if found & self.filter_ids:
+            return True, None
+
+        candidates = set(self._wordless_groups)
+        for term_id in found:
+            candidates.update(self.entry_groups.get(term_id, ()))
+
+        for group_index in sorted(candidates):
+            required, normal = self.groups[group_index]
+            if required and not required <= found:
+                continue
+            if normal and normal.isdisjoint(found):
+                continue
+            return False, group_index
+        return False, None
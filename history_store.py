@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+SQLite History Store
+
+Optional embedded database holding every crawl, so multi-day queries become
+indexed lookups instead of re-reading dated folders of txt files. main.py
+records each crawl (and can backfill the existing txt layout); the MCP
+server's ParserService reads from it when it is present and up to date.
+
+Tables:
+    crawls       one row per crawl (date, time, file name)
+    platforms    platform id and display name
+    titles       distinct (platform, title) pairs, with the Unicode-lowercased
+                 title stored for case-insensitive search
+    appearances  a title seen in a crawl, with its rank and urls
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawls (
+    id INTEGER PRIMARY KEY,
+    crawl_date TEXT NOT NULL,
+    crawl_time TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    UNIQUE (crawl_date, crawl_time)
+);
+CREATE TABLE IF NOT EXISTS platforms (
+    id INTEGER PRIMARY KEY,
+    platform_id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS titles (
+    id INTEGER PRIMARY KEY,
+    platform INTEGER NOT NULL REFERENCES platforms (id),
+    title TEXT NOT NULL,
+    title_lower TEXT NOT NULL DEFAULT '',
+    UNIQUE (platform, title)
+);
+CREATE TABLE IF NOT EXISTS appearances (
+    crawl INTEGER NOT NULL REFERENCES crawls (id) ON DELETE CASCADE,
+    title INTEGER NOT NULL REFERENCES titles (id),
+    rank INTEGER NOT NULL,
+    url TEXT NOT NULL DEFAULT '',
+    mobile_url TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (crawl, title)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_crawls_date ON crawls (crawl_date, crawl_time);
+CREATE INDEX IF NOT EXISTS idx_appearances_title ON appearances (title, crawl);
+"""
+
+
+class HistoryStore:
+    """SQLite store of crawled titles"""
+
+    def __init__(self, db_path: str = "output/history.db"):
+        """
+        Open (and create if needed) the store
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        # Unicode-aware case folding; SQLite's lower() only folds ASCII
+        self._conn.create_function("py_lower", 1, str.lower, deterministic=True)
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+            self._migrate()
+
+    def _migrate(self) -> None:
+        """Add columns introduced after a database was created"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(titles)")}
+        if "title_lower" not in columns:
+            self._conn.execute(
+                "ALTER TABLE titles ADD COLUMN title_lower TEXT NOT NULL DEFAULT ''"
+            )
+            self._conn.execute("UPDATE titles SET title_lower = py_lower(title)")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    # === Writing ===
+
+    def _platform_pk(self, platform_id: str, name: str) -> int:
+        self._conn.execute(
+            "INSERT INTO platforms (platform_id, name) VALUES (?, ?) "
+            "ON CONFLICT (platform_id) DO UPDATE SET name = excluded.name",
+            (platform_id, name),
+        )
+        return self._conn.execute(
+            "SELECT id FROM platforms WHERE platform_id = ?", (platform_id,)
+        ).fetchone()[0]
+
+    def _title_pk(self, platform_pk: int, title: str) -> int:
+        self._conn.execute(
+            "INSERT OR IGNORE INTO titles (platform, title, title_lower) VALUES (?, ?, ?)",
+            (platform_pk, title, title.lower()),
+        )
+        return self._conn.execute(
+            "SELECT id FROM titles WHERE platform = ? AND title = ?",
+            (platform_pk, title),
+        ).fetchone()[0]
+
+    def record_crawl(
+        self,
+        crawl_date: str,
+        crawl_time: str,
+        titles_by_id: Dict,
+        id_to_name: Dict,
+        file_name: str = "",
+        recorded_at: Optional[float] = None,
+    ) -> None:
+        """
+        Record one crawl, replacing an earlier record of the same crawl
+
+        Args:
+            crawl_date: YYYY-MM-DD
+            crawl_time: HH-MM (the txt file stem)
+            titles_by_id: {platform_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: {platform_id: platform_name}
+            file_name: Source txt file name
+            recorded_at: When the crawl was saved (the txt file mtime, which
+                the txt reader reports as its timestamp); defaults to now
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM crawls WHERE crawl_date = ? AND crawl_time = ?",
+                (crawl_date, crawl_time),
+            )
+            crawl_pk = self._conn.execute(
+                "INSERT INTO crawls (crawl_date, crawl_time, file_name, recorded_at) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    crawl_date,
+                    crawl_time,
+                    file_name or f"{crawl_time}.txt",
+                    time.time() if recorded_at is None else recorded_at,
+                ),
+            ).lastrowid
+
+            rows = []
+            for platform_id, titles in titles_by_id.items():
+                platform_pk = self._platform_pk(
+                    platform_id, id_to_name.get(platform_id, platform_id)
+                )
+                for title, info in titles.items():
+                    ranks = info.get("ranks") or [1]
+                    rows.append(
+                        (
+                            crawl_pk,
+                            self._title_pk(platform_pk, title),
+                            ranks[0],
+                            info.get("url", ""),
+                            info.get("mobileUrl", ""),
+                        )
+                    )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO appearances (crawl, title, rank, url, mobile_url) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def set_recorded_at(self, crawl_date: str, crawl_time: str, recorded_at: float) -> None:
+        """Correct the saved time of an already recorded crawl"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE crawls SET recorded_at = ? WHERE crawl_date = ? AND crawl_time = ?",
+                (recorded_at, crawl_date, crawl_time),
+            )
+
+    # === Reading ===
+
+    def crawl_count(self, crawl_date: str) -> int:
+        """Get the number of crawls recorded for a date"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM crawls WHERE crawl_date = ?", (crawl_date,)
+            ).fetchone()[0]
+
+    def get_crawl_times(self, crawl_date: str) -> List[str]:
+        """Get the recorded crawl times (HH-MM) of a date"""
+        with self._lock:
+            return [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT crawl_time FROM crawls WHERE crawl_date = ? ORDER BY crawl_time",
+                    (crawl_date,),
+                )
+            ]
+
+    def _query_appearances(self, where: str, params: Tuple) -> List[Tuple]:
+        sql = (
+            "SELECT c.crawl_date, c.crawl_time, c.file_name, c.recorded_at, "
+            "p.platform_id, p.name, t.title, a.rank, a.url, a.mobile_url "
+            "FROM appearances a "
+            "JOIN crawls c ON c.id = a.crawl "
+            "JOIN titles t ON t.id = a.title "
+            "JOIN platforms p ON p.id = t.platform "
+            f"WHERE {where} "
+            "ORDER BY c.crawl_date, c.crawl_time"
+        )
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _platform_filter(platform_ids: Optional[List[str]]) -> Tuple[str, Tuple]:
+        if not platform_ids:
+            return "", ()
+        placeholders = ",".join("?" * len(platform_ids))
+        return f" AND p.platform_id IN ({placeholders})", tuple(platform_ids)
+
+    def read_titles_for_date(
+        self, crawl_date: str, platform_ids: Optional[List[str]] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        Read a day in the shape ParserService.read_all_titles_for_date returns
+
+        Args:
+            crawl_date: YYYY-MM-DD
+            platform_ids: Platform filter, None for all
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps); ranks are collected in
+            crawl order and urls come from the first appearance
+        """
+        platform_sql, platform_params = self._platform_filter(platform_ids)
+        rows = self._query_appearances(
+            "c.crawl_date = ?" + platform_sql, (crawl_date,) + platform_params
+        )
+
+        all_titles: Dict = {}
+        id_to_name: Dict = {}
+        all_timestamps: Dict = {}
+        for _, _, file_name, recorded_at, platform_id, name, title, rank, url, mobile_url in rows:
+            id_to_name[platform_id] = name
+            all_timestamps[file_name] = recorded_at
+            titles = all_titles.setdefault(platform_id, {})
+            if title in titles:
+                titles[title]["ranks"].append(rank)
+            else:
+                titles[title] = {"ranks": [rank], "url": url, "mobileUrl": mobile_url}
+
+        return all_titles, id_to_name, all_timestamps
+
+    def search_titles(
+        self,
+        keyword: str,
+        start_date: str,
+        end_date: str,
+        platform_ids: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Find titles containing a keyword (case-insensitive) in a date range
+
+        Args:
+            keyword: Substring to look for
+            start_date: YYYY-MM-DD, inclusive
+            end_date: YYYY-MM-DD, inclusive
+            platform_ids: Platform filter, None for all
+
+        Returns:
+            One dict per (date, platform, title) with platform_name, ranks,
+            url and mobileUrl, ordered by date then first appearance
+        """
+        platform_sql, platform_params = self._platform_filter(platform_ids)
+        # Crawls of the range come from idx_crawls_date, their appearances from
+        # the primary key; only the titles they reference are matched
+        rows = self._query_appearances(
+            "c.crawl_date BETWEEN ? AND ? AND instr(t.title_lower, ?) > 0" + platform_sql,
+            (start_date, end_date, keyword.lower()) + platform_params,
+        )
+
+        results: Dict[Tuple[str, str, str], Dict] = {}
+        for crawl_date, _, _, _, platform_id, name, title, rank, url, mobile_url in rows:
+            key = (crawl_date, platform_id, title)
+            item = results.get(key)
+            if item is None:
+                results[key] = {
+                    "date": crawl_date,
+                    "platform": platform_id,
+                    "platform_name": name,
+                    "title": title,
+                    "ranks": [rank],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+            else:
+                item["ranks"].append(rank)
+        return list(results.values())
@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Transport
+
+Single pooled HTTP layer used by the crawlers, the English platforms adapter,
+the notification senders and the MCP crawl tool. Connections are kept alive
+and reused per host instead of paying a fresh TCP+TLS handshake per request.
+Crawl requests pass pace=True so each one waits for its host's rate limiter
+slot; other traffic (notifications) is not paced.
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def parse_retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """
+    Parse the Retry-After header of a response
+
+    Args:
+        response: Response, may be None
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if response is None:
+        return None
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = 1.0,
+    cap: float = 10.0,
+    retry_after: Optional[float] = None,
+) -> Optional[float]:
+    """
+    Exponential backoff with jitter that honours Retry-After
+
+    Args:
+        attempt: Retry attempt number, starting at 1
+        base: Delay of the first attempt in seconds
+        cap: Longest delay worth waiting for in seconds
+        retry_after: Server-requested delay in seconds, if any
+
+    Returns:
+        Seconds to wait before retrying, or None when the server asks to
+        wait longer than cap (the caller should give up instead of stalling)
+    """
+    if retry_after is not None:
+        return retry_after if retry_after <= cap else None
+
+    delay = min(cap, base * (2 ** (attempt - 1)))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class HostRateLimiter:
+    """Per-host request pacing shared by concurrent crawl workers"""
+
+    def __init__(self, interval_ms: int, host_intervals: Optional[Dict[str, int]] = None):
+        """
+        Initialize the limiter
+
+        Args:
+            interval_ms: Minimum gap between requests to the same host
+            host_intervals: Per-host overrides of interval_ms, {host: ms}
+        """
+        self.interval_ms = interval_ms
+        self.host_intervals = dict(host_intervals or {})
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str) -> None:
+        """Block until the next request slot for host is available"""
+        interval_ms = self.host_intervals.get(host, self.interval_ms)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            actual_interval = max(50, interval_ms + random.randint(-10, 20))
+            self._next_slot[host] = slot + actual_interval / 1000
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _StatsAdapter(HTTPAdapter):
+    """HTTPAdapter that keeps the counters of the connection pools it evicts
+
+    urllib3 drops a host's pool (and its request counters) once more than
+    pool_connections hosts are in use; the counters are added to
+    retired_stats first so get_stats still covers every request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # {host: [requests, connections]} of pools no longer in a manager
+        self.retired_stats: Dict[str, list] = {}
+        self._stats_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _track_evictions(self, manager):
+        dispose = manager.pools.dispose_func
+        if getattr(dispose, "_retires_stats", False):
+            return
+
+        def retire(pool):
+            with self._stats_lock:
+                host_stats = self.retired_stats.setdefault(pool.host, [0, 0])
+                host_stats[0] += pool.num_requests
+                host_stats[1] += pool.num_connections
+            if dispose is not None:
+                dispose(pool)
+
+        retire._retires_stats = True
+        manager.pools.dispose_func = retire
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self._track_evictions(self.poolmanager)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        self._track_evictions(manager)
+        return manager
+
+
+class HttpTransport:
+    """Keep-alive HTTP transport with per-host connection pools
+
+    requests.Session is not thread-safe, so each thread gets its own session;
+    all of them share one adapter and therefore one set of connection pools.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 20,
+        pool_maxsize: int = 10,
+        proxy_url: Optional[str] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+    ):
+        """
+        Initialize the transport
+
+        Args:
+            pool_connections: Number of hosts that keep a cached connection pool
+            pool_maxsize: Max keep-alive connections kept per host
+            proxy_url: Default proxy URL used when a request does not pass one
+            rate_limiter: Paces requests sent with pace=True; None sends them unpaced
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.proxy_url = proxy_url
+        self.rate_limiter = rate_limiter
+
+        self._adapter = _StatsAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self._local = threading.local()
+
+    def _get_session(self) -> requests.Session:
+        """Get the calling thread's session, mounted on the shared adapter"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+
+    @staticmethod
+    def build_proxies(proxy_url: Optional[str]) -> Optional[Dict[str, str]]:
+        """
+        Build a requests proxies dict from a proxy URL
+
+        Args:
+            proxy_url: Proxy URL, or None for a direct connection
+
+        Returns:
+            Proxies dict or None
+        """
+        if not proxy_url:
+            return None
+        return {"http": proxy_url, "https": proxy_url}
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        proxy_url: Optional[str] = None,
+        pace: bool = False,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request through the calling thread's pooled session
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            proxy_url: Proxy URL for this request, defaults to the transport proxy
+            pace: Wait for the host's rate limiter slot first (crawl requests)
+            **kwargs: Passed through to requests (headers, json, timeout, ...)
+
+        Returns:
+            requests.Response
+        """
+        if pace and self.rate_limiter is not None:
+            self.rate_limiter.wait(urlsplit(url).hostname or "")
+        if "proxies" not in kwargs:
+            kwargs["proxies"] = self.build_proxies(proxy_url or self.proxy_url)
+        return self._get_session().request(method, url, **kwargs)
+
+    def get(self, url: str, proxy_url: Optional[str] = None, **kwargs) -> requests.Response:
+        """Send a GET request"""
+        return self.request("GET", url, proxy_url=proxy_url, **kwargs)
+
+    def post(self, url: str, proxy_url: Optional[str] = None, **kwargs) -> requests.Response:
+        """Send a POST request"""
+        return self.request("POST", url, proxy_url=proxy_url, **kwargs)
+
+    def get_cached(
+        self,
+        cache: "HttpCache",
+        key: str,
+        url: str,
+        parse: Callable[[requests.Response], Any],
+        proxy_url: Optional[str] = None,
+        **kwargs,
+    ) -> Tuple[Any, bool]:
+        """
+        Send a conditional GET and reuse the cached payload if nothing changed
+
+        Args:
+            cache: HttpCache holding validators and payloads
+            key: Cache key identifying the source
+            url: Request URL
+            parse: Turns a changed response into the payload to cache
+            proxy_url: Proxy URL for this request
+            **kwargs: Passed through to requests
+
+        Returns:
+            (payload, unchanged) tuple; unchanged is True when the server
+            answered 304 or the body hash matched, in which case parse is skipped
+
+        Raises:
+            requests.HTTPError: Non-success status code
+        """
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.update(cache.conditional_headers(key))
+
+        response = self.get(url, proxy_url=proxy_url, headers=headers, **kwargs)
+        unchanged, body_hash = cache.check(key, response)
+        if unchanged:
+            return cache.get_payload(key), True
+
+        response.raise_for_status()
+        payload = parse(response)
+        cache.store(key, response, body_hash, payload)
+        return payload, False
+
+    def _iter_pools(self):
+        """Yield every live urllib3 connection pool, direct and proxied"""
+        managers = [self._adapter.poolmanager]
+        managers.extend(self._adapter.proxy_manager.values())
+        for manager in managers:
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is not None:
+                    yield pool
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get per-host connection reuse counters
+
+        Returns:
+            {host: {requests, connections, reused}} where connections is the
+            number of new connections opened and reused the requests served
+            by an already open connection
+        """
+        stats = {}
+        with self._adapter._stats_lock:
+            retired = [
+                (host, requests_count, connections)
+                for host, (requests_count, connections) in self._adapter.retired_stats.items()
+            ]
+        counters = retired + [
+            (pool.host, pool.num_requests, pool.num_connections)
+            for pool in self._iter_pools()
+        ]
+        for host, requests_count, connections in counters:
+            host_stats = stats.setdefault(
+                host, {"requests": 0, "connections": 0, "reused": 0}
+            )
+            host_stats["requests"] += requests_count
+            host_stats["connections"] += connections
+
+        for host_stats in stats.values():
+            host_stats["reused"] = max(
+                0, host_stats["requests"] - host_stats["connections"]
+            )
+        return stats
+
+    def print_stats(self) -> None:
+        """Print per-host connection reuse counters"""
+        stats = self.get_stats()
+        if not stats:
+            return
+        print("HTTP connection reuse:")
+        for host, host_stats in sorted(stats.items()):
+            print(
+                f"  {host}: {host_stats['requests']} requests, "
+                f"{host_stats['connections']} connections, "
+                f"{host_stats['reused']} reused"
+            )
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self._adapter.close()
+
+
+class HttpCache:
+    """On-disk cache of response validators, body hashes and parsed payloads"""
+
+    def __init__(self, cache_file: str = "output/.http_cache.json"):
+        """
+        Initialize the cache
+
+        Args:
+            cache_file: JSON file the cache is persisted to
+        """
+        self.cache_file = Path(cache_file)
+        self._entries = self._load()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict:
+        """Load cache entries from disk"""
+        if not self.cache_file.exists():
+            return {}
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Failed to load HTTP cache: {e}")
+            return {}
+
+    @staticmethod
+    def hash_body(content: bytes) -> str:
+        """Hash a response body"""
+        return hashlib.sha1(content).hexdigest()
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """
+        Build conditional request headers for a source
+
+        Args:
+            key: Cache key
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, empty without a cached payload
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if not entry or "payload" not in entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def check(self, key: str, response: requests.Response) -> Tuple[bool, Optional[str]]:
+        """
+        Check whether a response repeats the cached payload
+
+        Args:
+            key: Cache key
+            response: Response to check
+
+        Returns:
+            (unchanged, body_hash) tuple; body_hash is None for a 304
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        has_payload = bool(entry) and "payload" in entry
+
+        if response.status_code == 304:
+            return has_payload, None
+
+        body_hash = self.hash_body(response.content)
+        unchanged = (
+            has_payload
+            and response.ok
+            and entry.get("body_hash") == body_hash
+        )
+        return unchanged, body_hash
+
+    def get_payload(self, key: str) -> Any:
+        """Get the cached payload for a source"""
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry.get("payload") if entry else None
+
+    def store(
+        self,
+        key: str,
+        response: Optional[requests.Response],
+        body_hash: Optional[str],
+        payload: Any,
+    ) -> None:
+        """
+        Store validators and payload for a source
+
+        Args:
+            key: Cache key
+            response: Response the payload was parsed from (None for derived payloads)
+            body_hash: Hash of the response body
+            payload: JSON-serializable parsed payload
+        """
+        entry = {"body_hash": body_hash, "payload": payload}
+        if response is not None:
+            entry["etag"] = response.headers.get("ETag", "")
+            entry["last_modified"] = response.headers.get("Last-Modified", "")
+
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            tmp_file.replace(self.cache_file)
+        except Exception as e:
+            print(f"Failed to save HTTP cache: {e}")
+
+
+# Global transport instance
+_global_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """
+    Get the global transport instance
+
+    Returns:
+        Shared HttpTransport
+    """
+    global _global_transport
+    if _global_transport is None:
+        with _transport_lock:
+            if _global_transport is None:
+                _global_transport = HttpTransport()
+    return _global_transport
+
+
+def configure_transport(
+    pool_connections: int = 20,
+    pool_maxsize: int = 10,
+    proxy_url: Optional[str] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+) -> HttpTransport:
+    """
+    Replace the global transport with one using the given pool settings
+
+    Args:
+        pool_connections: Number of hosts that keep a cached connection pool
+        pool_maxsize: Max keep-alive connections kept per host
+        proxy_url: Default proxy URL
+        rate_limiter: Paces crawl requests (pace=True)
+
+    Returns:
+        The new global HttpTransport
+    """
+    global _global_transport
+    with _transport_lock:
+        if _global_transport is not None:
+            _global_transport.close()
+        _global_transport = HttpTransport(
+            pool_connections, pool_maxsize, proxy_url, rate_limiter
+        )
+    return _global_transport
@@ -1,16 +1,24 @@
 # coding=utf-8
 
+import argparse
+import hashlib
 import json
+import math
 import os
-import random
 import re
+import shutil
+import threading
 import time
 import webbrowser
 import smtplib
+import struct
+import sys
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
 from email.utils import formataddr, formatdate, make_msgid
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
@@ -19,6 +27,22 @@ import pytz
 import requests
 import yaml
 
+from frequency_rules import WordGroupMatcher, parse_frequency_rules
+from history_store import HistoryStore
+from http_transport import (
+    HostRateLimiter,
+    HttpCache,
+    backoff_delay,
+    configure_transport,
+    get_transport,
+    parse_retry_after,
+)
+from news_weight import news_weights
+from scheduler import DaemonScheduler, parse_schedule
+from search_index import update_day_index
+from title_clusters import TitleClusterIndex
+from title_snapshot import fresh_snapshot_for, read_snapshot, snapshot_path_for, write_snapshot
+
 
 VERSION = "3.0.5"
 
@@ -69,9 +93,59 @@ def load_config():
         "VERSION_CHECK_URL": config_data["app"]["version_check_url"],
         "SHOW_VERSION_UPDATE": config_data["app"]["show_version_update"],
         "REQUEST_INTERVAL": config_data["crawler"]["request_interval"],
+        "HOST_INTERVALS": config_data["crawler"].get("host_intervals") or {},
+        "CRAWLER_MAX_WORKERS": config_data["crawler"].get("max_workers", 8),
+        "HTTP_POOL_CONNECTIONS": config_data["crawler"].get("pool_connections", 20),
+        "HTTP_POOL_MAXSIZE": config_data["crawler"].get("pool_maxsize", 10),
+        "SOURCE_HEALTH": {
+            "MAX_RETRIES": config_data["crawler"]
+            .get("source_health", {})
+            .get("max_retries", 2),
+            "BACKOFF_BASE": config_data["crawler"]
+            .get("source_health", {})
+            .get("backoff_base", 1.0),
+            "BACKOFF_MAX": config_data["crawler"]
+            .get("source_health", {})
+            .get("backoff_max", 10.0),
+            "FAILURE_THRESHOLD": config_data["crawler"]
+            .get("source_health", {})
+            .get("failure_threshold", 3),
+            "COOLDOWN_MINUTES": config_data["crawler"]
+            .get("source_health", {})
+            .get("cooldown_minutes", 30),
+        },
+        "DAEMON_SCHEDULE": os.environ.get("CRON_SCHEDULE", "").strip()
+        or str(config_data.get("daemon", {}).get("schedule", "*/30 * * * *")),
+        "DAEMON_IMMEDIATE_RUN": os.environ.get("IMMEDIATE_RUN", "").strip().lower()
+        in ("true", "1")
+        if os.environ.get("IMMEDIATE_RUN", "").strip()
+        else config_data.get("daemon", {}).get("immediate_run", True),
+        "HISTORY_DB": {
+            "ENABLED": config_data.get("history", {}).get("enabled", False),
+            "PATH": config_data.get("history", {}).get("db_path", "output/history.db"),
+        },
+        "SEARCH_INDEX_ENABLED": config_data.get("history", {}).get("search_index", True),
+        "TITLE_CLUSTER_THRESHOLD": config_data["report"].get("cluster_threshold", 0.5)
+        if config_data["report"].get("cluster_similar_titles", False)
+        else None,
+        "DEDUPLICATION": {
+            "RETENTION_HOURS": config_data.get("deduplication", {}).get("retention_hours", 72),
+            "BLOOM_ENABLED": config_data.get("deduplication", {}).get("bloom_enabled", False),
+            "BLOOM_FALSE_POSITIVE_RATE": config_data.get("deduplication", {}).get(
+                "bloom_false_positive_rate", 0.001
+            ),
+            "BLOOM_CONFIRM_HITS": config_data.get("deduplication", {}).get(
+                "bloom_confirm_hits", False
+            ),
+            "BLOOM_SLICE_HOURS": config_data.get("deduplication", {}).get("bloom_slice_hours", 24),
+            "BLOOM_SLICE_CAPACITY": config_data.get("deduplication", {}).get(
+                "bloom_slice_capacity", 100000
+            ),
+        },
         "REPORT_MODE": os.environ.get("REPORT_MODE", "").strip()
         or config_data["report"]["mode"],
         "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
+        "LOG_TIMINGS": config_data["report"].get("log_timings", False),
         "USE_PROXY": config_data["crawler"]["use_proxy"],
         "DEFAULT_PROXY": config_data["crawler"]["default_proxy"],
         "ENABLE_CRAWLER": os.environ.get("ENABLE_CRAWLER", "").strip().lower()
@@ -272,18 +346,14 @@ def check_version_update(
 ) -> Tuple[bool, Optional[str]]:
     """Check for version updates"""
     try:
-        proxies = None
-        if proxy_url:
-            proxies = {"http": proxy_url, "https": proxy_url}
-
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "text/plain, */*",
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
-            version_url, proxies=proxies, headers=headers, timeout=10
+        response = get_transport().get(
+            version_url, proxy_url=proxy_url, headers=headers, timeout=10
         )
         response.raise_for_status()
 
@@ -440,83 +510,648 @@ class PushRecordManager:
         return result
 
 
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit keys, k positions by double hashing"""
+
+    MAGIC = b"TRBLOOM\x01"
+    _HEADER = struct.Struct("<QIId")
+
+    def __init__(
+        self,
+        capacity: int,
+        false_positive_rate: float,
+        bits: Optional[bytearray] = None,
+        hash_count: Optional[int] = None,
+        count: int = 0,
+    ):
+        """
+        Create an empty filter sized for capacity items at false_positive_rate
+
+        Args:
+            capacity: Expected number of items
+            false_positive_rate: Target false-positive rate at capacity
+            bits / hash_count / count: Restored state (from_bytes)
+        """
+        self.false_positive_rate = false_positive_rate
+        if bits is None:
+            capacity = max(1, capacity)
+            size = max(64, int(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+            bits = bytearray((size + 7) // 8)
+            hash_count = max(1, round(size / capacity * math.log(2)))
+        self.bits = bits
+        self.size = len(bits) * 8
+        self.hash_count = hash_count
+        self.count = count
+        self.dirty = False
+
+    def positions(self, key: int) -> List[int]:
+        """Bit positions of a key; filters of the same geometry share them"""
+        # splitmix64 finalizer gives the second, independent hash
+        h2 = (key ^ (key >> 31)) * 0xBF58476D1CE4E5B9 & 0xFFFFFFFFFFFFFFFF
+        h2 = ((h2 ^ (h2 >> 27)) * 0x94D049BB133111EB & 0xFFFFFFFFFFFFFFFF) | 1
+        size = self.size
+        return [(key + i * h2) % size for i in range(self.hash_count)]
+
+    def add(self, key: int) -> None:
+        """Add a key"""
+        bits = self.bits
+        added = False
+        for position in self.positions(key):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+            self.dirty = True
+
+    def __contains__(self, key: int) -> bool:
+        return self.contains_positions(self.positions(key))
+
+    def contains_positions(self, positions: List[int]) -> bool:
+        """Membership test with precomputed positions"""
+        bits = self.bits
+        for position in positions:
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def estimated_false_positive_rate(self) -> float:
+        """Current false-positive rate estimated from the number of items added"""
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+
+    def to_bytes(self) -> bytes:
+        return (
+            self.MAGIC
+            + self._HEADER.pack(self.size, self.hash_count, self.count, self.false_positive_rate)
+            + bytes(self.bits)
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        if not data.startswith(cls.MAGIC):
+            raise ValueError("not a bloom filter")
+        size, hash_count, count, rate = cls._HEADER.unpack_from(data, len(cls.MAGIC))
+        bits = bytearray(data[len(cls.MAGIC) + cls._HEADER.size:])
+        if len(bits) * 8 != size:
+            raise ValueError("truncated bloom filter")
+        return cls(0, rate, bits=bits, hash_count=hash_count, count=count)
+
+
 class DeduplicationManager:
-    """Manage deduplication state with rolling window"""
+    """Manage deduplication state with rolling window
+
+    Titles are stored as 64-bit hashes of (source_id, title), grouped into
+    hour buckets by the time they were last seen. Pruning drops whole
+    buckets, so retention is enforced with hour granularity. On disk the
+    state is a binary snapshot plus an append-only journal of
+    (hash, hour) records; a save appends only the entries that changed
+    bucket and rewrites the snapshot once the journal outgrows it.
+
+    With the Bloom pre-check enabled, every touched title is also added to
+    the Bloom filter of its time slice (one per bloom_slice_hours, kept for
+    the retention window, stored in .deduplication_bloom/). is_seen is
+    answered from the filters alone: a miss means never seen, a hit means
+    seen, wrong for at most bloom_false_positive_rate of genuinely new
+    titles. With bloom_confirm_hits, hits are instead confirmed in the exact
+    store, which is then loaded on first need.
+    """
+
+    SNAPSHOT_FILE = ".deduplication_state.bin"
+    JOURNAL_FILE = ".deduplication_state.log"
+    LEGACY_STATE_FILE = ".deduplication_state.json"
+    MAGIC = b"TRDEDUP\x01"
+    MIN_COMPACT_RECORDS = 50000
+    BLOOM_DIR = ".deduplication_bloom"
 
-    def __init__(self, retention_hours: int = 72):
+    _RECORD = struct.Struct("<QI")
+    _BUCKET = struct.Struct("<II")
+
+    def __init__(
+        self,
+        retention_hours: int = 72,
+        bloom_enabled: bool = False,
+        bloom_false_positive_rate: float = 0.001,
+        bloom_slice_hours: int = 24,
+        bloom_slice_capacity: int = 100000,
+        bloom_confirm_hits: bool = False,
+    ):
+        """
+        Initialize the manager
+
+        Args:
+            retention_hours: How long an unseen title is remembered
+            bloom_enabled: Answer unseen titles from time-sliced Bloom filters
+            bloom_false_positive_rate: Target rate across all live slices
+            bloom_slice_hours: Time span of one Bloom filter
+            bloom_slice_capacity: Expected titles per slice (filter size)
+            bloom_confirm_hits: Confirm Bloom hits in the exact store instead
+                of trusting them
+        """
         self.retention_hours = retention_hours
-        self.state_file = Path("output") / ".deduplication_state.json"
-        self.state = self._load_state()
+        self.state_dir = Path("output")
+        self.snapshot_file = self.state_dir / self.SNAPSHOT_FILE
+        self.journal_file = self.state_dir / self.JOURNAL_FILE
+        self.state_file = self.state_dir / self.LEGACY_STATE_FILE
+        # title hash -> hour bucket it was last seen in
+        self._hour_of: Dict[int, int] = {}
+        # hour bucket -> title hashes last seen in that hour
+        self._buckets: Dict[int, set] = {}
+        self._pending: Dict[int, int] = {}
+        self._journal_records = 0
+        # Pruned entries still present in the files on disk
+        self._stale_records = 0
+        self._snapshot_needed = False
+        self._pruned_on_load = 0
+        self._loaded = False
         self.current_session_new = set()
 
-    def _load_state(self) -> Dict:
-        """Load state from file"""
-        if not self.state_file.exists():
-            return {"history": {}}
+        self.bloom_enabled = bloom_enabled
+        self.bloom_dir = self.state_dir / self.BLOOM_DIR
+        self.bloom_slice_hours = max(1, int(bloom_slice_hours))
+        self.bloom_slice_capacity = bloom_slice_capacity
+        slice_count = -(-retention_hours // self.bloom_slice_hours) + 1
+        # The target holds for a lookup that probes every live slice
+        self.bloom_slice_rate = bloom_false_positive_rate / slice_count
+        self.bloom_false_positive_rate = bloom_false_positive_rate
+        self.bloom_confirm_hits = bloom_confirm_hits
+        self._bloom_slices: Dict[int, BloomFilter] = {}
+        self.bloom_stats = {"lookups": 0, "bloom_negative": 0, "false_positives": 0}
+
+        if bloom_enabled and self._load_bloom():
+            # Exact store stays on disk until a Bloom hit needs confirming
+            try:
+                self._journal_records = self.journal_file.stat().st_size // self._RECORD.size
+            except OSError:
+                self._journal_records = 0
+        else:
+            self._load_state()
+            if bloom_enabled:
+                self._rebuild_bloom()
+
+    @staticmethod
+    def title_hash(source_id: str, title: str) -> int:
+        """Fixed-width key of a (source_id, title) pair"""
+        digest = hashlib.blake2b(
+            f"{source_id}\x00{title}".encode("utf-8"), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "little")
+
+    @staticmethod
+    def _current_hour() -> int:
+        return int(get_utc_time().timestamp() // 3600)
+
+    def _place(self, key: int, hour: int) -> bool:
+        """Put a hash into an hour bucket, returns True if its bucket changed"""
+        previous = self._hour_of.get(key)
+        if previous is not None and previous >= hour:
+            return False
+        if previous is not None:
+            bucket = self._buckets.get(previous)
+            if bucket is not None:
+                bucket.discard(key)
+        self._hour_of[key] = hour
+        self._buckets.setdefault(hour, set()).add(key)
+        return True
 
+    def _load_state(self) -> None:
+        """Load snapshot and replay the journal, migrating the legacy JSON state"""
+        self._loaded = True
+        # Entries recorded before loading are applied on top of the files
+        unplaced, self._pending = self._pending, {}
+        self._hour_of, self._buckets = {}, {}
+        self._journal_records = 0
         try:
-            with open(self.state_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            if self.snapshot_file.exists():
+                data = self.snapshot_file.read_bytes()
+                if not data.startswith(self.MAGIC):
+                    raise ValueError("not a deduplication snapshot")
+                offset = len(self.MAGIC)
+                (bucket_count,) = struct.unpack_from("<I", data, offset)
+                offset += 4
+                buckets = [
+                    self._BUCKET.unpack_from(data, offset + i * self._BUCKET.size)
+                    for i in range(bucket_count)
+                ]
+                offset += bucket_count * self._BUCKET.size
+                for hour, count in buckets:
+                    keys = array("Q")
+                    keys.frombytes(data[offset:offset + 8 * count])
+                    if sys.byteorder == "big":
+                        keys.byteswap()
+                    offset += 8 * count
+                    for key in keys:
+                        self._place(key, hour)
+
+            if self.journal_file.exists():
+                data = self.journal_file.read_bytes()
+                # A torn final record from an interrupted append is ignored
+                usable = len(data) - len(data) % self._RECORD.size
+                for key, hour in self._RECORD.iter_unpack(data[:usable]):
+                    self._place(key, hour)
+                self._journal_records = usable // self._RECORD.size
         except Exception as e:
             print(f"Failed to load deduplication state: {e}")
-            return {"history": {}}
+            self._hour_of, self._buckets = {}, {}
+            self._snapshot_needed = True
+
+        if not self.snapshot_file.exists() and self.state_file.exists():
+            self._migrate_legacy_state()
+        self._pruned_on_load = self._prune()
+
+        for key, hour in unplaced.items():
+            if self._place(key, hour):
+                self._pending[key] = hour
+
+    # === Bloom pre-check ===
+
+    def _bloom_slice_of(self, hour: int) -> int:
+        return hour // self.bloom_slice_hours
+
+    def _live_slice_range(self) -> Tuple[int, int]:
+        current_hour = self._current_hour()
+        oldest_hour = current_hour - self.retention_hours
+        return self._bloom_slice_of(oldest_hour), self._bloom_slice_of(current_hour)
+
+    def _new_bloom_slice(self) -> BloomFilter:
+        return BloomFilter(self.bloom_slice_capacity, self.bloom_slice_rate)
+
+    def _load_bloom(self) -> bool:
+        """Load the live Bloom slices, False when they are missing or unreadable"""
+        if not self.bloom_dir.exists():
+            return False
+        oldest, _ = self._live_slice_range()
+        try:
+            for slice_file in self.bloom_dir.glob("*.bloom"):
+                slice_index = int(slice_file.stem)
+                if slice_index >= oldest:
+                    self._bloom_slices[slice_index] = BloomFilter.from_bytes(
+                        slice_file.read_bytes()
+                    )
+        except Exception as e:
+            print(f"Failed to load deduplication Bloom filters, rebuilding: {e}")
+            self._bloom_slices = {}
+            return False
+        return True
+
+    def _rebuild_bloom(self) -> None:
+        """Rebuild all Bloom slices from the exact store"""
+        self._bloom_slices = {}
+        for hour, keys in self._buckets.items():
+            slice_index = self._bloom_slice_of(hour)
+            bloom = self._bloom_slices.get(slice_index)
+            if bloom is None:
+                bloom = self._bloom_slices[slice_index] = self._new_bloom_slice()
+            for key in keys:
+                bloom.add(key)
+            bloom.dirty = True
+
+    def _bloom_contains(self, key: int) -> bool:
+        """Check all live slices, hashing once per filter geometry"""
+        positions_by_geometry: Dict[Tuple[int, int], List[int]] = {}
+        for bloom in self._bloom_slices.values():
+            geometry = (bloom.size, bloom.hash_count)
+            positions = positions_by_geometry.get(geometry)
+            if positions is None:
+                positions = positions_by_geometry[geometry] = bloom.positions(key)
+            if bloom.contains_positions(positions):
+                return True
+        return False
+
+    def _bloom_add(self, key: int, hour: int) -> None:
+        slice_index = self._bloom_slice_of(hour)
+        bloom = self._bloom_slices.get(slice_index)
+        if bloom is None:
+            bloom = self._bloom_slices[slice_index] = self._new_bloom_slice()
+        bloom.add(key)
+
+    def _save_bloom(self) -> None:
+        """Drop expired slices and write the changed ones"""
+        oldest, _ = self._live_slice_range()
+        self.bloom_dir.mkdir(parents=True, exist_ok=True)
+        for slice_index in [i for i in self._bloom_slices if i < oldest]:
+            del self._bloom_slices[slice_index]
+        for slice_file in self.bloom_dir.glob("*.bloom"):
+            if not slice_file.stem.isdigit() or int(slice_file.stem) < oldest:
+                slice_file.unlink()
+        for slice_index, bloom in self._bloom_slices.items():
+            if bloom.dirty:
+                slice_file = self.bloom_dir / f"{slice_index}.bloom"
+                tmp_file = slice_file.with_suffix(".tmp")
+                tmp_file.write_bytes(bloom.to_bytes())
+                tmp_file.replace(slice_file)
+                bloom.dirty = False
+
+    def bloom_report(self) -> str:
+        """One-line summary of the Bloom pre-check"""
+        stats = self.bloom_stats
+        lookups = stats["lookups"]
+        hits = lookups - stats["bloom_negative"]
+        estimated = 1 - math.prod(
+            1 - bloom.estimated_false_positive_rate() for bloom in self._bloom_slices.values()
+        )
+        if not self.bloom_confirm_hits:
+            return (
+                f"Bloom pre-check: {lookups} lookups answered without the exact store, "
+                f"{hits} hits trusted (estimated false-positive rate {estimated:.4%}, "
+                f"target {self.bloom_false_positive_rate:.4%}, {len(self._bloom_slices)} slices)"
+            )
+        observed = stats["false_positives"] / lookups if lookups else 0.0
+        return (
+            f"Bloom pre-check: {stats['bloom_negative']}/{lookups} lookups answered without the "
+            f"exact store, {hits} confirmed, {stats['false_positives']} false positives "
+            f"(observed {observed:.4%}, estimated {estimated:.4%}, "
+            f"target {self.bloom_false_positive_rate:.4%}, {len(self._bloom_slices)} slices)"
+        )
+
+    def _migrate_legacy_state(self) -> None:
+        """Import the old {source_id: {title: timestamp}} JSON state"""
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                history = json.load(f).get("history", {})
+            for source_id, titles in history.items():
+                for title, timestamp in titles.items():
+                    self._place(self.title_hash(source_id, title), int(timestamp // 3600))
+            self._snapshot_needed = True
+            print(f"Migrated {len(self._hour_of)} entries from {self.state_file}")
+        except Exception as e:
+            print(f"Failed to migrate legacy deduplication state: {e}")
 
     def is_seen(self, source_id: str, title: str) -> bool:
         """Check if title has been seen"""
-        # Check history
-        history = self.state.get("history", {})
-        if source_id in history:
-            if title in history[source_id]:
+        key = self.title_hash(source_id, title)
+        if self.bloom_enabled:
+            self.bloom_stats["lookups"] += 1
+            if not self._bloom_contains(key):
+                self.bloom_stats["bloom_negative"] += 1
+                return False
+            if not self.bloom_confirm_hits:
                 return True
-        return False
+            if not self._loaded:
+                self._load_state()
+            if key not in self._hour_of:
+                self.bloom_stats["false_positives"] += 1
+                return False
+            return True
+
+        return key in self._hour_of
 
     def add(self, source_id: str, title: str):
         """Add title to current session"""
         self.current_session_new.add((source_id, title))
-
-        # Update in-memory state immediately for this session
-        history = self.state.setdefault("history", {})
-        source_history = history.setdefault(source_id, {})
-        source_history[title] = get_utc_time().timestamp()
+        self.touch(source_id, title)
 
     def touch(self, source_id: str, title: str):
         """Update timestamp for existing title to extend its retention window"""
-        history = self.state.setdefault("history", {})
-        source_history = history.setdefault(source_id, {})
-        source_history[title] = get_utc_time().timestamp()
+        key = self.title_hash(source_id, title)
+        hour = self._current_hour()
+        if self.bloom_enabled:
+            self._bloom_add(key, hour)
+        if not self._loaded:
+            # Bucket moves are resolved when (if) the exact store is loaded
+            self._pending[key] = hour
+        elif self._place(key, hour):
+            self._pending[key] = hour
+
+    def _prune(self) -> int:
+        """Drop buckets entirely older than the retention window"""
+        cutoff_hour = (get_utc_time().timestamp() - self.retention_hours * 3600) // 3600
+        removed = 0
+        for hour in [h for h in self._buckets if h < cutoff_hour]:
+            for key in self._buckets.pop(hour):
+                del self._hour_of[key]
+                self._pending.pop(key, None)
+                removed += 1
+        self._stale_records += removed
+        return removed
+
+    def _write_snapshot(self) -> None:
+        """Write all buckets and truncate the journal"""
+        hours = sorted(h for h, keys in self._buckets.items() if keys)
+        tmp_file = self.snapshot_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<I", len(hours)))
+            for hour in hours:
+                f.write(self._BUCKET.pack(hour, len(self._buckets[hour])))
+            for hour in hours:
+                keys = array("Q", self._buckets[hour])
+                if sys.byteorder == "big":
+                    keys.byteswap()
+                f.write(keys.tobytes())
+        tmp_file.replace(self.snapshot_file)
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_records = 0
+        self._stale_records = 0
+        self._snapshot_needed = False
 
     def save(self):
-        """Save state to file and prune old entries"""
-        now = get_utc_time().timestamp()
-        retention_seconds = self.retention_hours * 3600
-        cutoff_time = now - retention_seconds
+        """Prune expired buckets, then append changes or compact"""
+        try:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            # Bloom first: a filter ahead of the exact store only costs a confirmation
+            if self.bloom_enabled:
+                self._save_bloom()
+            elif self.bloom_dir.exists():
+                # Filters not maintained while disabled would miss titles later
+                shutil.rmtree(self.bloom_dir)
+
+            journal_records = self._journal_records + len(self._pending)
+            if not self._loaded and journal_records > self.MIN_COMPACT_RECORDS:
+                self._load_state()
+                journal_records = self._journal_records + len(self._pending)
+
+            removed_entries = self._prune() + self._pruned_on_load
+            self._pruned_on_load = 0
+            total_entries = len(self._hour_of)
+
+            if self._loaded and (
+                self._snapshot_needed
+                or journal_records + self._stale_records
+                > max(total_entries, self.MIN_COMPACT_RECORDS)
+            ):
+                self._write_snapshot()
+                action = "compacted"
+            elif self._pending:
+                with open(self.journal_file, "ab") as f:
+                    f.write(
+                        b"".join(
+                            self._RECORD.pack(key, hour) for key, hour in self._pending.items()
+                        )
+                    )
+                self._journal_records = journal_records
+                action = f"appended {len(self._pending)}"
+            else:
+                action = "unchanged"
+            self._pending = {}
+
+            if self.state_file.exists() and self.snapshot_file.exists():
+                self.state_file.unlink()
+            entries = f"Total entries: {total_entries}" if self._loaded else "exact store not loaded"
+            print(f"Deduplication state saved ({action}). {entries}, Pruned: {removed_entries}")
+            if self.bloom_enabled:
+                print(self.bloom_report())
+        except Exception as e:
+            print(f"Failed to save deduplication state: {e}")
 
-        history = self.state.get("history", {})
-        new_history = {}
-        
-        total_entries = 0
-        removed_entries = 0
-
-        for source_id, titles in history.items():
-            new_titles = {}
-            for title, timestamp in titles.items():
-                if timestamp > cutoff_time:
-                    new_titles[title] = timestamp
-                    total_entries += 1
-                else:
-                    removed_entries += 1
-            
-            if new_titles:
-                new_history[source_id] = new_titles
 
-        self.state["history"] = new_history
-        
+class SourceHealthTracker:
+    """Per-source retry policy, circuit breaker and latency/error statistics"""
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        backoff_base: float = 1.0,
+        backoff_max: float = 10.0,
+        failure_threshold: int = 3,
+        cooldown_minutes: int = 30,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_minutes * 60
+        self.state_file = Path("output") / ".source_health.json"
+        self.sources = self._load_state()
+        self._lock = threading.Lock()
+
+    def _load_state(self) -> Dict:
+        """Load state from file"""
+        if not self.state_file.exists():
+            return {}
+
         try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Failed to load source health state: {e}")
+            return {}
+
+    def _get_source(self, source_id: str) -> Dict:
+        """Get (or create) the state of a source, caller holds the lock"""
+        return self.sources.setdefault(
+            source_id,
+            {
+                "successes": 0,
+                "failures": 0,
+                "errors": 0,
+                "skipped": 0,
+                "consecutive_failures": 0,
+                "total_latency_ms": 0.0,
+                "last_latency_ms": 0.0,
+                "last_error": "",
+                "open_until": 0.0,
+            },
+        )
+
+    def is_open(self, source_id: str) -> bool:
+        """Check if the circuit of a source is open (source should be skipped)"""
+        with self._lock:
+            source = self.sources.get(source_id)
+            if not source or source.get("open_until", 0) <= time.time():
+                return False
+            source["skipped"] = source.get("skipped", 0) + 1
+            return True
+
+    def retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Delay before retry attempt, None means give up now"""
+        return backoff_delay(attempt, self.backoff_base, self.backoff_max, retry_after)
+
+    def record_error(
+        self, source_id: str, error: Union[Exception, str], retry_after: Optional[float] = None
+    ) -> None:
+        """Record a failed request attempt and the Retry-After the server sent with it"""
+        with self._lock:
+            source = self._get_source(source_id)
+            source["errors"] += 1
+            source["last_error"] = str(error)[:200]
+            source["retry_after"] = retry_after
+
+    def record_success(self, source_id: str, latency: float) -> None:
+        """Record a successful crawl of a source and close its circuit"""
+        with self._lock:
+            source = self._get_source(source_id)
+            source["successes"] += 1
+            source["consecutive_failures"] = 0
+            source["open_until"] = 0.0
+            source["retry_after"] = None
+            source["total_latency_ms"] += latency * 1000
+            source["last_latency_ms"] = latency * 1000
+
+    def record_failure(self, source_id: str, latency: float) -> None:
+        """Record a failed crawl of a source, opening its circuit when needed"""
+        with self._lock:
+            source = self._get_source(source_id)
+            retry_after = source.pop("retry_after", None)
+            source["failures"] += 1
+            source["consecutive_failures"] += 1
+            source["total_latency_ms"] += latency * 1000
+            source["last_latency_ms"] = latency * 1000
+
+            cooldown = 0.0
+            if source["consecutive_failures"] >= self.failure_threshold:
+                cooldown = self.cooldown_seconds
+            if retry_after is not None:
+                cooldown = max(cooldown, retry_after)
+            if cooldown:
+                source["open_until"] = time.time() + cooldown
+                print(
+                    f"Circuit opened for {source_id}: skipped for {cooldown / 60:.1f} min "
+                    f"({source['consecutive_failures']} consecutive failures)"
+                )
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Get per-source latency and error statistics"""
+        now = time.time()
+        stats = {}
+        with self._lock:
+            for source_id, source in self.sources.items():
+                attempts = source["successes"] + source["failures"]
+                stats[source_id] = {
+                    "successes": source["successes"],
+                    "failures": source["failures"],
+                    "errors": source["errors"],
+                    "skipped": source.get("skipped", 0),
+                    "consecutive_failures": source["consecutive_failures"],
+                    "avg_latency_ms": round(source["total_latency_ms"] / attempts, 1)
+                    if attempts
+                    else 0.0,
+                    "last_latency_ms": round(source["last_latency_ms"], 1),
+                    "last_error": source["last_error"],
+                    "circuit_open": source["open_until"] > now,
+                }
+        return stats
+
+    def save(self):
+        """Save state to file"""
+        with self._lock:
+            state = json.loads(json.dumps(self.sources))
+
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(self.state, f, ensure_ascii=False)
-            print(f"Deduplication state saved. Total entries: {total_entries}, Pruned: {removed_entries}")
+                json.dump(state, f, ensure_ascii=False)
         except Exception as e:
-            print(f"Failed to save deduplication state: {e}")
+            print(f"Failed to save source health state: {e}")
+
+    def print_stats(self) -> None:
+        """Print per-source latency and error statistics for sources with trouble"""
+        troubled = {
+            source_id: stats
+            for source_id, stats in self.get_stats().items()
+            if stats["errors"] or stats["circuit_open"]
+        }
+        if not troubled:
+            return
+        print("Source health:")
+        for source_id, stats in sorted(troubled.items()):
+            state = "open" if stats["circuit_open"] else "closed"
+            print(
+                f"  {source_id}: {stats['successes']} ok / {stats['failures']} failed, "
+                f"{stats['errors']} errors, avg {stats['avg_latency_ms']}ms, "
+                f"circuit {state}, last error: {stats['last_error']}"
+            )
+
 
 class DataFetcher:
     """Data fetcher with multi-platform support"""
@@ -525,25 +1160,71 @@ class DataFetcher:
         self.proxy_url = proxy_url
         self.newsapi_key = newsapi_key
 
+        # Conditional request cache shared with the English adapter
+        self.http_cache = HttpCache(str(Path("output") / ".http_cache.json"))
+
+        # Per-source retry policy and circuit breaker, persisted between runs
+        health_config = CONFIG["SOURCE_HEALTH"]
+        self.health = SourceHealthTracker(
+            max_retries=health_config["MAX_RETRIES"],
+            backoff_base=health_config["BACKOFF_BASE"],
+            backoff_max=health_config["BACKOFF_MAX"],
+            failure_threshold=health_config["FAILURE_THRESHOLD"],
+            cooldown_minutes=health_config["COOLDOWN_MINUTES"],
+        )
+
         # Initialize English platforms adapter
         try:
             from english_platforms_adapter import EnglishPlatformsAdapter
             self.english_adapter = EnglishPlatformsAdapter(
                 newsapi_key=newsapi_key,
-                proxy_url=proxy_url
+                proxy_url=proxy_url,
+                http_cache=self.http_cache,
             )
         except ImportError:
             print("Warning: English platforms adapter not found. English sources disabled.")
             self.english_adapter = None
 
+    def _parse_newsnow_response(self, response: requests.Response) -> Dict:
+        """Validate a NewsNow response and build its title data"""
+        data_json = json.loads(response.text)
+
+        status = data_json.get("status", "unknown")
+        if status not in ["success", "cache"]:
+            raise ValueError(f"Abnormal response status: {status}")
+
+        title_data = {}
+        for index, item in enumerate(data_json.get("items", []), 1):
+            title = item["title"]
+            url = item.get("url", "")
+            mobile_url = item.get("mobileUrl", "")
+
+            if title in title_data:
+                title_data[title]["ranks"].append(index)
+            else:
+                title_data[title] = {
+                    "ranks": [index],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+        return title_data
+
     def fetch_data(
         self,
         id_info: Union[str, Tuple[str, str]],
-        max_retries: int = 2,
-        min_retry_wait: int = 3,
-        max_retry_wait: int = 5,
-    ) -> Tuple[Optional[str], str, str]:
-        """Fetch data for specified ID with retry support"""
+        max_retries: Optional[int] = None,
+    ) -> Tuple[Optional[Dict], str, str]:
+        """Fetch title data for specified ID with retry support
+
+        Uses conditional requests against the HTTP cache; when the payload is
+        unchanged since the last crawl the cached title data is returned
+        without parsing the response again. Retries back off exponentially
+        with jitter and honour Retry-After; a Retry-After longer than the
+        backoff cap gives up immediately instead of stalling the crawl.
+        """
+        if max_retries is None:
+            max_retries = self.health.max_retries
+
         if isinstance(id_info, tuple):
             id_value, alias = id_info
         else:
@@ -552,10 +1233,6 @@ class DataFetcher:
 
         url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
 
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
-
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept": "application/json, text/plain, */*",
@@ -567,28 +1244,29 @@ class DataFetcher:
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url, proxies=proxies, headers=headers, timeout=10
+                title_data, unchanged = get_transport().get_cached(
+                    self.http_cache,
+                    f"newsnow:{id_value}",
+                    url,
+                    self._parse_newsnow_response,
+                    proxy_url=self.proxy_url,
+                    headers=headers,
+                    timeout=10,
+                    pace=True,
                 )
-                response.raise_for_status()
-
-                data_text = response.text
-                data_json = json.loads(data_text)
 
-                status = data_json.get("status", "unknown")
-                if status not in ["success", "cache"]:
-                    raise ValueError(f"Abnormal response status: {status}")
-
-                status_info = "latest data" if status == "success" else "cached data"
+                status_info = "unchanged, reusing cached data" if unchanged else "latest data"
                 print(f"Fetched {id_value} successfully ({status_info})")
-                return data_text, id_value, alias
+                return title_data, id_value, alias
 
             except Exception as e:
+                retry_after = parse_retry_after(getattr(e, "response", None))
+                self.health.record_error(id_value, e, retry_after)
                 retries += 1
+                wait_time = None
                 if retries <= max_retries:
-                    base_wait = random.uniform(min_retry_wait, max_retry_wait)
-                    additional_wait = (retries - 1) * random.uniform(1, 2)
-                    wait_time = base_wait + additional_wait
+                    wait_time = self.health.retry_delay(retries, retry_after)
+                if wait_time is not None:
                     print(f"Request for {id_value} failed: {e}. Retrying in {wait_time:.2f}s...")
                     time.sleep(wait_time)
                 else:
@@ -596,88 +1274,122 @@ class DataFetcher:
                     return None, id_value, alias
         return None, id_value, alias
 
+    def _crawl_platform(self, platform: Dict) -> Tuple[Optional[Dict], bool]:
+        """Crawl a single platform, returns (title_data, failed)"""
+        platform_id = platform['id']
+        platform_name = platform['name']
+        api_type = platform.get('api', 'newsnow')  # Default to original API
+
+        title_data = None
+        failed = False
+
+        # Route to appropriate fetcher based on API type
+        if api_type in ['reddit', 'hackernews', 'newsapi'] and self.english_adapter:
+            # Use English platforms adapter
+            try:
+                data = self.english_adapter.fetch(platform)
+                titles_key = f"titles:{platform_id}"
+                cached_titles = None
+                if data and data.get('unchanged'):
+                    cached_titles = self.http_cache.get_payload(titles_key)
+
+                if cached_titles is not None:
+                    # Source unchanged since last crawl, skip rebuilding title data
+                    title_data = cached_titles
+                    print(f"✓ Fetched {platform_id} successfully (unchanged, {len(title_data)} titles)")
+                elif data and data.get('items'):
+                    title_data = {}
+                    for item in data['items']:
+                        title = item['title']
+                        url = item.get('url', '')
+                        mobile_url = item.get('mobileUrl', url)
+                        rank = item.get('rank', 0)
+
+                        if title in title_data:
+                            title_data[title]["ranks"].append(rank)
+                        else:
+                            title_data[title] = {
+                                "ranks": [rank],
+                                "url": url,
+                                "mobileUrl": mobile_url
+                            }
+                    if 'unchanged' in data:
+                        self.http_cache.store(titles_key, None, None, title_data)
+                    print(f"✓ Fetched {platform_id} successfully ({len(data['items'])} items)")
+                else:
+                    error_msg = data.get('error', 'No data returned')
+                    print(f"✗ {platform_id} failed: {error_msg}")
+                    self.health.record_error(platform_id, error_msg, data.get('retry_after'))
+                    failed = True
+            except Exception as e:
+                print(f"✗ {platform_id} failed: {e}")
+                self.health.record_error(platform_id, e)
+                failed = True
+
+        else:
+            # Use original NewNow API for Chinese platforms
+            title_data, _, _ = self.fetch_data((platform_id, platform_name))
+            if title_data is None:
+                failed = True
+
+        return title_data, failed
+
     def crawl_websites(
         self,
         platforms_config: List[Dict],
-        request_interval: int = CONFIG["REQUEST_INTERVAL"],
+        max_workers: int = CONFIG["CRAWLER_MAX_WORKERS"],
     ) -> Tuple[Dict, Dict, List]:
-        """Crawl data from multiple platforms (supports both Chinese and English sources)"""
+        """Crawl data from multiple platforms (supports both Chinese and English sources)
+
+        Platforms are fetched by a bounded worker pool. Every crawl request
+        (including retries and per-item fetches) is paced per host by the
+        rate limiter the transport was configured with (crawler.request_interval
+        and crawler.host_intervals), so different hosts overlap while each
+        host still sees paced requests. Output order follows platforms_config.
+        """
         results = {}
         id_to_name = {}
         failed_ids = []
 
-        for i, platform in enumerate(platforms_config):
-            platform_id = platform['id']
-            platform_name = platform['name']
-            api_type = platform.get('api', 'newsnow')  # Default to original API
-
-            id_to_name[platform_id] = platform_name
-
-            # Route to appropriate fetcher based on API type
-            if api_type in ['reddit', 'hackernews', 'newsapi'] and self.english_adapter:
-                # Use English platforms adapter
-                try:
-                    data = self.english_adapter.fetch(platform)
-                    if data and data.get('items'):
-                        results[platform_id] = {}
-                        for item in data['items']:
-                            title = item['title']
-                            url = item.get('url', '')
-                            mobile_url = item.get('mobileUrl', url)
-                            rank = item.get('rank', 0)
-
-                            if title in results[platform_id]:
-                                results[platform_id][title]["ranks"].append(rank)
-                            else:
-                                results[platform_id][title] = {
-                                    "ranks": [rank],
-                                    "url": url,
-                                    "mobileUrl": mobile_url
-                                }
-                        print(f"✓ Fetched {platform_id} successfully ({len(data['items'])} items)")
-                    else:
-                        error_msg = data.get('error', 'No data returned')
-                        print(f"✗ {platform_id} failed: {error_msg}")
-                        failed_ids.append(platform_id)
-                except Exception as e:
-                    print(f"✗ {platform_id} failed: {e}")
-                    failed_ids.append(platform_id)
+        for platform in platforms_config:
+            id_to_name[platform['id']] = platform['name']
 
+        def crawl_one(platform: Dict) -> Tuple[Optional[Dict], bool]:
+            platform_id = platform['id']
+            if self.health.is_open(platform_id):
+                # Chronically failing source in cool-down, report it as failed
+                print(f"✗ {platform_id} skipped: circuit open")
+                return None, True
+
+            start = time.perf_counter()
+            title_data, failed = self._crawl_platform(platform)
+            latency = time.perf_counter() - start
+            if failed:
+                self.health.record_failure(platform_id, latency)
             else:
-                # Use original NewNow API for Chinese platforms
-                response, _, _ = self.fetch_data((platform_id, platform_name))
+                self.health.record_success(platform_id, latency)
+            return title_data, failed
+
+        workers = max(1, min(max_workers, len(platforms_config)))
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="crawler"
+            ) as executor:
+                outcomes = list(executor.map(crawl_one, platforms_config))
+        else:
+            outcomes = [crawl_one(platform) for platform in platforms_config]
 
-                if response:
-                    try:
-                        data = json.loads(response)
-                        results[platform_id] = {}
-                        for index, item in enumerate(data.get("items", []), 1):
-                            title = item["title"]
-                            url = item.get("url", "")
-                            mobile_url = item.get("mobileUrl", "")
-
-                            if title in results[platform_id]:
-                                results[platform_id][title]["ranks"].append(index)
-                            else:
-                                results[platform_id][title] = {
-                                    "ranks": [index],
-                                    "url": url,
-                                    "mobileUrl": mobile_url,
-                                }
-                    except json.JSONDecodeError:
-                        print(f"Failed to parse {platform_id} response")
-                        failed_ids.append(platform_id)
-                    except Exception as e:
-                        print(f"Error processing {platform_id} data: {e}")
-                        failed_ids.append(platform_id)
-                else:
-                    failed_ids.append(platform_id)
+        # Assemble in configuration order so output matches a sequential crawl
+        for platform, (title_data, failed) in zip(platforms_config, outcomes):
+            platform_id = platform['id']
+            if title_data is not None:
+                results[platform_id] = title_data
+            if failed:
+                failed_ids.append(platform_id)
 
-            # Rate limiting between requests
-            if i < len(platforms_config) - 1:
-                actual_interval = request_interval + random.randint(-10, 20)
-                actual_interval = max(50, actual_interval)
-                time.sleep(actual_interval / 1000)
+        self.http_cache.save()
+        self.health.save()
+        self.health.print_stats()
 
         print(f"Success: {list(results.keys())}, Failed: {failed_ids}")
         return results, id_to_name, failed_ids
@@ -685,8 +1397,13 @@ class DataFetcher:
 
 # === Data Processing ===
 def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
-    """Save titles to file"""
+    """Save titles to file
+
+    Writes the human-readable txt file and, in the same pass, its binary
+    snapshot (see title_snapshot) which readers load without re-parsing.
+    """
     file_path = get_output_path("txt", f"{format_time_filename()}.txt")
+    snapshot_sources = []
 
     with open(file_path, "w", encoding="utf-8") as f:
         for id_value, title_data in results.items():
@@ -714,6 +1431,7 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
                 sorted_titles.append((rank, cleaned_title, url, mobile_url))
 
             sorted_titles.sort(key=lambda x: x[0])
+            snapshot_sources.append((id_value, name or id_value, sorted_titles))
 
             for rank, cleaned_title, url, mobile_url in sorted_titles:
                 line = f"{rank}. {cleaned_title}"
@@ -731,13 +1449,76 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
             for id_value in failed_ids:
                 f.write(f"{id_value}\n")
 
+    # Written after the txt file so a fresh snapshot is never older than it
+    try:
+        write_snapshot(snapshot_path_for(Path(file_path)), snapshot_sources, failed_ids)
+    except Exception as e:
+        print(f"Failed to write title snapshot: {e}")
+
     return file_path
 
 
+def record_crawl_history(history_store: HistoryStore, file_path: Path) -> None:
+    """Record a saved txt crawl file into the history database"""
+    try:
+        titles_by_id, id_to_name = parse_file_titles(file_path)
+        history_store.record_crawl(
+            normalize_date_folder(file_path.parent.parent.name),
+            file_path.stem,
+            titles_by_id,
+            id_to_name,
+            file_path.name,
+            recorded_at=file_path.stat().st_mtime,
+        )
+    except Exception as e:
+        print(f"Failed to record crawl history for {file_path}: {e}")
+
+
+def normalize_date_folder(folder_name: str) -> str:
+    """Convert a date folder name (YYYY-MM-DD or legacy YYYY年MM月DD日) to YYYY-MM-DD"""
+    match = re.match(r"^(\d{4})年(\d{2})月(\d{2})日$", folder_name)
+    if match:
+        return "-".join(match.groups())
+    return folder_name
+
+
+def backfill_history(db_path: str = CONFIG["HISTORY_DB"]["PATH"]) -> None:
+    """One-shot import of every existing output/<date>/txt file into the history database"""
+    output_dir = Path("output")
+    if not output_dir.exists():
+        print("No output directory, nothing to backfill")
+        return
+
+    history_store = HistoryStore(db_path)
+    imported = 0
+    try:
+        for date_dir in sorted(p for p in output_dir.iterdir() if p.is_dir()):
+            txt_dir = date_dir / "txt"
+            if not txt_dir.exists():
+                continue
+
+            crawl_date = normalize_date_folder(date_dir.name)
+            recorded = set(history_store.get_crawl_times(crawl_date))
+            for file_path in sorted(txt_dir.glob("*.txt")):
+                if file_path.stem in recorded:
+                    # Earlier backfills stored the import time; use the file's
+                    history_store.set_recorded_at(
+                        crawl_date, file_path.stem, file_path.stat().st_mtime
+                    )
+                    continue
+                record_crawl_history(history_store, file_path)
+                imported += 1
+            print(f"{crawl_date}: {history_store.crawl_count(crawl_date)} crawls")
+    finally:
+        history_store.close()
+
+    print(f"Backfill complete, imported {imported} crawl files into {db_path}")
+
+
 def load_frequency_words(
     frequency_file: Optional[str] = None,
 ) -> Tuple[List[Dict], List[str]]:
-    """Load frequency words configuration"""
+    """Load frequency words configuration (syntax documented in frequency_rules.py)"""
     if frequency_file is None:
         frequency_file = os.environ.get(
             "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
@@ -750,46 +1531,27 @@ def load_frequency_words(
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
-    word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
-
-    processed_groups = []
-    filter_words = []
-
-    for group in word_groups:
-        words = [word.strip() for word in group.split("\n") if word.strip()]
-
-        group_required_words = []
-        group_normal_words = []
-        group_filter_words = []
-
-        for word in words:
-            if word.startswith("!"):
-                filter_words.append(word[1:])
-                group_filter_words.append(word[1:])
-            elif word.startswith("+"):
-                group_required_words.append(word[1:])
-            else:
-                group_normal_words.append(word)
-
-        if group_required_words or group_normal_words:
-            if group_normal_words:
-                group_key = " ".join(group_normal_words)
-            else:
-                group_key = " ".join(group_required_words)
-
-            processed_groups.append(
-                {
-                    "required": group_required_words,
-                    "normal": group_normal_words,
-                    "group_key": group_key,
-                }
-            )
+    processed_groups, filter_words = parse_frequency_rules(content)
 
+    # Compile once; later calls with the same rules reuse the matcher
+    get_word_group_matcher(processed_groups, filter_words)
     return processed_groups, filter_words
 
 
 def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
-    """Parse title data from a single txt file, returns (titles_by_id, id_to_name)"""
+    """Parse title data from a single txt file, returns (titles_by_id, id_to_name)
+
+    Loads the binary snapshot written alongside the txt file when it is
+    present and up to date, and only parses the txt text otherwise.
+    """
+    snap_path = fresh_snapshot_for(file_path)
+    if snap_path is not None:
+        try:
+            titles_by_id, id_to_name, _ = read_snapshot(snap_path)
+            return titles_by_id, id_to_name
+        except Exception as e:
+            print(f"Failed to read title snapshot {snap_path}, parsing txt: {e}")
+
     titles_by_id = {}
     id_to_name = {}
 
@@ -858,48 +1620,278 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
     return titles_by_id, id_to_name
 
 
-def read_all_today_titles(
-    current_platform_ids: Optional[List[str]] = None,
-) -> Tuple[Dict, Dict, Dict]:
-    """Read all titles from today's files, with optional filtering by current monitored platforms"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
+def parse_file_titles_cached(
+    file_path: Path, file_cache: Optional[Dict] = None
+) -> Tuple[Dict, Dict]:
+    """Parse a txt file, reusing a previous parse while the file is unchanged
 
-    if not txt_dir.exists():
-        return {}, {}, {}
+    file_cache maps path -> (mtime_ns, size, titles_by_id, id_to_name) and is
+    held by long-running processes (daemon mode) so each tick only parses new
+    files. Returned dicts are shallow copies, callers may merge into them.
+    """
+    if file_cache is None:
+        return parse_file_titles(file_path)
+
+    stat = file_path.stat()
+    key = str(file_path)
+    cached = file_cache.get(key)
+    if cached is None or cached[0] != stat.st_mtime_ns or cached[1] != stat.st_size:
+        titles_by_id, id_to_name = parse_file_titles(file_path)
+        cached = (stat.st_mtime_ns, stat.st_size, titles_by_id, id_to_name)
+        file_cache[key] = cached
+
+    _, _, titles_by_id, id_to_name = cached
+    return (
+        {source_id: dict(titles) for source_id, titles in titles_by_id.items()},
+        dict(id_to_name),
+    )
 
-    all_results = {}
-    final_id_to_name = {}
-    title_info = {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+def list_txt_names(txt_dir: Path) -> List[str]:
+    """Sorted names of the txt files in a directory
 
-    for file_path in files:
-        time_info = file_path.stem
+    Runs every crawl over all of the day's files, so it stays on strings
+    instead of building and comparing Path objects.
+    """
+    with os.scandir(txt_dir) as entries:
+        return sorted(entry.name for entry in entries if entry.name.endswith(".txt"))
 
-        titles_by_id, file_id_to_name = parse_file_titles(file_path)
 
-        if current_platform_ids is not None:
-            filtered_titles_by_id = {}
-            filtered_id_to_name = {}
+class DayAggregate:
+    """Persisted, append-only fold of a day's txt files
 
-            for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
-                    filtered_titles_by_id[source_id] = title_data
-                    if source_id in file_id_to_name:
-                        filtered_id_to_name[source_id] = file_id_to_name[source_id]
+    Holds the same all_results / id_to_name / title_info that folding every
+    txt file through process_source_data produces. Each crawl only folds the
+    newest file and appends it to a journal; the snapshot is rewritten once
+    the journal outgrows it (and MIN_COMPACT_BYTES), so rewrites cost no more
+    than the journal bytes appended since the last one. A full rebuild
+    happens only when a folded file changed, disappeared, or a new file sorts
+    before the last folded one.
+    """
 
-            titles_by_id = filtered_titles_by_id
-            file_id_to_name = filtered_id_to_name
+    SNAPSHOT_FILE = ".day_aggregate.json"
+    JOURNAL_FILE = ".day_aggregate.log"
+    MIN_COMPACT_BYTES = 1024 * 1024
+
+    def __init__(self, date_dir: Path):
+        self.date_dir = Path(date_dir)
+        self.snapshot_file = self.date_dir / self.SNAPSHOT_FILE
+        self.journal_file = self.date_dir / self.JOURNAL_FILE
+        self._reset()
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
+        self._pending: List[str] = []
+        self._snapshot_needed = False
+        self._load()
+
+    def _reset(self) -> None:
+        # files: name -> [mtime_ns, size, sha1] of every folded file
+        self.files: Dict[str, List] = {}
+        self.all_results: Dict = {}
+        self.id_to_name: Dict = {}
+        self.title_info: Dict = {}
+        self._last_folded = ""
+
+    def _load(self) -> None:
+        """Load snapshot and replay the journal, starting empty when corrupt"""
+        try:
+            if self.snapshot_file.exists():
+                with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+                self.files = state["files"]
+                self.all_results = state["all_results"]
+                self.id_to_name = state["id_to_name"]
+                self.title_info = state["title_info"]
+                self._snapshot_bytes = self.snapshot_file.stat().st_size
+                self._last_folded = max(self.files, default="")
+
+            if self.journal_file.exists():
+                self._journal_bytes = self.journal_file.stat().st_size
+                with open(self.journal_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        entry = json.loads(line)
+                        if entry["name"] not in self.files:
+                            self._apply(entry)
+        except Exception as e:
+            print(f"Failed to load day aggregate, rebuilding: {e}")
+            self._reset()
+            self._snapshot_needed = True
+
+    @staticmethod
+    def _file_signature(file_path: Path) -> List:
+        stat = file_path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    @staticmethod
+    def _file_hash(file_path: Path) -> str:
+        return hashlib.sha1(file_path.read_bytes()).hexdigest()
+
+    def _is_unchanged(self, file_path: str, name: str) -> bool:
+        """Check a folded file against its recorded signature, hashing only on mismatch"""
+        recorded = self.files.get(name)
+        if not recorded:
+            return False
 
-        final_id_to_name.update(file_id_to_name)
+        # Runs for every folded file each crawl, so plain strings and os.stat, no Path objects
+        stat = os.stat(file_path)
+        if stat.st_mtime_ns == recorded[0] and stat.st_size == recorded[1]:
+            return True
+        # Rewritten with identical content (e.g. same-minute save) is still unchanged
+        if stat.st_size == recorded[1] and self._file_hash(Path(file_path)) == recorded[2]:
+            recorded[:2] = [stat.st_mtime_ns, stat.st_size]
+            self._snapshot_needed = True
+            return True
+        return False
 
-        for source_id, title_data in titles_by_id.items():
+    def _apply(self, entry: Dict) -> None:
+        """Fold one parsed file (journal entry) into the aggregate"""
+        self.id_to_name.update(entry["names"])
+        for source_id, title_data in entry["titles"].items():
             process_source_data(
-                source_id, title_data, time_info, all_results, title_info
+                source_id, title_data, entry["time"], self.all_results, self.title_info
             )
+        self.files[entry["name"]] = entry["signature"]
+        self._last_folded = max(self._last_folded, entry["name"])
+
+    def _fold(self, file_path: Path, file_cache: Optional[Dict] = None) -> None:
+        """Parse one txt file and fold it into the aggregate"""
+        titles_by_id, file_id_to_name = parse_file_titles_cached(file_path, file_cache)
+        entry = {
+            "name": file_path.name,
+            "time": file_path.stem,
+            "signature": self._file_signature(file_path) + [self._file_hash(file_path)],
+            "names": file_id_to_name,
+            "titles": titles_by_id,
+        }
+        # Journal the file before folding, process_source_data takes ownership
+        self._pending.append(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+        self._apply(entry)
 
-    return all_results, final_id_to_name, title_info
+    def update(
+        self, txt_dir: Path, names: List[str], file_cache: Optional[Dict] = None
+    ) -> None:
+        """
+        Bring the aggregate up to date with the day's files
+
+        Args:
+            txt_dir: The day's txt directory
+            names: The txt file names in it, sorted
+            file_cache: Optional parse cache shared with parse_file_titles_cached
+        """
+        folded = self.files
+        new_names = [name for name in names if name not in folded]
+
+        rebuild = len(names) - len(new_names) != len(folded) or any(
+            name < self._last_folded for name in new_names
+        )
+        if not rebuild:
+            prefix = os.path.join(txt_dir, "")
+            rebuild = not all(
+                self._is_unchanged(prefix + name, name) for name in names if name in folded
+            )
+
+        if rebuild:
+            if folded:
+                print("Day aggregate out of date, rebuilding from all txt files")
+            self._reset()
+            self._pending = []
+            self._snapshot_needed = True
+            new_names = names
+
+        for name in new_names:
+            self._fold(txt_dir / name, file_cache)
+
+    def _write_snapshot(self) -> None:
+        """Write the full aggregate and truncate the journal"""
+        # json.dumps runs the C encoder, json.dump to a file does not
+        content = json.dumps(
+            {
+                "files": self.files,
+                "all_results": self.all_results,
+                "id_to_name": self.id_to_name,
+                "title_info": self.title_info,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        tmp_file = self.snapshot_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(content)
+        self._snapshot_bytes = tmp_file.stat().st_size
+        tmp_file.replace(self.snapshot_file)
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_bytes = 0
+
+    def save(self) -> None:
+        """Append newly folded files to the journal, compacting once it outgrows the snapshot"""
+        if not self._pending and not self._snapshot_needed:
+            return
+
+        try:
+            data = ("\n".join(self._pending) + "\n").encode("utf-8") if self._pending else b""
+            journal_bytes = self._journal_bytes + len(data)
+            if self._snapshot_needed or journal_bytes > max(
+                self._snapshot_bytes, self.MIN_COMPACT_BYTES
+            ):
+                self._write_snapshot()
+            else:
+                with open(self.journal_file, "ab") as f:
+                    f.write(data)
+                self._journal_bytes = journal_bytes
+            self._pending = []
+            self._snapshot_needed = False
+        except Exception as e:
+            print(f"Failed to save day aggregate: {e}")
+
+    def view(
+        self, current_platform_ids: Optional[List[str]] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """Get (all_results, id_to_name, title_info), optionally filtered by platform"""
+        if current_platform_ids is None:
+            return dict(self.all_results), dict(self.id_to_name), dict(self.title_info)
+
+        platform_ids = set(current_platform_ids)
+        return (
+            {k: v for k, v in self.all_results.items() if k in platform_ids},
+            {k: v for k, v in self.id_to_name.items() if k in platform_ids},
+            {k: v for k, v in self.title_info.items() if k in platform_ids},
+        )
+
+
+def read_all_today_titles(
+    current_platform_ids: Optional[List[str]] = None,
+    file_cache: Optional[Dict] = None,
+    day_aggregate: Optional[DayAggregate] = None,
+) -> Tuple[Dict, Dict, Dict]:
+    """Read all titles from today's files, with optional filtering by current monitored platforms
+
+    Backed by the day's persisted DayAggregate, so only files added since the
+    last call are parsed. Long-running callers may pass their own aggregate to
+    skip reloading it from disk.
+    """
+    date_folder = format_date_folder()
+    txt_dir = Path("output") / date_folder / "txt"
+
+    if not txt_dir.exists():
+        return {}, {}, {}
+
+    names = list_txt_names(txt_dir)
+
+    if file_cache is not None:
+        # Drop parses of files that are gone (e.g. the previous day's)
+        prefix = os.path.join(txt_dir, "")
+        current_keys = {prefix + name for name in names}
+        for key in [key for key in file_cache if key not in current_keys]:
+            del file_cache[key]
+
+    if day_aggregate is None or day_aggregate.date_dir != txt_dir.parent:
+        day_aggregate = DayAggregate(txt_dir.parent)
+    day_aggregate.update(txt_dir, names, file_cache)
+    day_aggregate.save()
+
+    return day_aggregate.view(current_platform_ids)
 
 
 def process_source_data(
@@ -977,7 +1969,8 @@ def process_source_data(
 
 def detect_latest_new_titles(
     current_platform_ids: Optional[List[str]] = None,
-    dedup_manager: Optional[DeduplicationManager] = None
+    dedup_manager: Optional[DeduplicationManager] = None,
+    file_cache: Optional[Dict] = None,
 ) -> Dict:
     """Detect new titles from the latest batch using DeduplicationManager"""
     date_folder = format_date_folder()
@@ -986,13 +1979,13 @@ def detect_latest_new_titles(
     if not txt_dir.exists():
         return {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    if not files:
+    names = list_txt_names(txt_dir)
+    if not names:
         return {}
 
     # Parse latest file
-    latest_file = files[-1]
-    latest_titles, _ = parse_file_titles(latest_file)
+    latest_file = txt_dir / names[-1]
+    latest_titles, _ = parse_file_titles_cached(latest_file, file_cache)
 
     # Filter latest file data if current platform list is specified
     if current_platform_ids is not None:
@@ -1005,7 +1998,7 @@ def detect_latest_new_titles(
     if not dedup_manager:
         # Fallback to old logic if no manager provided (shouldn't happen in new flow)
         print("Warning: No DeduplicationManager provided, falling back to daily file comparison")
-        if len(files) < 2:
+        if len(names) < 2:
             return latest_titles # All are new if it's the first file and no manager
         
         # ... (Old logic omitted for brevity, but could be kept as fallback)
@@ -1039,37 +2032,38 @@ def detect_latest_new_titles(
 def calculate_news_weight(
     title_data: Dict, rank_threshold: int = CONFIG["RANK_THRESHOLD"]
 ) -> float:
-    """Calculate news weight for sorting"""
-    ranks = title_data.get("ranks", [])
-    if not ranks:
-        return 0.0
+    """Calculate news weight for sorting (see news_weight.py)"""
+    return news_weights([title_data], rank_threshold, CONFIG["WEIGHT_CONFIG"])[0]
 
-    count = title_data.get("count", len(ranks))
-    weight_config = CONFIG["WEIGHT_CONFIG"]
 
-    # Rank weight: Σ(11 - min(rank, 10)) / appearance count
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+# Compiled matchers keyed by the rule entries they were built from, so a
+# reloaded or modified rule list never reuses a stale matcher
+_word_group_matchers: Dict[Tuple, WordGroupMatcher] = {}
+_MAX_WORD_GROUP_MATCHERS = 8
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
 
-    # Frequency weight: min(appearance count, 10) × 10
-    frequency_weight = min(count, 10) * 10
+def _word_group_rules_key(word_groups: List[Dict], filter_words: List[str]) -> Tuple:
+    """The entries a WordGroupMatcher depends on, as a hashable key"""
+    return (
+        tuple(filter_words),
+        tuple((tuple(group["required"]), tuple(group["normal"])) for group in word_groups),
+    )
 
-    # Hotness bonus: high rank count / total appearance count × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
 
-    total_weight = (
-        rank_weight * weight_config["RANK_WEIGHT"]
-        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
-        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
-    )
+def get_word_group_matcher(
+    word_groups: List[Dict], filter_words: List[str]
+) -> WordGroupMatcher:
+    """Get the compiled matcher for a rule set, compiling it on first use"""
+    key = _word_group_rules_key(word_groups, filter_words)
+    matcher = _word_group_matchers.get(key)
+    if matcher is not None:
+        return matcher
 
-    return total_weight
+    matcher = WordGroupMatcher(word_groups, filter_words)
+    if len(_word_group_matchers) >= _MAX_WORD_GROUP_MATCHERS:
+        _word_group_matchers.pop(next(iter(_word_group_matchers)))
+    _word_group_matchers[key] = matcher
+    return matcher
 
 
 def matches_word_groups(
@@ -1080,36 +2074,8 @@ def matches_word_groups(
     if not word_groups:
         return True
 
-    title_lower = title.lower()
-
-    # Filter word check
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
-
-    # Word group matching check
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
-        # Required word check
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
-
-        # Normal word check
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
-
-        return True
-
-    return False
+    filtered, group_index = get_word_group_matcher(word_groups, filter_words).match(title)
+    return not filtered and group_index is not None
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -1162,6 +2128,43 @@ def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str)
             return f"[{min_rank} - {max_rank}]"
 
 
+def merge_title_cluster(entries: List[Dict]) -> Dict:
+    """
+    Merge near-duplicate report entries into one
+
+    Args:
+        entries: Entries of one cluster, in processing order
+
+    Returns:
+        The best-ranked entry listing every source of the cluster, with each
+        source's ranks in source_ranks; the other titles are listed in
+        merged_titles. ranks and count stay the representative's, so the
+        merged story is weighted like its best-ranked report, not boosted
+        by the number of platforms carrying it
+    """
+    representative = min(entries, key=lambda entry: min(entry["ranks"]))
+    merged = dict(representative)
+
+    sources = []
+    for entry in entries:
+        if entry["source_name"] not in sources:
+            sources.append(entry["source_name"])
+    first_times = [entry["first_time"] for entry in entries if entry["first_time"]]
+    last_times = [entry["last_time"] for entry in entries if entry["last_time"]]
+
+    merged["source_name"] = " / ".join(sources)
+    merged["sources"] = sources
+    merged["source_ranks"] = {entry["source_name"]: entry["ranks"] for entry in entries}
+    merged["first_time"] = min(first_times) if first_times else ""
+    merged["last_time"] = max(last_times) if last_times else ""
+    merged["time_display"] = format_time_display(merged["first_time"], merged["last_time"])
+    merged["is_new"] = any(entry["is_new"] for entry in entries)
+    merged["merged_titles"] = [
+        entry["title"] for entry in entries if entry is not representative
+    ]
+    return merged
+
+
 def count_word_frequency(
     results: Dict,
     word_groups: List[Dict],
@@ -1171,8 +2174,25 @@ def count_word_frequency(
     rank_threshold: int = CONFIG["RANK_THRESHOLD"],
     new_titles: Optional[Dict] = None,
     mode: str = "daily",
+    timings: Optional[Dict] = None,
+    cluster_threshold: Optional[float] = CONFIG["TITLE_CLUSTER_THRESHOLD"],
+    log_timings: bool = CONFIG["LOG_TIMINGS"],
 ) -> Tuple[List[Dict], int]:
-    """Count word frequency, supporting required words, frequency words, filter words, and marking new titles"""
+    """
+    Count word frequency, supporting required words, frequency words, filter words, and marking new titles
+
+    Each title is matched once against the compiled word groups, its weight
+    is computed once, and the group buckets are built in a single pass.
+
+    Args:
+        timings: Optional dict filled with per-stage seconds
+            (select, match, entries, cluster, bucket, sort, total)
+        cluster_threshold: Shingle Jaccard similarity at which titles of one
+            group are merged into a single entry; None disables clustering
+        log_timings: Print the stage timings (report.log_timings)
+    """
+    started = time.perf_counter()
+    stage_times: Dict[str, float] = {}
 
     # If no word groups configured, create a virtual group containing all news
     if not word_groups:
@@ -1237,9 +2257,10 @@ def count_word_frequency(
         )
         print(f"Daily summary mode: Processing {total_input_news} news items, mode: {filter_status}")
 
-    word_stats = {}
+    stage_start = time.perf_counter()
+    stage_times["select"] = stage_start - started
+
     total_titles = 0
-    processed_titles = {}
     matched_new_count = 0
 
     if title_info is None:
@@ -1247,147 +2268,114 @@ def count_word_frequency(
     if new_titles is None:
         new_titles = {}
 
-    for group in word_groups:
-        group_key = group["group_key"]
-        word_stats[group_key] = {"count": 0, "titles": {}}
+    matcher = get_word_group_matcher(word_groups, filter_words)
+    count_new_matches = (mode == "incremental" and all_news_are_new) or (
+        mode == "current" and is_first_today
+    )
 
+    # Match every title once: (group index, source_id, title, title_data)
+    matched = []
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
-
-        if source_id not in processed_titles:
-            processed_titles[source_id] = {}
-
         for title, title_data in titles_data.items():
-            if title in processed_titles.get(source_id, {}):
+            filtered, group_index = matcher.match(title)
+            if filtered or group_index is None:
                 continue
-
-            # Use unified matching logic
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
-
-            if not matches_frequency_words:
-                continue
-
-            # If incremental mode or current mode first batch, count matched new news
-            if (mode == "incremental" and all_news_are_new) or (
-                mode == "current" and is_first_today
-            ):
+            if count_new_matches:
                 matched_new_count += 1
+            matched.append((group_index, source_id, title, title_data))
+
+    now = time.perf_counter()
+    stage_times["match"] = now - stage_start
+    stage_start = now
+
+    # Build one report entry per matched title
+    entries = []
+    for group_index, source_id, title, title_data in matched:
+        ranks = title_data.get("ranks", []) or []
+        url = title_data.get("url", "")
+        mobile_url = title_data.get("mobileUrl", "")
+        first_time = ""
+        last_time = ""
+        count_info = 1
+
+        info = title_info.get(source_id, {}).get(title)
+        if info is not None:
+            first_time = info.get("first_time", "")
+            last_time = info.get("last_time", "")
+            count_info = info.get("count", 1)
+            if info.get("ranks"):
+                ranks = info["ranks"]
+            url = info.get("url", url)
+            mobile_url = info.get("mobileUrl", mobile_url)
+
+        if not ranks:
+            ranks = [99]
+
+        # In incremental mode, all processed news are new, or all news in first batch of the day are new
+        is_new = all_news_are_new or title in new_titles.get(source_id, ())
+
+        entry = {
+            "title": title,
+            "source_name": id_to_name.get(source_id, source_id),
+            "first_time": first_time,
+            "last_time": last_time,
+            "time_display": format_time_display(first_time, last_time),
+            "count": count_info,
+            "ranks": ranks,
+            "rank_threshold": rank_threshold,
+            "url": url,
+            "mobileUrl": mobile_url,
+            "is_new": is_new,
+        }
+        entries.append((group_index, entry))
+
+    now = time.perf_counter()
+    stage_times["entries"] = now - stage_start
+    stage_start = now
+
+    # Merge near-duplicate titles (same story, different platforms) within a group
+    if cluster_threshold and len(entries) > 1:
+        cluster_index = TitleClusterIndex()
+        for group_index, entry in entries:
+            cluster_index.add(group_index, entry["title"])
+        clusters = cluster_index.clusters(
+            cluster_threshold,
+            can_merge=lambda first, second: entries[first][0] == entries[second][0],
+            distinct=lambda doc_id: entries[doc_id][1]["source_name"],
+        )
+        merged_count = len(entries) - len(clusters)
+        entries = [
+            (
+                entries[members[0]][0],
+                merge_title_cluster([entries[member][1] for member in members])
+                if len(members) > 1
+                else entries[members[0]][1],
+            )
+            for members in clusters
+        ]
+        if merged_count:
+            print(f"Title clustering: merged {merged_count} near-duplicate titles")
+
+        now = time.perf_counter()
+        stage_times["cluster"] = now - stage_start
+        stage_start = now
+
+    # Build the group buckets in one pass; each entry carries its sort key,
+    # with all weights computed in one batch
+    # Groups sharing a group_key share one bucket
+    buckets_by_key: Dict[str, List] = {}
+    buckets = [buckets_by_key.setdefault(group["group_key"], []) for group in word_groups]
+    weights = news_weights(
+        [entry for _, entry in entries], rank_threshold, CONFIG["WEIGHT_CONFIG"]
+    )
+    for (group_index, entry), weight in zip(entries, weights):
+        sort_key = (-weight, min(entry["ranks"]), -entry["count"])
+        buckets[group_index].append((sort_key, entry))
 
-            source_ranks = title_data.get("ranks", [])
-            source_url = title_data.get("url", "")
-            source_mobile_url = title_data.get("mobileUrl", "")
-
-            # Find matching word group
-            title_lower = title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # If "All News" mode, all titles match the single (only) word group
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "All News":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # Original matching logic
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # For current mode, get complete data from historical statistics
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # Check if this is new
-                is_new = False
-                if all_news_are_new:
-                    # In incremental mode, all processed news are new, or all news in first batch of the day are new
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # Check if in new titles list
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
-
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
-
-                break
+    now = time.perf_counter()
+    stage_times["bucket"] = now - stage_start
+    stage_start = now
 
     # Print summary information at the end
     if mode == "incremental":
@@ -1429,7 +2417,7 @@ def count_word_frequency(
                 f"Current ranking mode: First crawl of the day, {matched_new_count} out of {total_input_news} current ranking news {filter_status}"
             )
         else:
-            matched_count = sum(stat["count"] for stat in word_stats.values())
+            matched_count = len(matched)
             filter_status = (
                 "show all"
                 if len(word_groups) == 1 and word_groups[0]["group_key"] == "All News"
@@ -1440,28 +2428,16 @@ def count_word_frequency(
             )
 
     stats = []
-    for group_key, data in word_stats.items():
-        all_titles = []
-        for source_id, title_list in data["titles"].items():
-            all_titles.extend(title_list)
-
-        # Sort by weight
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
-
+    for group_key, bucket in buckets_by_key.items():
+        # Sort by weight (stable, so ties keep source order)
+        bucket.sort(key=lambda item: item[0])
         stats.append(
             {
                 "word": group_key,
-                "count": data["count"],
-                "titles": sorted_titles,
+                "count": len(bucket),
+                "titles": [entry for _, entry in bucket],
                 "percentage": (
-                    round(data["count"] / total_titles * 100, 2)
+                    round(len(bucket) / total_titles * 100, 2)
                     if total_titles > 0
                     else 0
                 ),
@@ -1469,6 +2445,17 @@ def count_word_frequency(
         )
 
     stats.sort(key=lambda x: x["count"], reverse=True)
+
+    stage_times["sort"] = time.perf_counter() - stage_start
+    stage_times["total"] = time.perf_counter() - started
+    if timings is not None:
+        timings.update(stage_times)
+    if log_timings:
+        print(
+            "Statistics timing: "
+            + ", ".join(f"{stage} {seconds * 1000:.1f}ms" for stage, seconds in stage_times.items())
+            + f" ({len(matched)}/{total_titles} titles matched)"
+        )
     return stats, total_titles
 
 
@@ -1491,10 +2478,13 @@ def prepare_report_data(
         filtered_new_titles = {}
         if new_titles and id_to_name:
             word_groups, filter_words = load_frequency_words()
+            # Look the matcher up once, not per title
+            matcher = get_word_group_matcher(word_groups, filter_words)
             for source_id, titles_data in new_titles.items():
                 filtered_titles = {}
                 for title, title_data in titles_data.items():
-                    if matches_word_groups(title, word_groups, filter_words):
+                    filtered, group_index = matcher.match(title)
+                    if not word_groups or (not filtered and group_index is not None):
                         filtered_titles[title] = title_data
                 if filtered_titles:
                     filtered_new_titles[source_id] = filtered_titles
@@ -3698,9 +4688,6 @@ def send_to_feishu(
 ) -> bool:
     """Send to Feishu (supports batch sending)"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # 获取分批内容，使用飞书专用的批times大小
     batches = split_content_into_batches(
@@ -3748,8 +4735,8 @@ def send_to_feishu(
         }
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = get_transport().post(
+                webhook_url, headers=headers, json=payload, proxy_url=proxy_url, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -3788,9 +4775,6 @@ def send_to_dingtalk(
 ) -> bool:
     """Send to DingTalk (supports batch sending)"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # 获取分批内容，使用钉钉专用的批times大小
     batches = split_content_into_batches(
@@ -3831,8 +4815,8 @@ def send_to_dingtalk(
         }
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = get_transport().post(
+                webhook_url, headers=headers, json=payload, proxy_url=proxy_url, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -3869,9 +4853,6 @@ def send_to_wework(
 ) -> bool:
     """Send to WeWork (supports batch sending)"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # 获取分批内容
     batches = split_content_into_batches(report_data, "wework", update_info, mode=mode)
@@ -3893,8 +4874,8 @@ def send_to_wework(
         payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = get_transport().post(
+                webhook_url, headers=headers, json=payload, proxy_url=proxy_url, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -3934,10 +4915,6 @@ def send_to_telegram(
     headers = {"Content-Type": "application/json"}
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容
     batches = split_content_into_batches(
         report_data, "telegram", update_info, mode=mode
@@ -3965,8 +4942,8 @@ def send_to_telegram(
         }
 
         try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = get_transport().post(
+                url, headers=headers, json=payload, proxy_url=proxy_url, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
@@ -4314,10 +5291,6 @@ def send_to_ntfy(
         base_url = f"https://{base_url}"
     url = f"{base_url}/{topic}"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容，使用ntfy专用的4KB限制
     batches = split_content_into_batches(
         report_data, "ntfy", update_info, max_bytes=3800, mode=mode
@@ -4357,11 +5330,11 @@ def send_to_ntfy(
             )
 
         try:
-            response = requests.post(
+            response = get_transport().post(
                 url,
                 headers=current_headers,
                 data=batch_content.encode("utf-8"),
-                proxies=proxies,
+                proxy_url=proxy_url,
                 timeout=30,
             )
 
@@ -4378,11 +5351,11 @@ def send_to_ntfy(
                 )
                 time.sleep(10)  # 等待10秒后重试
                 # 重试一times
-                retry_response = requests.post(
+                retry_response = get_transport().post(
                     url,
                     headers=current_headers,
                     data=batch_content.encode("utf-8"),
-                    proxies=proxies,
+                    proxy_url=proxy_url,
                     timeout=30,
                 )
                 if retry_response.status_code == 200:
@@ -4463,6 +5436,7 @@ class NewsAnalyzer:
 
     def __init__(self):
         self.request_interval = CONFIG["REQUEST_INTERVAL"]
+        self.max_workers = CONFIG["CRAWLER_MAX_WORKERS"]
         self.report_mode = CONFIG["REPORT_MODE"]
         self.rank_threshold = CONFIG["RANK_THRESHOLD"]
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
@@ -4470,6 +5444,12 @@ class NewsAnalyzer:
         self.update_info = None
         self.proxy_url = None
         self._setup_proxy()
+        configure_transport(
+            CONFIG["HTTP_POOL_CONNECTIONS"],
+            CONFIG["HTTP_POOL_MAXSIZE"],
+            self.proxy_url,
+            HostRateLimiter(self.request_interval, CONFIG["HOST_INTERVALS"]),
+        )
 
         # Get News API key from config (env var takes priority)
         newsapi_key = CONFIG.get('NEWSAPI_KEY', '')
@@ -4478,7 +5458,27 @@ class NewsAnalyzer:
         if self.is_github_actions:
             self._check_version_update()
             
-        self.dedup_manager = DeduplicationManager(retention_hours=72)
+        dedup_config = CONFIG["DEDUPLICATION"]
+        self.dedup_manager = DeduplicationManager(
+            retention_hours=dedup_config["RETENTION_HOURS"],
+            bloom_enabled=dedup_config["BLOOM_ENABLED"],
+            bloom_false_positive_rate=dedup_config["BLOOM_FALSE_POSITIVE_RATE"],
+            bloom_slice_hours=dedup_config["BLOOM_SLICE_HOURS"],
+            bloom_slice_capacity=dedup_config["BLOOM_SLICE_CAPACITY"],
+            bloom_confirm_hits=dedup_config["BLOOM_CONFIRM_HITS"],
+        )
+
+        # Warm state kept between ticks in daemon mode
+        self._file_cache: Optional[Dict] = None
+        self._frequency_words_cache: Optional[Tuple] = None
+        self._day_aggregate: Optional[DayAggregate] = None
+
+        self.history_store = None
+        if CONFIG["HISTORY_DB"]["ENABLED"]:
+            try:
+                self.history_store = HistoryStore(CONFIG["HISTORY_DB"]["PATH"])
+            except Exception as e:
+                print(f"Failed to open history database, history disabled: {e}")
 
     def _detect_docker_environment(self) -> bool:
         """Detect if running in Docker container"""
@@ -4525,6 +5525,24 @@ class NewsAnalyzer:
         except Exception as e:
             print(f"版本检查出错: {e}")
 
+    def _load_frequency_words(self) -> Tuple[List[Dict], List[str]]:
+        """Load frequency words, reusing the parsed rules while the file is unchanged"""
+        frequency_file = os.environ.get(
+            "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
+        )
+        try:
+            mtime = Path(frequency_file).stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = self._frequency_words_cache
+        if mtime is not None and cached and cached[0] == (frequency_file, mtime):
+            return cached[1]
+
+        frequency_words = load_frequency_words(frequency_file)
+        self._frequency_words_cache = ((frequency_file, mtime), frequency_words)
+        return frequency_words
+
     def _get_mode_strategy(self) -> Dict:
         """Get strategy configuration for current mode"""
         return self.MODE_STRATEGIES.get(self.report_mode, self.MODE_STRATEGIES["daily"])
@@ -4573,8 +5591,14 @@ class NewsAnalyzer:
 
             print(f"Current monitored platforms: {current_platform_ids}")
 
+            if self._file_cache is not None:
+                # Daemon mode: keep today's aggregate in memory between ticks
+                date_dir = Path("output") / format_date_folder()
+                if self._day_aggregate is None or self._day_aggregate.date_dir != date_dir:
+                    self._day_aggregate = DayAggregate(date_dir)
+
             all_results, id_to_name, title_info = read_all_today_titles(
-                current_platform_ids
+                current_platform_ids, self._file_cache, self._day_aggregate
             )
 
             if not all_results:
@@ -4584,8 +5608,10 @@ class NewsAnalyzer:
             total_titles = sum(len(titles) for titles in all_results.values())
             print(f"Read {total_titles} news items (filtered by current monitored platforms)")
 
-            new_titles = detect_latest_new_titles(current_platform_ids, self.dedup_manager)
-            word_groups, filter_words = load_frequency_words()
+            new_titles = detect_latest_new_titles(
+                current_platform_ids, self.dedup_manager, self._file_cache
+            )
+            word_groups, filter_words = self._load_frequency_words()
 
             return (
                 all_results,
@@ -4810,16 +5836,28 @@ class NewsAnalyzer:
         print(
             f"Configured platforms: {[p.get('name', p['id']) for p in platforms]}"
         )
-        print(f"Starting data crawl, request interval: {self.request_interval}ms")
+        print(
+            f"Starting data crawl, request interval: {self.request_interval}ms per host, "
+            f"workers: {self.max_workers}"
+        )
         ensure_directory_exists("output")
 
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            platforms, self.request_interval
+            platforms, self.max_workers
         )
 
         title_file = save_titles_to_file(results, id_to_name, failed_ids)
         print(f"News saved to: {title_file}")
 
+        if self.history_store:
+            record_crawl_history(self.history_store, Path(title_file))
+
+        if CONFIG["SEARCH_INDEX_ENABLED"]:
+            try:
+                update_day_index(Path(title_file).parent.parent, parse_file_titles)
+            except Exception as e:
+                print(f"Failed to update search index: {e}")
+
         return results, id_to_name, failed_ids
 
     def _execute_mode_strategy(
@@ -4829,9 +5867,11 @@ class NewsAnalyzer:
         # Get current monitored platform ID list
         current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
 
-        new_titles = detect_latest_new_titles(current_platform_ids, self.dedup_manager)
+        new_titles = detect_latest_new_titles(
+            current_platform_ids, self.dedup_manager, self._file_cache
+        )
         time_info = Path(save_titles_to_file(results, id_to_name, failed_ids)).stem
-        word_groups, filter_words = load_frequency_words()
+        word_groups, filter_words = self._load_frequency_words()
 
         # current模式下，实时推送需要使用完整的历史数据来保证统计信息的完整性
         if self.report_mode == "current":
@@ -4953,15 +5993,72 @@ class NewsAnalyzer:
             if self.dedup_manager:
                 self.dedup_manager.save()
 
+            get_transport().print_stats()
+
         except Exception as e:
             print(f"分析流程执行出错: {e}")
             raise
 
+    def run_daemon(
+        self, schedule: Optional[str] = None, immediate: Optional[bool] = None
+    ) -> None:
+        """Run as a long-lived process, executing run() on an in-process schedule
+
+        Config, frequency words, dedup state, HTTP caches and today's parsed
+        txt files stay in memory between ticks, so each tick only crawls and
+        parses the newest batch. Ticks never overlap; SIGTERM/SIGINT stop the
+        daemon after the running tick and flush state to disk.
+        """
+        schedule = schedule or CONFIG["DAEMON_SCHEDULE"]
+        if immediate is None:
+            immediate = CONFIG["DAEMON_IMMEDIATE_RUN"]
+
+        parsed_schedule = parse_schedule(schedule)
+        self._file_cache = {}
+
+        scheduler = DaemonScheduler(parsed_schedule, self.run)
+        scheduler.install_signal_handlers()
+        print(f"Daemon mode started, schedule: {parsed_schedule}")
+
+        try:
+            scheduler.run(immediate=immediate)
+        finally:
+            self.dedup_manager.save()
+            self.data_fetcher.http_cache.save()
+            self.data_fetcher.health.save()
+            if self.history_store:
+                self.history_store.close()
+            get_transport().close()
+
 
 def main():
+    parser = argparse.ArgumentParser(description="TrendRadar news analyzer")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running and execute on a schedule instead of exiting after one run",
+    )
+    parser.add_argument(
+        "--schedule",
+        help="Cron expression or interval in minutes for daemon mode (defaults to config)",
+    )
+    parser.add_argument(
+        "--backfill-history",
+        action="store_true",
+        help="Import all existing txt output into the SQLite history database and exit",
+    )
+    args = parser.parse_args()
+
+    if args.backfill_history:
+        backfill_history()
+        return
+
     try:
         analyzer = NewsAnalyzer()
-        analyzer.run()
+        if args.daemon:
+            analyzer.run_daemon(args.schedule)
+        else:
+            analyzer.run()
     except FileNotFoundError as e:
         print(f"❌ 配置文件Error: {e}")
         print("\n请确保以下文件存在:")
@@ -5,11 +5,17 @@ Provides production-grade MCP tool server using FastMCP 2.0.
 Supports both stdio and HTTP transport modes.
 """
 
+import asyncio
+import functools
 import json
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Dict
 
+import yaml
 from fastmcp import FastMCP
 
+from .services import parser_service
 from .tools.data_query import DataQueryTools
 from .tools.analytics import AnalyticsTools
 from .tools.search_tools import SearchTools
@@ -35,6 +41,108 @@ def _get_tools(project_root: Optional[str] = None):
     return _tools_instances
 
 
+# ==================== Tool Execution ====================
+
+# Tool bodies are synchronous (file parsing, analysis). They run in a worker
+# pool so the event loop keeps serving other clients under the HTTP transport.
+# Several tool bodies may run at once: the shared day data, keyword tables,
+# series and co-occurrence matrices are never modified after being handed
+# out (updates build a new object and swap it in under the service lock).
+DEFAULT_TOOL_WORKERS = 4
+DEFAULT_TOOL_CONCURRENCY = 2
+
+_execution_config = {
+    'tool_workers': DEFAULT_TOOL_WORKERS,
+    'tool_concurrency': DEFAULT_TOOL_CONCURRENCY,
+    'tool_limits': {},
+}
+_executor: Optional[ThreadPoolExecutor] = None
+_tool_semaphores: Dict[str, asyncio.Semaphore] = {}
+# (tool name, arguments) -> task of the call currently computing that result
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+
+def _load_execution_config(project_root: Optional[str] = None) -> None:
+    """Read the mcp section of config/config.yaml (defaults if absent)"""
+    root = Path(project_root) if project_root else Path(__file__).parent.parent
+    config_path = root / "config" / "config.yaml"
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            mcp_config = (yaml.safe_load(f) or {}).get("mcp") or {}
+    except (OSError, yaml.YAMLError) as e:
+        print(f"Warning: failed to read MCP execution config from {config_path}: {e}")
+        return
+
+    if "tool_workers" in mcp_config:
+        _execution_config['tool_workers'] = max(1, int(mcp_config["tool_workers"]))
+    if "tool_concurrency" in mcp_config:
+        _execution_config['tool_concurrency'] = int(mcp_config["tool_concurrency"])
+    _execution_config['tool_limits'] = {
+        name: int(limit) for name, limit in (mcp_config.get("tool_limits") or {}).items()
+    }
+    if "range_load_workers" in mcp_config:
+        parser_service.RANGE_LOAD_WORKERS = max(0, int(mcp_config["range_load_workers"]))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get or create the worker pool that runs tool bodies"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_execution_config['tool_workers'],
+            thread_name_prefix="mcp-tool"
+        )
+    return _executor
+
+
+def _get_semaphore(tool: str) -> Optional[asyncio.Semaphore]:
+    """Per-tool concurrency limit, None when the tool is unlimited (limit <= 0)"""
+    if tool not in _tool_semaphores:
+        limit = _execution_config['tool_limits'].get(tool, _execution_config['tool_concurrency'])
+        _tool_semaphores[tool] = asyncio.Semaphore(limit) if limit > 0 else None
+    return _tool_semaphores[tool]
+
+
+def _call_tool(func: Callable, kwargs: Dict[str, Any]) -> str:
+    result = func(**kwargs)
+    return json.dumps(result, ensure_ascii=False, indent=2)
+
+
+async def _execute_tool(tool: str, func: Callable, kwargs: Dict[str, Any]) -> str:
+    loop = asyncio.get_running_loop()
+    call = functools.partial(_call_tool, func, kwargs)
+    semaphore = _get_semaphore(tool)
+    if semaphore is None:
+        return await loop.run_in_executor(_get_executor(), call)
+    async with semaphore:
+        return await loop.run_in_executor(_get_executor(), call)
+
+
+def _forget_inflight(key: tuple, task: asyncio.Task) -> None:
+    _inflight.pop(key, None)
+    # Mark the exception as retrieved if every caller went away
+    if not task.cancelled():
+        task.exception()
+
+
+async def _run_tool(tool: str, func: Callable, **kwargs) -> str:
+    """
+    Run a tool body in the worker pool and return its JSON result
+
+    Identical calls (same tool and arguments) that arrive while one is still
+    running wait for that run instead of starting another. The run is a
+    separate task, so a caller disconnecting does not cancel it for the
+    others.
+    """
+    key = (tool, json.dumps(kwargs, sort_keys=True, ensure_ascii=False, default=str))
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_execute_tool(tool, func, kwargs))
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_forget_inflight, key))
+    return await asyncio.shield(task)
+
+
 # ==================== Data Query Tools ====================
 
 @mcp.tool
@@ -71,8 +179,7 @@ async def get_latest_news(
     **Note**: If user asks "why only showing partial", they need the complete data
     """
     tools = _get_tools()
-    result = tools['data'].get_latest_news(platforms=platforms, limit=limit, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool('get_latest_news', tools['data'].get_latest_news, platforms=platforms, limit=limit, include_url=include_url)
 
 
 @mcp.tool
@@ -97,8 +204,7 @@ async def get_trending_topics(
         JSON-formatted keyword frequency statistics list
     """
     tools = _get_tools()
-    result = tools['data'].get_trending_topics(top_n=top_n, mode=mode)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool('get_trending_topics', tools['data'].get_trending_topics, top_n=top_n, mode=mode)
 
 
 @mcp.tool
@@ -140,13 +246,13 @@ async def get_news_by_date(
     **Note**: If user asks "why only showing partial", they need the complete data
     """
     tools = _get_tools()
-    result = tools['data'].get_news_by_date(
+    return await _run_tool(
+        'get_news_by_date', tools['data'].get_news_by_date,
         date_query=date_query,
         platforms=platforms,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 
@@ -181,7 +287,7 @@ async def analyze_topic_trend(
                       - User says "last week" → AI calculates: {"start": "2025-11-11", "end": "2025-11-17"} (Monday to Sunday of last week)
                       - User says "this month" → AI calculates: {"start": "2025-11-01", "end": "2025-11-17"} (Nov 1st to today)
                     - **Default**: Analyzes last 7 days if not specified
-        granularity: Time granularity (trend mode), default "day" (only supports day, as underlying data is aggregated daily)
+        granularity: Time granularity (trend mode), default "day"; "hour" gives one point per crawl
         threshold: Popularity surge multiplier threshold (viral mode), default 3.0
         time_window: Detection time window in hours (viral mode), default 24
         lookahead_hours: Prediction hours ahead (predict mode), default 6
@@ -205,7 +311,8 @@ async def analyze_topic_trend(
         - analyze_topic_trend(topic="ChatGPT", analysis_type="predict", lookahead_hours=6)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_topic_trend_unified(
+    return await _run_tool(
+        'analyze_topic_trend', tools['analytics'].analyze_topic_trend_unified,
         topic=topic,
         analysis_type=analysis_type,
         date_range=date_range,
@@ -215,7 +322,6 @@ async def analyze_topic_trend(
         lookahead_hours=lookahead_hours,
         confidence_threshold=confidence_threshold
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -251,14 +357,14 @@ async def analyze_data_insights(
         - analyze_data_insights(insight_type="keyword_cooccur", min_frequency=5, top_n=15)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_data_insights_unified(
+    return await _run_tool(
+        'analyze_data_insights', tools['analytics'].analyze_data_insights_unified,
         insight_type=insight_type,
         topic=topic,
         date_range=date_range,
         min_frequency=min_frequency,
         top_n=top_n
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -298,7 +404,8 @@ async def analyze_sentiment(
     - Only filter and summarize when user explicitly requests "summary" or "key points"
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_sentiment(
+    return await _run_tool(
+        'analyze_sentiment', tools['analytics'].analyze_sentiment,
         topic=topic,
         platforms=platforms,
         date_range=date_range,
@@ -306,7 +413,6 @@ async def analyze_sentiment(
         sort_by_weight=sort_by_weight,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -336,13 +442,13 @@ async def find_similar_news(
     - Only filter and summarize when user explicitly requests "summary" or "key points"
     """
     tools = _get_tools()
-    result = tools['analytics'].find_similar_news(
+    return await _run_tool(
+        'find_similar_news', tools['analytics'].find_similar_news,
         reference_title=reference_title,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -364,11 +470,11 @@ async def generate_summary_report(
         JSON-formatted summary report including Markdown-formatted content
     """
     tools = _get_tools()
-    result = tools['analytics'].generate_summary_report(
+    return await _run_tool(
+        'generate_summary_report', tools['analytics'].generate_summary_report,
         report_type=report_type,
         date_range=date_range
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 # ==================== Intelligent Search Tools ====================
@@ -442,7 +548,8 @@ async def search_news(
         - Fuzzy search: search_news(query="Tesla price cut", search_mode="fuzzy", threshold=0.4)
     """
     tools = _get_tools()
-    result = tools['search'].search_news_unified(
+    return await _run_tool(
+        'search_news', tools['search'].search_news_unified,
         query=query,
         search_mode=search_mode,
         date_range=date_range,
@@ -452,7 +559,6 @@ async def search_news(
         threshold=threshold,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -489,14 +595,14 @@ async def search_related_news_history(
     - Only filter and summarize when user explicitly requests "summary" or "key points"
     """
     tools = _get_tools()
-    result = tools['search'].search_related_news_history(
+    return await _run_tool(
+        'search_related_news_history', tools['search'].search_related_news_history,
         reference_text=reference_text,
         time_preset=time_preset,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 # ==================== Configuration and System Management Tools ====================
@@ -520,8 +626,7 @@ async def get_current_config(
         JSON-formatted configuration information
     """
     tools = _get_tools()
-    result = tools['config'].get_current_config(section=section)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool('get_current_config', tools['config'].get_current_config, section=section)
 
 
 @mcp.tool
@@ -535,8 +640,7 @@ async def get_system_status() -> str:
         JSON-formatted system status information
     """
     tools = _get_tools()
-    result = tools['system'].get_system_status()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool('get_system_status', tools['system'].get_system_status)
 
 
 @mcp.tool
@@ -570,8 +674,7 @@ async def trigger_crawl(
         - Use default platforms: trigger_crawl()  # Crawls all platforms configured in config.yaml
     """
     tools = _get_tools()
-    result = tools['system'].trigger_crawl(platforms=platforms, save_to_local=save_to_local, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool('trigger_crawl', tools['system'].trigger_crawl, platforms=platforms, save_to_local=save_to_local, include_url=include_url)
 
 
 # ==================== Server Startup Entry ====================
@@ -593,6 +696,7 @@ def run_server(
     """
     # Initialize tool instances
     _get_tools(project_root)
+    _load_execution_config(project_root)
 
     # Print startup information
     print()
@@ -614,6 +718,11 @@ def run_server(
     else:
         print("  Project directory: Current directory")
 
+    print(f"  Tool workers: {_execution_config['tool_workers']}")
+    print(f"  Per-tool concurrency: {_execution_config['tool_concurrency'] or 'unlimited'}")
+    if parser_service.range_preload_enabled():
+        print(f"  Range preload processes: {parser_service.RANGE_LOAD_WORKERS or 'one per CPU core'}")
+
     print()
     print("  Registered tools:")
     print("    === Core Data Query (P0 Priority) ===")
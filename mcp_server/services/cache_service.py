@@ -1,56 +1,201 @@
 """
 缓存服务
 
-实现TTL缓存机制，提升数据访问性能。
+有界的 LRU 缓存：按条目数和估算字节数淘汰最久未使用的条目，
+TTL 在写入时按条目设置，后台线程定期清理过期条目。
+写入大对象的调用方应传入已知的字节数（如日期数据按 txt 文件大小），
+避免每次写入都遍历整个对象。
 """
 
+import sys
 import time
+from collections import OrderedDict
+from threading import Event, Lock, Thread
 from typing import Any, Optional
-from threading import Lock
+
+# 默认上限：条目数、估算字节数
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# 写入时未指定 TTL 的默认存活时间（秒）
+DEFAULT_TTL = 900
+
+# 后台清理间隔（秒）
+CLEANUP_INTERVAL = 60
+
+
+def estimate_size(value: Any) -> int:
+    """
+    估算对象占用的字节数（递归统计容器和对象属性，同一对象只计一次）
+
+    Args:
+        value: 任意对象
+
+    Returns:
+        近似字节数
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        try:
+            total += sys.getsizeof(obj)
+        except TypeError:
+            continue
+
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            # 数值序列（如哈希签名）按首个元素估算，不逐个遍历
+            first = next(iter(obj), None)
+            if isinstance(first, (int, float)) and not isinstance(first, bool):
+                total += len(obj) * sys.getsizeof(first)
+            else:
+                stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+    return total
 
 
 class CacheService:
     """缓存服务类"""
 
-    def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: int = DEFAULT_TTL,
+        cleanup_interval: float = CLEANUP_INTERVAL
+    ):
+        """
+        初始化缓存服务
+
+        Args:
+            max_entries: 最大条目数
+            max_bytes: 最大估算字节数
+            default_ttl: 写入时未指定 TTL 的默认存活时间（秒）
+            cleanup_interval: 后台清理间隔（秒），0 表示不启动后台清理
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.cleanup_interval = cleanup_interval
+
+        # {key: (value, 写入时间, 过期时间, 估算字节数)}，按最近使用排序
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
         self._lock = Lock()
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self._stop_event = Event()
+        self._cleanup_thread: Optional[Thread] = None
+
+    def _start_cleanup_thread(self) -> None:
+        """首次写入时启动后台清理线程"""
+        if self._cleanup_thread is not None or self.cleanup_interval <= 0:
+            return
+
+        def run():
+            while not self._stop_event.wait(self.cleanup_interval):
+                self.cleanup_expired()
+
+        self._cleanup_thread = Thread(target=run, name="cache-cleanup", daemon=True)
+        self._cleanup_thread.start()
+
+    def _remove(self, key: str) -> None:
+        _, _, _, size = self._cache.pop(key)
+        self._bytes -= size
+
+    def peek(self, key: str) -> Optional[Any]:
+        """
+        查看缓存数据，不计入命中统计、不改变淘汰顺序（用于预加载等探测）
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            未过期的缓存值，否则返回 None
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.time() < entry[2]:
+                return entry[0]
+        return None
+
+    def get(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
         """
         获取缓存数据
 
         Args:
             key: 缓存键
-            ttl: 存活时间（秒），默认15分钟
+            ttl: 可选的最大存活时间（秒），条目写入超过该时间也视为过期；
+                 过期时间以写入时设置的 TTL 为准
 
         Returns:
             缓存的值，如果不存在或已过期则返回None
         """
         with self._lock:
-            if key in self._cache:
-                # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
-                else:
-                    # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
+            entry = self._cache.get(key)
+            if entry is not None:
+                value, created_at, expires_at, _ = entry
+                now = time.time()
+                if now < expires_at and (ttl is None or now - created_at < ttl):
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return value
+                # 已过期，删除缓存
+                self._remove(key)
+                self._expirations += 1
+            self._misses += 1
         return None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, size: Optional[int] = None
+    ) -> None:
         """
         设置缓存数据
 
         Args:
             key: 缓存键
             value: 缓存值
+            ttl: 存活时间（秒），默认 default_ttl
+            size: 已知的估算字节数，None 时遍历对象估算
         """
+        if size is None:
+            size = estimate_size(value)
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            if key in self._cache:
+                self._remove(key)
+
+            # 单个条目超过总上限时不缓存
+            if size > self.max_bytes:
+                self._evictions += 1
+                return
+
+            self._cache[key] = (value, now, expires_at, size)
+            self._bytes += size
+
+            # 淘汰最久未使用的条目
+            while len(self._cache) > self.max_entries or self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+            self._start_cleanup_thread()
 
     def delete(self, key: str) -> bool:
         """
@@ -64,8 +209,7 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
                 return True
         return False
 
@@ -73,31 +217,39 @@ class CacheService:
         """清空所有缓存"""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
+            self._bytes = 0
 
-    def cleanup_expired(self, ttl: int = 900) -> int:
+    def cleanup_expired(self, ttl: Optional[int] = None) -> int:
         """
-        清理过期缓存
+        清理过期缓存（后台线程定期调用）
 
         Args:
-            ttl: 存活时间（秒）
+            ttl: 可选的最大存活时间（秒），写入超过该时间的条目也一并清理
 
         Returns:
             清理的条目数量
         """
         with self._lock:
-            current_time = time.time()
+            now = time.time()
             expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
+                key for key, (_, created_at, expires_at, _) in self._cache.items()
+                if now >= expires_at or (ttl is not None and now - created_at >= ttl)
             ]
 
             for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
+            self._expirations += len(expired_keys)
 
             return len(expired_keys)
 
+    def close(self) -> None:
+        """停止后台清理线程"""
+        self._stop_event.set()
+        if self._cleanup_thread is not None:
+            self._cleanup_thread.join(timeout=1)
+            self._cleanup_thread = None
+        self._stop_event.clear()
+
     def get_stats(self) -> dict:
         """
         获取缓存统计信息
@@ -106,16 +258,21 @@ class CacheService:
             统计信息字典
         """
         with self._lock:
+            now = time.time()
+            created = [entry[1] for entry in self._cache.values()]
+            lookups = self._hits + self._misses
             return {
                 "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "oldest_entry_age": now - min(created) if created else 0,
+                "newest_entry_age": now - max(created) if created else 0
             }
 
 
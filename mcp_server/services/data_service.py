@@ -10,9 +10,16 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
 from .cache_service import get_cache
+from .keyword_service import KeywordService
 from .parser_service import ParserService
 from ..utils.errors import DataNotFoundError
 
+try:
+    # 与爬虫共用的关键词规则匹配（整词、正则、| 多选）
+    from frequency_rules import TermMatcher
+except ImportError:
+    TermMatcher = None
+
 
 class DataService:
     """数据访问服务类"""
@@ -26,6 +33,7 @@ class DataService:
         """
         self.parser = ParserService(project_root)
         self.cache = get_cache()
+        self.keywords = KeywordService(self.parser)
 
     def get_latest_news(
         self,
@@ -49,7 +57,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -97,7 +105,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=900)  # 15分钟缓存
 
         return result
 
@@ -134,7 +142,7 @@ class DataService:
         # 尝试从缓存获取
         date_str = target_date.strftime("%Y-%m-%d")
         cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -177,7 +185,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=1800)  # 30分钟缓存
 
         return result
 
@@ -214,9 +222,49 @@ class DataService:
         results = []
         platform_distribution = Counter()
 
+        # 优先使用历史库的单次索引查询
+        history_matches = self.parser.search_titles(keyword, start_date, end_date, platforms)
+        if history_matches is not None:
+            for item in history_matches:
+                ranks = item["ranks"]
+                avg_rank = sum(ranks) / len(ranks) if ranks else 0
+                results.append({
+                    "title": item["title"],
+                    "platform": item["platform"],
+                    "platform_name": item["platform_name"],
+                    "ranks": ranks,
+                    "count": len(ranks),
+                    "avg_rank": round(avg_rank, 2),
+                    "url": item["url"],
+                    "mobileUrl": item["mobileUrl"],
+                    "date": item["date"]
+                })
+                platform_distribution[item["platform"]] += 1
+
         # 遍历日期范围
         current_date = start_date
-        while current_date <= end_date:
+        while history_matches is None and current_date <= end_date:
+            # 有全文索引时直接查索引
+            index = self.parser.get_search_index(current_date)
+            if index is not None:
+                for item in index.search(keyword, platform_ids=platforms):
+                    ranks = item["ranks"]
+                    avg_rank = sum(ranks) / len(ranks) if ranks else 0
+                    results.append({
+                        "title": item["title"],
+                        "platform": item["platform"],
+                        "platform_name": item["platform_name"],
+                        "ranks": ranks,
+                        "count": len(ranks),
+                        "avg_rank": round(avg_rank, 2),
+                        "url": item["url"],
+                        "mobileUrl": item["mobileUrl"],
+                        "date": current_date.strftime("%Y-%m-%d")
+                    })
+                    platform_distribution[item["platform"]] += 1
+                current_date += timedelta(days=1)
+                continue
+
             try:
                 all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
                     date=current_date,
@@ -305,7 +353,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"trending_topics:{top_n}:{mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -355,15 +403,32 @@ class DataService:
         word_frequency = Counter()
         keyword_to_news = {}
 
+        # 所有词组的关键词只编译一次，每个标题扫描一遍
+        group_words = [
+            group.get("required", []) + group.get("normal", [])
+            for group in word_groups
+        ]
+        term_matcher = None
+        if TermMatcher is not None:
+            term_matcher = TermMatcher(
+                [word for words in group_words for word in words if word]
+            )
+
         # 遍历要处理的标题
         for platform_id, titles in titles_to_process.items():
             for title in titles.keys():
-                # 对每个关键词组进行匹配
-                for group in word_groups:
-                    all_words = group.get("required", []) + group.get("normal", [])
+                found_words = term_matcher.find(title) if term_matcher else None
 
+                # 对每个关键词组进行匹配
+                for all_words in group_words:
                     for word in all_words:
-                        if word and word in title:
+                        if not word:
+                            continue
+                        if found_words is not None:
+                            matched = word in found_words
+                        else:
+                            matched = word in title
+                        if matched:
                             word_frequency[word] += 1
 
                             if word not in keyword_to_news:
@@ -396,7 +461,7 @@ class DataService:
         }
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=1800)  # 30分钟缓存
 
         return result
 
@@ -423,7 +488,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"config:{section}"
-        cached = self.cache.get(cache_key, ttl=3600)  # 1小时缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -491,7 +556,7 @@ class DataService:
             result = {}
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=3600)  # 1小时缓存
 
         return result
 
@@ -0,0 +1,717 @@
+"""
+标题关键词表服务
+
+分析和检索工具会对同一批标题反复分词。本服务按日期、按分词方式维护
+{标题: 关键词列表} 表：某天首次使用时整体计算一次，当天有新一轮爬取时只补算新标题；
+已结束的日期（早于今天）持久化为 output/<日期>/.keywords_<分词方式>.json，
+之后的历史分析直接加载，不再分词。
+
+在关键词表之上按日期维护稀疏的关键词共现矩阵（关键词对 -> 次数、标题ID倒排），
+同样只为新标题增量更新，共现分析直接从中取 TOP N 和样例标题。
+
+每天还维护一份关键词时间序列（output/<日期>/.keyword_series.json）：全天及每次
+爬取（txt 文件）的关键词计数、每个标题出现在哪些批次。趋势、生命周期、爆火检测
+和预测工具直接查表；今天的序列只解析新增的 txt 文件。
+"""
+
+import json
+import re
+from pathlib import Path
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from ..utils.errors import DataNotFoundError
+from .parser_service import (
+    PARALLEL_MIN_DAYS, PRELOAD_CACHE_SHARE, ParserService, range_preload_enabled, run_in_processes
+)
+
+# 分词规则变化时递增，旧的持久化文件随之失效
+KEYWORDS_VERSION = 1
+
+# 内存中最多保留的 (日期, 分词方式) 表数量
+MAX_CACHED_TABLES = 32
+
+SERIES_FILE = ".keyword_series.json"
+
+# 每个关键词保留的样例文档数
+SAMPLE_LIMIT = 3
+
+ANALYTICS_STOPWORDS = {
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也',
+    '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'
+}
+
+SEARCH_STOPWORDS = {
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一',
+    '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有',
+    '看', '好', '自己', '这', '那', '来', '被', '与', '为', '对', '将', '从',
+    '以', '及', '等', '但', '或', '而', '于', '中', '由', '可', '可以', '已',
+    '已经', '还', '更', '最', '再', '因为', '所以', '如果', '虽然', '然而'
+}
+
+_URL_RE = re.compile(r'http[s]?://\S+')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_SPLIT_RE = re.compile(r'[\s，。！？、]+')
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_WORD_RE = re.compile(r'[\w]+')
+
+
+def extract_analytics_keywords(title: str, min_length: int = 2) -> List[str]:
+    """
+    分析工具的关键词提取：去除URL和标点后按空白及常见分隔符切分
+
+    Args:
+        title: 标题文本
+        min_length: 最小关键词长度
+
+    Returns:
+        关键词列表
+    """
+    title = _URL_RE.sub('', title)
+    title = _PUNCT_RE.sub(' ', title)
+    words = _SPLIT_RE.split(title)
+
+    keywords = []
+    for word in words:
+        word = word.strip()
+        if word and len(word) >= min_length and word not in ANALYTICS_STOPWORDS:
+            keywords.append(word)
+    return keywords
+
+
+def extract_search_keywords(text: str, min_length: int = 2) -> List[str]:
+    """
+    检索工具的关键词提取：去除URL和方括号内容后按单词切分
+
+    Args:
+        text: 输入文本
+        min_length: 最小词长
+
+    Returns:
+        关键词列表
+    """
+    text = _URL_RE.sub('', text)
+    text = _BRACKET_RE.sub('', text)
+    words = _WORD_RE.findall(text)
+
+    return [
+        word for word in words
+        if word and len(word) >= min_length and word not in SEARCH_STOPWORDS
+    ]
+
+
+EXTRACTORS: Dict[str, Callable[[str], List[str]]] = {
+    "analytics": extract_analytics_keywords,
+    "search": extract_search_keywords,
+}
+
+
+class CooccurrenceMatrix:
+    """按标题增量维护的稀疏关键词共现矩阵
+
+    每个 (平台, 标题) 是一个文档；关键词对按字典序存储，记录共现次数和
+    包含该对的文档ID（按加入顺序）。
+
+    交给调用方后不再原地修改：有新标题时在 copy() 上更新后替换。
+    """
+
+    def __init__(self):
+        # 文档ID -> 标题
+        self.titles: List[str] = []
+        self._seen: Set[Tuple[str, str]] = set()
+        # 按首次出现顺序保存，排序稳定时与逐次重建的结果一致
+        self.pair_counts: Dict[Tuple[str, str], int] = {}
+        self.pair_docs: Dict[Tuple[str, str], List[int]] = {}
+        # 本对象独占（非与副本来源共享）的 pair_docs 列表
+        self._owned_docs: Set[Tuple[str, str]] = set()
+        self._ranked: Optional[List[Tuple[Tuple[str, str], int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def copy(self) -> "CooccurrenceMatrix":
+        """浅拷贝；pair_docs 中的列表在副本首次追加时才复制"""
+        matrix = CooccurrenceMatrix()
+        matrix.titles = list(self.titles)
+        matrix._seen = set(self._seen)
+        matrix.pair_counts = dict(self.pair_counts)
+        matrix.pair_docs = dict(self.pair_docs)
+        return matrix
+
+    def add(self, title: str, keywords: List[str]) -> None:
+        """
+        加入一个文档
+
+        Args:
+            title: 标题
+            keywords: 标题的关键词列表
+        """
+        doc_id = len(self.titles)
+        self.titles.append(title)
+        pair_counts, pair_docs, owned = self.pair_counts, self.pair_docs, self._owned_docs
+        for i, kw1 in enumerate(keywords):
+            for kw2 in keywords[i + 1:]:
+                pair = (kw1, kw2) if kw1 <= kw2 else (kw2, kw1)
+                pair_counts[pair] = pair_counts.get(pair, 0) + 1
+                if pair not in owned:
+                    pair_docs[pair] = list(pair_docs.get(pair, ()))
+                    owned.add(pair)
+                docs = pair_docs[pair]
+                if not docs or docs[-1] != doc_id:
+                    docs.append(doc_id)
+        self._ranked = None
+
+    def update(self, all_titles: Dict, day_keywords: Dict[str, List[str]]) -> int:
+        """
+        加入尚未收录的标题
+
+        Args:
+            all_titles: {platform_id: {title: info}}
+            day_keywords: 当天的关键词表
+
+        Returns:
+            新加入的文档数
+        """
+        added = 0
+        for platform_id, titles in all_titles.items():
+            for title in titles:
+                key = (platform_id, title)
+                if key in self._seen:
+                    continue
+                self._seen.add(key)
+                keywords = day_keywords.get(title)
+                if keywords is None:
+                    keywords = extract_analytics_keywords(title)
+                self.add(title, keywords)
+                added += 1
+        return added
+
+    def top_pairs(self, min_frequency: int, top_n: int) -> List[Tuple[Tuple[str, str], int]]:
+        """
+        获取共现次数最高的关键词对
+
+        Args:
+            min_frequency: 最小共现次数
+            top_n: 返回数量
+
+        Returns:
+            [((关键词1, 关键词2), 次数)]，按次数从高到低
+        """
+        if self._ranked is None:
+            self._ranked = sorted(self.pair_counts.items(), key=lambda x: x[1], reverse=True)
+        result = []
+        for pair, count in self._ranked:
+            if count < min_frequency or len(result) >= top_n:
+                break
+            result.append((pair, count))
+        return result
+
+    def sample_titles(self, pair: Tuple[str, str], limit: int = 3) -> List[str]:
+        """获取同时包含一对关键词的前 limit 个标题（同一标题出现在多个平台时只取一次）"""
+        samples: List[str] = []
+        for doc_id in self.pair_docs.get(pair, ()):
+            title = self.titles[doc_id]
+            if title not in samples:
+                samples.append(title)
+                if len(samples) >= limit:
+                    break
+        return samples
+
+
+class DayKeywordSeries:
+    """某天的关键词计数与按爬取批次的时间序列
+
+    文档为 (平台, 标题)，与 read_all_titles_for_date 合并后的结果一一对应，
+    并按其遍历顺序（平台首次出现顺序、平台内标题首次出现顺序）编号，
+    因此计数的插入顺序和样例与逐条遍历的结果一致。
+
+    交给调用方后不再原地修改：有新批次时在 copy() 上加入后替换。
+    """
+
+    def __init__(self):
+        # 已处理的 txt 文件名，下标即批次号
+        self.files: List[str] = []
+        self.docs: List[Tuple[str, str]] = []
+        # 文档ID -> 出现的批次号
+        self.doc_crawls: List[List[int]] = []
+        # 全天: 关键词 -> 文档数（标题内重复的关键词按次数计）
+        self.keyword_counts: Dict[str, int] = {}
+        # 关键词 -> 前 SAMPLE_LIMIT 个文档ID
+        self.keyword_samples: Dict[str, List[int]] = {}
+        # 每批次: 关键词 -> 文档数
+        self.crawl_counts: List[Dict[str, int]] = []
+        self._doc_ids: Dict[Tuple[str, str], int] = {}
+        self._platform_rank: Dict[str, int] = {}
+        self._doc_keywords: Dict[int, List[str]] = {}
+        self._lowered: Optional[List[str]] = None
+
+    def copy(self) -> "DayKeywordSeries":
+        """浅拷贝；内层列表与原序列共享，add_crawls 首次追加时才复制"""
+        series = DayKeywordSeries()
+        series.files = list(self.files)
+        series.docs = list(self.docs)
+        series.doc_crawls = list(self.doc_crawls)
+        series.keyword_counts = dict(self.keyword_counts)
+        series.keyword_samples = dict(self.keyword_samples)
+        series.crawl_counts = list(self.crawl_counts)
+        series._doc_ids = dict(self._doc_ids)
+        series._platform_rank = dict(self._platform_rank)
+        series._doc_keywords = dict(self._doc_keywords)
+        return series
+
+    @classmethod
+    def load(cls, path) -> Optional["DayKeywordSeries"]:
+        """从文件加载，文件不存在或版本不符时返回 None"""
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") != KEYWORDS_VERSION:
+                return None
+            series = cls()
+            series.files = state["files"]
+            series.docs = [tuple(doc) for doc in state["docs"]]
+            series.doc_crawls = state["doc_crawls"]
+            series.keyword_counts = state["keyword_counts"]
+            series.keyword_samples = state["keyword_samples"]
+            series.crawl_counts = state["crawl_counts"]
+            series._doc_ids = {doc: i for i, doc in enumerate(series.docs)}
+            for platform_id, _ in series.docs:
+                series._platform_rank.setdefault(platform_id, len(series._platform_rank))
+            return series
+        except Exception as e:
+            print(f"Warning: 读取关键词时间序列 {path} 失败，重新统计: {e}")
+            return None
+
+    def save(self, path) -> None:
+        """写入文件"""
+        try:
+            content = json.dumps(
+                {
+                    "version": KEYWORDS_VERSION,
+                    "files": self.files,
+                    "docs": self.docs,
+                    "doc_crawls": self.doc_crawls,
+                    "keyword_counts": self.keyword_counts,
+                    "keyword_samples": self.keyword_samples,
+                    "crawl_counts": self.crawl_counts,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            tmp_path.replace(path)
+        except Exception as e:
+            print(f"Warning: 保存关键词时间序列 {path} 失败: {e}")
+
+    def _keywords_of(self, doc_id: int) -> List[str]:
+        keywords = self._doc_keywords.get(doc_id)
+        if keywords is None:
+            keywords = self._doc_keywords[doc_id] = extract_analytics_keywords(self.docs[doc_id][1])
+        return keywords
+
+    def add_crawls(self, crawls: List[Tuple[str, Dict]]) -> None:
+        """
+        按时间顺序加入爬取批次
+
+        Args:
+            crawls: [(txt 文件名, {platform_id: {title: info}})]
+        """
+        pending: Dict[Tuple[str, str], int] = {}
+        # 本次调用中已复制（或新建）的 doc_crawls 列表，其余可能与副本来源共享
+        owned: Set[int] = set()
+        crawl_keys = []
+        for file_name, titles_by_id in crawls:
+            keys = []
+            for platform_id, titles in titles_by_id.items():
+                self._platform_rank.setdefault(platform_id, len(self._platform_rank))
+                for title in titles:
+                    key = (platform_id, title)
+                    if key not in self._doc_ids and key not in pending:
+                        pending[key] = len(pending)
+                    keys.append(key)
+            crawl_keys.append((file_name, keys))
+
+        # 新文档按平台首次出现顺序、平台内按首次出现顺序编号
+        for key in sorted(pending, key=lambda k: (self._platform_rank[k[0]], pending[k])):
+            doc_id = len(self.docs)
+            self.docs.append(key)
+            self.doc_crawls.append([])
+            owned.add(doc_id)
+            self._doc_ids[key] = doc_id
+            for kw in self._keywords_of(doc_id):
+                self.keyword_counts[kw] = self.keyword_counts.get(kw, 0) + 1
+                samples = self.keyword_samples.get(kw, [])
+                if len(samples) < SAMPLE_LIMIT:
+                    self.keyword_samples[kw] = samples + [doc_id]
+
+        for file_name, keys in crawl_keys:
+            crawl_index = len(self.files)
+            self.files.append(file_name)
+            counts: Dict[str, int] = {}
+            for key in keys:
+                doc_id = self._doc_ids[key]
+                if doc_id not in owned:
+                    self.doc_crawls[doc_id] = list(self.doc_crawls[doc_id])
+                    owned.add(doc_id)
+                self.doc_crawls[doc_id].append(crawl_index)
+                for kw in self._keywords_of(doc_id):
+                    counts[kw] = counts.get(kw, 0) + 1
+            self.crawl_counts.append(counts)
+
+        self._lowered = None
+
+    def crawl_labels(self) -> List[str]:
+        """各批次的时间标签（HH:MM），取自 txt 文件名"""
+        labels = []
+        for file_name in self.files:
+            match = re.match(r'(\d{1,2})\D+(\d{1,2})', file_name)
+            labels.append(
+                f"{int(match.group(1)):02d}:{int(match.group(2)):02d}" if match else file_name
+            )
+        return labels
+
+    def topic_docs(self, topic: str) -> List[int]:
+        """标题包含话题（不区分大小写）的文档ID"""
+        if self._lowered is None:
+            self._lowered = [title.lower() for _, title in self.docs]
+        topic = topic.lower()
+        return [doc_id for doc_id, title in enumerate(self._lowered) if topic in title]
+
+    def docs_by_crawl(self, doc_ids: List[int]) -> List[List[int]]:
+        """把文档按出现的批次分组，返回每个批次中的文档ID"""
+        grouped: List[List[int]] = [[] for _ in self.files]
+        for doc_id in doc_ids:
+            for crawl_index in self.doc_crawls[doc_id]:
+                grouped[crawl_index].append(doc_id)
+        return grouped
+
+    def titles_of(self, doc_ids: List[int], limit: int = SAMPLE_LIMIT) -> List[str]:
+        """文档ID对应的前 limit 个标题"""
+        return [self.docs[doc_id][1] for doc_id in doc_ids[:limit]]
+
+    def keyword_titles(self, keyword: str) -> List[str]:
+        """关键词的样例标题"""
+        return self.titles_of(self.keyword_samples.get(keyword, []))
+
+
+class KeywordService:
+    """按日期缓存的标题关键词表"""
+
+    def __init__(self, parser):
+        """
+        初始化关键词表服务
+
+        Args:
+            parser: ParserService 实例，用于读取标题和定位日期目录
+        """
+        self.parser = parser
+        # {(日期, 分词方式): {标题: 关键词列表}}
+        self._tables: "OrderedDict[tuple, Dict[str, List[str]]]" = OrderedDict()
+        # {日期: CooccurrenceMatrix}
+        self._matrices: "OrderedDict[str, CooccurrenceMatrix]" = OrderedDict()
+        # {日期: DayKeywordSeries}
+        self._series: "OrderedDict[str, DayKeywordSeries]" = OrderedDict()
+        # 内存中与磁盘文件一致的已结束日期；当天建立的表跨过零点后需补写一次
+        self._saved_tables: Set[tuple] = set()
+        self._saved_series: Set[str] = set()
+        self._lock = Lock()
+        self._series_lock = Lock()
+
+    def _table_path(self, date: datetime, kind: str):
+        return self.parser._find_date_directory(date) / f".keywords_{kind}.json"
+
+    def _load_table(self, date: datetime, kind: str) -> Dict[str, List[str]]:
+        path = self._table_path(date, kind)
+        if not path.exists():
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") != KEYWORDS_VERSION:
+                return {}
+            return state["keywords"]
+        except Exception as e:
+            print(f"Warning: 读取关键词表 {path} 失败，重新分词: {e}")
+            return {}
+
+    def _save_table(self, date: datetime, kind: str, table: Dict[str, List[str]]) -> None:
+        path = self._table_path(date, kind)
+        try:
+            content = json.dumps(
+                {"version": KEYWORDS_VERSION, "keywords": table},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            tmp_path.replace(path)
+        except Exception as e:
+            print(f"Warning: 保存关键词表 {path} 失败: {e}")
+
+    def get_day_keywords(self, date: datetime = None, kind: str = "analytics") -> Dict[str, List[str]]:
+        """
+        获取某天全部标题的关键词表
+
+        Args:
+            date: 日期对象，默认为今天
+            kind: 分词方式，analytics 或 search
+
+        Returns:
+            {标题: 关键词列表}，覆盖该日期所有平台的标题；该日期无数据时为空字典。
+            返回的列表为共享对象，调用方不应修改
+        """
+        extractor = EXTRACTORS[kind]
+        if date is None:
+            date = datetime.now()
+        date_str = self.parser.get_date_folder_name(date)
+        closed = date.date() < datetime.now().date()
+
+        try:
+            all_titles, _, _ = self.parser.read_all_titles_for_date(date)
+        except DataNotFoundError:
+            return {}
+
+        key = (date_str, kind)
+        with self._lock:
+            table = self._tables.get(key)
+            saved = key in self._saved_tables
+        if table is None:
+            table = self._load_table(date, kind) if closed else {}
+            saved = closed
+
+        # 只为尚未分词的标题（新一轮爬取或首次加载）计算关键词
+        missing = {
+            title
+            for titles in all_titles.values()
+            for title in titles
+            if title not in table
+        }
+        if missing:
+            table = dict(table)
+            for title in missing:
+                table[title] = extractor(title)
+        if closed and (missing or not saved):
+            self._save_table(date, kind, table)
+            saved = True
+
+        with self._lock:
+            self._tables[key] = table
+            self._tables.move_to_end(key)
+            if saved:
+                self._saved_tables.add(key)
+            while len(self._tables) > MAX_CACHED_TABLES:
+                evicted, _ = self._tables.popitem(last=False)
+                self._saved_tables.discard(evicted)
+        return table
+
+    def get_day_cooccurrence(self, date: datetime = None) -> CooccurrenceMatrix:
+        """
+        获取某天的关键词共现矩阵（analytics 分词），有新标题时增量更新
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            CooccurrenceMatrix 实例；该日期无数据时为空矩阵。
+            返回的实例不会再被修改，可以在不加锁的情况下读取
+        """
+        if date is None:
+            date = datetime.now()
+        date_str = self.parser.get_date_folder_name(date)
+
+        try:
+            all_titles, _, _ = self.parser.read_all_titles_for_date(date)
+        except DataNotFoundError:
+            return CooccurrenceMatrix()
+
+        # 标题只增不减，文档数不变即没有新标题
+        total = sum(len(titles) for titles in all_titles.values())
+        with self._lock:
+            current = self._matrices.get(date_str)
+            if current is not None and len(current) == total:
+                self._matrices.move_to_end(date_str)
+                return current
+
+        day_keywords = self.get_day_keywords(date, "analytics")
+        with self._lock:
+            current = self._matrices.get(date_str)
+            if current is not None and len(current) >= total:
+                # 其他线程已更新到相同或更新的数据
+                self._matrices.move_to_end(date_str)
+                return current
+            # 已交出的矩阵可能正被其他线程读取，在副本上更新后替换
+            matrix = current.copy() if current is not None else CooccurrenceMatrix()
+        matrix.update(all_titles, day_keywords)
+
+        with self._lock:
+            # 仅在缓存仍是本次读取的矩阵时替换，避免用旧数据覆盖其他线程的更新
+            if self._matrices.get(date_str) is current:
+                self._matrices[date_str] = matrix
+                self._matrices.move_to_end(date_str)
+                while len(self._matrices) > MAX_CACHED_TABLES:
+                    self._matrices.popitem(last=False)
+        return matrix
+
+    def get_day_series(self, date: datetime = None) -> Optional[DayKeywordSeries]:
+        """
+        获取某天的关键词时间序列，有新的 txt 文件时增量更新
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            DayKeywordSeries 实例，该日期无数据时返回 None。
+            返回的实例不会再被修改，可以在不加锁的情况下读取
+        """
+        if date is None:
+            date = datetime.now()
+        date_str = self.parser.get_date_folder_name(date)
+        closed = date.date() < datetime.now().date()
+
+        txt_dir = self.parser._find_date_directory(date) / "txt"
+        if not txt_dir.exists():
+            # 没有 txt 目录（如仅有历史库数据）时整天作为一个批次，不持久化
+            try:
+                all_titles, _, _ = self.parser.read_all_titles_for_date(date)
+            except DataNotFoundError:
+                return None
+            series = DayKeywordSeries()
+            series.add_crawls([(date_str, all_titles)])
+            return series
+
+        txt_files = sorted(path.name for path in txt_dir.glob("*.txt"))
+        series_path = txt_dir.parent / SERIES_FILE
+
+        with self._series_lock:
+            series = self._series.get(date_str)
+            saved = date_str in self._saved_series
+            if series is None and closed:
+                series = DayKeywordSeries.load(series_path)
+                saved = series is not None
+            if series is None or series.files != txt_files[:len(series.files)]:
+                series = DayKeywordSeries()
+                saved = False
+
+            new_files = txt_files[len(series.files):]
+            if new_files:
+                # 已交出的序列可能正被其他线程读取，在副本上加入后替换
+                if series is self._series.get(date_str):
+                    series = series.copy()
+                crawls = []
+                for file_name in new_files:
+                    try:
+                        titles_by_id, _ = self.parser.parse_txt_file(txt_dir / file_name)
+                    except Exception as e:
+                        print(f"Warning: 解析文件 {file_name} 失败: {e}")
+                        titles_by_id = {}
+                    crawls.append((file_name, titles_by_id))
+                series.add_crawls(crawls)
+                saved = False
+            if closed and not saved:
+                series.save(series_path)
+                saved = True
+
+            self._remember_series(date_str, series)
+            if saved:
+                self._saved_series.add(date_str)
+
+        return series if series.docs else None
+
+    def _remember_series(self, date_str: str, series: DayKeywordSeries) -> None:
+        """放入内存（调用方持有 _series_lock）"""
+        self._series[date_str] = series
+        self._series.move_to_end(date_str)
+        while len(self._series) > MAX_CACHED_TABLES:
+            evicted, _ = self._series.popitem(last=False)
+            self._saved_series.discard(evicted)
+
+    def preload_series(self, start_date: datetime, end_date: datetime) -> int:
+        """
+        在进程池中并行构建区间内已结束日期的时间序列（尚未持久化或已过期的）
+
+        从开始日期起最多处理内存上限 PRELOAD_CACHE_SHARE 的日期，
+        其余日期由逐日读取加载，不会在用到前被淘汰。
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            并行构建的日期数，未开启预加载时为 0
+        """
+        if not range_preload_enabled():
+            return 0
+
+        today = datetime.now().date()
+        max_days = int(MAX_CACHED_TABLES * PRELOAD_CACHE_SHARE)
+        cold = []
+        current_date = start_date
+        days = 0
+        while current_date <= end_date and current_date.date() < today and days < max_days:
+            days += 1
+            date_str = self.parser.get_date_folder_name(current_date)
+            txt_dir = self.parser._find_date_directory(current_date) / "txt"
+            with self._series_lock:
+                cached = date_str in self._series
+            if not cached and txt_dir.exists():
+                txt_files = sorted(path.name for path in txt_dir.glob("*.txt"))
+                series = DayKeywordSeries.load(txt_dir.parent / SERIES_FILE)
+                if series is not None and series.files == txt_files:
+                    with self._series_lock:
+                        self._remember_series(date_str, series)
+                        self._saved_series.add(date_str)
+                elif txt_files:
+                    cold.append((date_str, txt_dir, txt_files))
+            current_date += timedelta(days=1)
+
+        if len(cold) < PARALLEL_MIN_DAYS:
+            return 0
+
+        results = run_in_processes(
+            _build_day_series,
+            [(str(self.parser.project_root), str(txt_dir), txt_files) for _, txt_dir, txt_files in cold]
+        )
+
+        built = 0
+        for (date_str, txt_dir, _), series in zip(cold, results):
+            if series is None:
+                continue
+            series.save(txt_dir.parent / SERIES_FILE)
+            with self._series_lock:
+                self._remember_series(date_str, series)
+                self._saved_series.add(date_str)
+            built += 1
+        return built
+
+
+def _build_day_series(project_root: str, txt_dir: str, file_names: List[str]) -> DayKeywordSeries:
+    """
+    进程池任务：解析一天的 txt 文件并构建时间序列
+
+    Args:
+        project_root: 项目根目录
+        txt_dir: txt 目录
+        file_names: 按时间排序的文件名
+
+    Returns:
+        DayKeywordSeries 实例
+    """
+    parser = ParserService(project_root)
+    crawls = []
+    for file_name in file_names:
+        try:
+            titles_by_id, _ = parser.parse_txt_file(Path(txt_dir) / file_name)
+        except Exception as e:
+            print(f"Warning: 解析文件 {file_name} 失败: {e}")
+            titles_by_id = {}
+        crawls.append((file_name, titles_by_id))
+    series = DayKeywordSeries()
+    series.add_crawls(crawls)
+    return series
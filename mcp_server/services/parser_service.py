@@ -4,16 +4,142 @@ File Parser Service
 Provides parsing functionality for TXT format news data and YAML configuration files.
 """
 
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from threading import Lock
+from typing import Any, Callable, Dict, List, Tuple, Optional
+from datetime import datetime, timedelta
 
 import yaml
 
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
 
+try:
+    # 与爬虫共用的二进制快照格式（从项目根目录运行时可用）
+    from title_snapshot import fresh_snapshot_for, read_snapshot
+except ImportError:
+    fresh_snapshot_for = None
+    read_snapshot = None
+
+try:
+    # 爬虫写入的 SQLite 历史库（可选）
+    from history_store import HistoryStore
+except ImportError:
+    HistoryStore = None
+
+try:
+    # 按天增量维护的标题全文索引
+    from search_index import update_day_index
+except ImportError:
+    update_day_index = None
+
+try:
+    # 与爬虫共用的关键词规则解析（支持整词、正则、| 多选）
+    from frequency_rules import parse_frequency_rules
+except ImportError:
+    parse_frequency_rules = None
+
+# 日期缓存不按时间过期：过去的日期不再变化，今天的缓存按 txt 文件签名校验
+DAY_CACHE_TTL = float("inf")
+
+# 区间预加载：未缓存的日期数达到该值时才使用进程池
+PARALLEL_MIN_DAYS = 2
+
+# 区间预加载的进程池大小，0 或 None 表示 CPU 核数；为 1 时不预加载，逐日读取。
+# 默认关闭：每天的解析结果要序列化传回服务进程，单核上比逐日读取更慢（0.66x），
+# 多核上的加速尚未实测（config.yaml 中 mcp.range_load_workers）
+RANGE_LOAD_WORKERS = 1
+
+# 一次预加载最多占用日期缓存上限（条目数、字节数）的比例，
+# 超出的日期留给逐日读取，避免预加载的日期在用到前被淘汰
+PRELOAD_CACHE_SHARE = 0.5
+
+# 整个服务共用一个进程池，首次使用时创建
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = Lock()
+
+
+def _range_load_workers() -> int:
+    return RANGE_LOAD_WORKERS or os.cpu_count() or 1
+
+
+def range_preload_enabled() -> bool:
+    """区间预加载是否开启（进程池多于 1 个进程）"""
+    return _range_load_workers() > 1
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    获取共用进程池
+
+    子进程以 spawn 方式启动，不继承服务进程中的锁和线程状态；
+    启动时导入一次模块，之后在各次查询间复用。
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=_range_load_workers(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """关闭共用进程池（下次使用时重新创建）"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def run_in_processes(func: Callable, args_list: List[tuple]) -> List[Any]:
+    """
+    在共用进程池中并行执行 func(*args)（解析是 CPU 密集的字符串处理，线程无法并行）
+
+    Args:
+        func: 模块级函数，子进程按模块路径导入
+        args_list: 参数元组列表
+
+    Returns:
+        与 args_list 一一对应的结果，执行失败的位置为 None
+    """
+    results: List[Any] = [None] * len(args_list)
+
+    if _range_load_workers() <= 1 or len(args_list) <= 1:
+        for i, args in enumerate(args_list):
+            try:
+                results[i] = func(*args)
+            except Exception as e:
+                print(f"Warning: 任务执行失败: {e}")
+        return results
+
+    try:
+        pool = _get_process_pool()
+        futures = [pool.submit(func, *args) for args in args_list]
+    except BrokenProcessPool:
+        # 子进程异常退出后进程池不可再用，丢弃后由调用方按原方式读取
+        shutdown_process_pool()
+        print("Warning: 进程池不可用，改为逐日读取")
+        return results
+
+    for i, future in enumerate(futures):
+        try:
+            results[i] = future.result()
+        except BrokenProcessPool:
+            shutdown_process_pool()
+            print("Warning: 进程池不可用，改为逐日读取")
+            break
+        except Exception as e:
+            print(f"Warning: 并行任务执行失败: {e}")
+    return results
+
 
 class ParserService:
     """File parser service class"""
@@ -35,6 +161,13 @@ class ParserService:
         # Initialize cache service
         self.cache = get_cache()
 
+        # SQLite 历史库，首次使用时打开（工具调用在线程池中并发执行，打开时加锁）
+        self._history_store = None
+        self._history_lock = Lock()
+
+        # 全文索引 {日期: (txt 文件签名, DaySearchIndex)}
+        self._search_indexes = {}
+
     @staticmethod
     def clean_title(title: str) -> str:
         """
@@ -70,6 +203,16 @@ class ParserService:
         if not file_path.exists():
             raise FileParseError(str(file_path), "文件不存在")
 
+        # 优先读取同批写入的二进制快照，避免逐行解析txt
+        if fresh_snapshot_for is not None:
+            snap_path = fresh_snapshot_for(file_path)
+            if snap_path is not None:
+                try:
+                    titles_by_id, id_to_name, _ = read_snapshot(snap_path)
+                    return titles_by_id, id_to_name
+                except Exception as e:
+                    print(f"Warning: 读取快照 {snap_path} 失败，改为解析txt: {e}")
+
         titles_by_id = {}
         id_to_name = {}
 
@@ -143,6 +286,133 @@ class ParserService:
 
         return titles_by_id, id_to_name
 
+    def get_history_store(self):
+        """
+        获取 SQLite 历史库（不存在或不可用时返回 None）
+
+        Returns:
+            HistoryStore 实例或 None
+        """
+        if self._history_store is None and HistoryStore is not None:
+            with self._history_lock:
+                db_path = self._history_db_path()
+                if self._history_store is None and db_path.exists():
+                    try:
+                        self._history_store = HistoryStore(str(db_path))
+                    except Exception as e:
+                        print(f"Warning: 打开历史库失败，改为读取txt: {e}")
+        return self._history_store
+
+    def _history_db_path(self) -> Path:
+        """
+        历史库路径：与 main.py 相同，读取 config.yaml 中的 history.db_path
+
+        Returns:
+            数据库文件路径（相对路径按项目根目录解析）
+        """
+        db_path = "output/history.db"
+        try:
+            history_config = (self.parse_yaml_config() or {}).get("history") or {}
+            db_path = history_config.get("db_path") or db_path
+        except FileParseError:
+            pass
+        return self.project_root / db_path
+
+    def _history_covers_date(self, date: datetime = None) -> bool:
+        """
+        判断历史库是否恰好包含该日期的全部抓取（库中抓取时间与 txt 文件名一一对应）
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            是否可以直接从历史库读取
+        """
+        store = self.get_history_store()
+        if store is None:
+            return False
+
+        recorded = store.get_crawl_times(self.get_date_folder_name(date))
+        if not recorded:
+            return False
+
+        txt_dir = self._find_date_directory(date) / "txt"
+        if not txt_dir.exists():
+            # txt 已删除，历史库是该日期唯一的数据来源
+            return True
+        return sorted(f.stem for f in txt_dir.glob("*.txt")) == recorded
+
+    def search_titles(
+        self,
+        keyword: str,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None
+    ) -> Optional[List[Dict]]:
+        """
+        通过历史库按关键词搜索日期范围内的标题
+
+        Args:
+            keyword: 搜索关键词（不区分大小写的子串匹配）
+            start_date: 开始日期
+            end_date: 结束日期
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            匹配结果列表（每个日期/平台/标题一条），
+            历史库不可用或未覆盖该范围时返回 None，调用方应回退到逐日读取
+        """
+        store = self.get_history_store()
+        if store is None:
+            return None
+
+        current_date = start_date
+        while current_date <= end_date:
+            txt_dir = self._find_date_directory(current_date) / "txt"
+            if txt_dir.exists() and not self._history_covers_date(current_date):
+                return None
+            current_date += timedelta(days=1)
+
+        return store.search_titles(
+            keyword,
+            self.get_date_folder_name(start_date),
+            self.get_date_folder_name(end_date),
+            platform_ids
+        )
+
+    def get_search_index(self, date: datetime = None):
+        """
+        获取指定日期的全文索引，txt 文件有增加或改写时增量更新（改写时重建）
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            DaySearchIndex 实例，索引模块不可用或该日期无数据时返回 None
+        """
+        if update_day_index is None:
+            return None
+
+        date_dir = self._find_date_directory(date)
+        txt_dir = date_dir / "txt"
+        if not txt_dir.exists():
+            return None
+
+        date_str = self.get_date_folder_name(date)
+        signature = self._txt_file_signature(txt_dir)
+        cached = self._search_indexes.get(date_str)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        try:
+            index = update_day_index(date_dir, self.parse_txt_file)
+        except Exception as e:
+            print(f"Warning: 更新全文索引失败，改为逐条匹配: {e}")
+            return None
+
+        self._search_indexes[date_str] = (signature, index)
+        return index
+
     def get_date_folder_name(self, date: datetime = None) -> str:
         """
         获取日期文件夹名称
@@ -192,6 +462,152 @@ class ParserService:
         # Neither found, return new format path (will be used for creation or error message)
         return new_path
 
+    @staticmethod
+    def _txt_file_signature(txt_dir: Path) -> Dict[str, Tuple[int, int]]:
+        """
+        获取 txt 目录的文件签名，用于校验日期缓存
+
+        Args:
+            txt_dir: txt 目录
+
+        Returns:
+            {文件名: (mtime_ns, 文件大小)}，按文件名排序；目录不存在时为空
+        """
+        if not txt_dir.exists():
+            return {}
+        signature = {}
+        for txt_file in sorted(txt_dir.glob("*.txt")):
+            try:
+                stat = txt_file.stat()
+            except OSError:
+                continue
+            signature[txt_file.name] = (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    @staticmethod
+    def _day_cache_size(signature: Dict[str, Tuple[int, int]]) -> int:
+        """
+        日期缓存条目的估算字节数：txt 文件大小之和（解析结果略小于原文件），
+        不必每次写入缓存都遍历整天的数据
+
+        Args:
+            signature: _txt_file_signature 的结果
+
+        Returns:
+            估算字节数
+        """
+        return sum(size for _, size in signature.values())
+
+    def _merge_txt_files(
+        self,
+        txt_files: List[Path],
+        all_titles: Dict,
+        id_to_name: Dict,
+        all_timestamps: Dict
+    ) -> None:
+        """
+        解析 txt 文件并按顺序合并到一天的数据中（原地更新传入的字典，不修改已有的标题信息）
+
+        Args:
+            txt_files: 按时间排序的 txt 文件
+            all_titles: {platform_id: {title: info}}
+            id_to_name: {platform_id: platform_name}
+            all_timestamps: {filename: timestamp}
+        """
+        for txt_file in txt_files:
+            try:
+                titles_by_id, file_id_to_name = self.parse_txt_file(txt_file)
+
+                # 更新id_to_name
+                id_to_name.update(file_id_to_name)
+
+                # 合并标题数据
+                for platform_id, titles in titles_by_id.items():
+                    if platform_id not in all_titles:
+                        all_titles[platform_id] = {}
+                    platform_titles = all_titles[platform_id]
+
+                    for title, info in titles.items():
+                        existing = platform_titles.get(title)
+                        if existing is not None:
+                            # 合并排名（新建字典，已返回给调用方的结果保持不变）
+                            merged = existing.copy()
+                            merged["ranks"] = existing["ranks"] + info["ranks"]
+                            platform_titles[title] = merged
+                        else:
+                            platform_titles[title] = info.copy()
+
+                # 记录文件时间戳
+                all_timestamps[txt_file.name] = txt_file.stat().st_mtime
+
+            except Exception as e:
+                # 忽略单个文件的解析错误，继续处理其他文件
+                print(f"Warning: 解析文件 {txt_file} 失败: {e}")
+                continue
+
+    def preload_date_range(self, start_date: datetime, end_date: datetime) -> int:
+        """
+        在进程池中并行解析区间内尚未缓存的日期，结果写入日期缓存
+
+        之后按天调用 read_all_titles_for_date 直接命中缓存；只有一天需要解析、
+        或历史库已收录的日期仍按原方式读取。从开始日期起最多预加载占缓存上限
+        PRELOAD_CACHE_SHARE 的日期（按 txt 文件大小估算，解析结果略小于原文件），
+        其余日期由逐日读取加载，不会在用到前被淘汰。
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            并行解析的日期数，未开启预加载时为 0
+        """
+        if not range_preload_enabled():
+            return 0
+
+        today = datetime.now().date()
+        max_days = int(self.cache.max_entries * PRELOAD_CACHE_SHARE)
+        max_bytes = self.cache.max_bytes * PRELOAD_CACHE_SHARE
+        cold = []
+        cold_bytes = 0
+        current_date = start_date
+        while current_date <= end_date and len(cold) < max_days:
+            date_str = self.get_date_folder_name(current_date)
+            cache_key = f"read_all_titles:{date_str}"
+            # 只探测，不计入命中率统计
+            cached = self.cache.peek(cache_key)
+            if cached is None or not cached[2]:
+                txt_dir = self._find_date_directory(current_date) / "txt"
+                signature = self._txt_file_signature(txt_dir)
+                fresh = cached is not None and cached[0] == signature
+                if signature and not fresh and not self._history_covers_date(current_date):
+                    cold_bytes += self._day_cache_size(signature)
+                    if cold_bytes > max_bytes:
+                        break
+                    closed = current_date.date() < today
+                    cold.append((cache_key, txt_dir, signature, closed))
+            current_date += timedelta(days=1)
+
+        if len(cold) < PARALLEL_MIN_DAYS:
+            return 0
+
+        results = run_in_processes(
+            _read_txt_files,
+            [
+                (str(self.project_root), [str(txt_dir / name) for name in signature])
+                for _, txt_dir, signature, _ in cold
+            ]
+        )
+
+        loaded = 0
+        for (cache_key, _, signature, closed), result in zip(cold, results):
+            if result and result[0]:
+                self.cache.set(
+                    cache_key, (signature, result, closed),
+                    ttl=DAY_CACHE_TTL, size=self._day_cache_size(signature)
+                )
+                loaded += 1
+        return loaded
+
     def read_all_titles_for_date(
         self,
         date: datetime = None,
@@ -200,6 +616,9 @@ class ParserService:
         """
         读取指定日期的所有标题文件（带缓存）
 
+        每天只缓存一份包含全部平台的数据，指定平台时返回其过滤视图：
+        视图只引用缓存中各平台的标题字典，不重新解析也不复制，调用方不应修改。
+
         Args:
             date: 日期对象，默认为今天
             platform_ids: 平台ID列表，None表示所有平台
@@ -210,90 +629,144 @@ class ParserService:
             - id_to_name: {platform_id: platform_name}
             - all_timestamps: {filename: timestamp}
 
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        all_titles, id_to_name, all_timestamps = self._read_day(date)
+        if not platform_ids:
+            return all_titles, id_to_name, all_timestamps
+
+        wanted = set(platform_ids)
+        filtered = {
+            platform_id: titles
+            for platform_id, titles in all_titles.items()
+            if platform_id in wanted
+        }
+        if not filtered:
+            raise DataNotFoundError(
+                f"{self.get_date_folder_name(date)} 没有有效的数据",
+                suggestion="请检查数据文件格式或重新运行爬虫"
+            )
+        return filtered, id_to_name, all_timestamps
+
+    def _read_day(self, date: datetime = None) -> Tuple[Dict, Dict, Dict]:
+        """
+        读取指定日期全部平台的数据（带缓存）
+
+        过去的日期视为不可变，在其结束后缓存的数据直接返回；今天的缓存按 txt 文件列表和
+        mtime 校验，有新一轮爬取时只解析新增的文件并合并到缓存的数据中。
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组
+
         Raises:
             DataNotFoundError: 数据不存在
         """
         # 生成缓存键
         date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all_titles:{date_str}:{platform_key}"
+        cache_key = f"read_all_titles:{date_str}"
 
-        # 尝试从缓存获取
-        # 对于历史数据（非今天），使用更长的缓存时间（1小时）
-        # 对于今天的数据，使用较短的缓存时间（15分钟），因为可能有新数据
+        # 缓存值为 (txt 文件签名, 结果, 缓存时该日期是否已结束)
         is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600  # 15分钟 vs 1小时
-
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
+        closed = not is_today
+        cached = self.cache.get(cache_key)
+        if cached is not None and cached[2]:
+            return cached[1]
 
-        # 缓存未命中，读取文件
         # 使用向后兼容的目录查找方法
         date_dir = self._find_date_directory(date)
         txt_dir = date_dir / "txt"
-
+        signature = self._txt_file_signature(txt_dir)
+
+        if cached is not None:
+            cached_signature, cached_result, _ = cached
+            if cached_signature == signature:
+                if closed:
+                    self.cache.set(
+                        cache_key, (signature, cached_result, closed),
+                        ttl=DAY_CACHE_TTL, size=self._day_cache_size(signature)
+                    )
+                return cached_result
+
+            # 已缓存的文件都未变化、新文件都排在其后时，只解析新文件
+            new_names = [name for name in signature if name not in cached_signature]
+            unchanged = all(
+                signature.get(name) == file_signature
+                for name, file_signature in cached_signature.items()
+            )
+            if new_names and unchanged and (
+                not cached_signature or min(new_names) > max(cached_signature)
+            ):
+                cached_titles, cached_id_to_name, cached_timestamps = cached_result
+                all_titles = {
+                    platform_id: dict(titles) for platform_id, titles in cached_titles.items()
+                }
+                id_to_name = dict(cached_id_to_name)
+                all_timestamps = dict(cached_timestamps)
+                self._merge_txt_files(
+                    [txt_dir / name for name in new_names],
+                    all_titles, id_to_name, all_timestamps
+                )
+                result = (all_titles, id_to_name, all_timestamps)
+                self.cache.set(
+                    cache_key, (signature, result, closed),
+                    ttl=DAY_CACHE_TTL, size=self._day_cache_size(signature)
+                )
+                return result
+
+        # 缓存未命中，历史库已完整收录该日期时直接查询
+        if self._history_covers_date(date):
+            all_titles, id_to_name, all_timestamps = (
+                self.get_history_store().read_titles_for_date(date_str)
+            )
+            if all_titles:
+                result = (all_titles, id_to_name, all_timestamps)
+                # txt 已删除时没有文件大小可用，估算一次
+                self.cache.set(
+                    cache_key, (signature, result, closed),
+                    ttl=DAY_CACHE_TTL, size=self._day_cache_size(signature) or None
+                )
+                return result
+
+        # 读取txt文件
         if not txt_dir.exists():
             # 如果目录不存在，使用新格式显示错误
-            date_folder = self.get_date_folder_name(date)
             raise DataNotFoundError(
-                f"未找到 {date_folder} 的数据目录",
+                f"未找到 {date_str} 的数据目录",
                 suggestion="请先运行爬虫或检查日期是否正确"
             )
 
-        all_titles = {}
-        id_to_name = {}
-        all_timestamps = {}
-
-        # 读取所有txt文件
-        txt_files = sorted(txt_dir.glob("*.txt"))
-
-        if not txt_files:
+        if not signature:
             raise DataNotFoundError(
-                f"{date_folder} 没有数据文件",
+                f"{date_str} 没有数据文件",
                 suggestion="请等待爬虫任务完成"
             )
 
-        for txt_file in txt_files:
-            try:
-                titles_by_id, file_id_to_name = self.parse_txt_file(txt_file)
-
-                # 更新id_to_name
-                id_to_name.update(file_id_to_name)
-
-                # 合并标题数据
-                for platform_id, titles in titles_by_id.items():
-                    # 如果指定了平台过滤
-                    if platform_ids and platform_id not in platform_ids:
-                        continue
-
-                    if platform_id not in all_titles:
-                        all_titles[platform_id] = {}
-
-                    for title, info in titles.items():
-                        if title in all_titles[platform_id]:
-                            # 合并排名
-                            all_titles[platform_id][title]["ranks"].extend(info["ranks"])
-                        else:
-                            all_titles[platform_id][title] = info.copy()
-
-                # 记录文件时间戳
-                all_timestamps[txt_file.name] = txt_file.stat().st_mtime
+        all_titles = {}
+        id_to_name = {}
+        all_timestamps = {}
 
-            except Exception as e:
-                # 忽略单个文件的解析错误，继续处理其他文件
-                print(f"Warning: 解析文件 {txt_file} 失败: {e}")
-                continue
+        # 读取所有txt文件
+        self._merge_txt_files(
+            [txt_dir / name for name in signature],
+            all_titles, id_to_name, all_timestamps
+        )
 
         if not all_titles:
             raise DataNotFoundError(
-                f"{date_folder} 没有有效的数据",
+                f"{date_str} 没有有效的数据",
                 suggestion="请检查数据文件格式或重新运行爬虫"
             )
 
         # 缓存结果
         result = (all_titles, id_to_name, all_timestamps)
-        self.cache.set(cache_key, result)
+        self.cache.set(
+            cache_key, (signature, result, closed),
+            ttl=DAY_CACHE_TTL, size=self._day_cache_size(signature)
+        )
 
         return result
 
@@ -333,7 +806,7 @@ class ParserService:
             words_file: 关键词文件路径，默认为 config/frequency_words.txt
 
         Returns:
-            词组列表
+            词组列表，每组包含 required / normal / filter_words（规则原文）
 
         Raises:
             FileParseError: 文件解析错误
@@ -349,6 +822,12 @@ class ParserService:
         word_groups = []
 
         try:
+            if parse_frequency_rules is not None:
+                # 与 main.py 相同的格式：空行分组，+ 必须词，! 过滤词
+                with open(words_file, "r", encoding="utf-8") as f:
+                    word_groups, _ = parse_frequency_rules(f.read())
+                return word_groups
+
             with open(words_file, "r", encoding="utf-8") as f:
                 for line in f:
                     line = line.strip()
@@ -391,3 +870,22 @@ class ParserService:
             raise FileParseError(str(words_file), str(e))
 
         return word_groups
+
+
+def _read_txt_files(project_root: str, file_paths: List[str]) -> Tuple[Dict, Dict, Dict]:
+    """
+    进程池任务：解析一天的 txt 文件
+
+    Args:
+        project_root: 项目根目录
+        file_paths: 按时间排序的 txt 文件路径
+
+    Returns:
+        (all_titles, id_to_name, all_timestamps) 元组
+    """
+    parser = ParserService(project_root)
+    all_titles, id_to_name, all_timestamps = {}, {}, {}
+    parser._merge_txt_files(
+        [Path(path) for path in file_paths], all_titles, id_to_name, all_timestamps
+    )
+    return all_titles, id_to_name, all_timestamps
@@ -11,6 +11,7 @@ from typing import Dict, List, Optional
 from difflib import SequenceMatcher
 
 from ..services.data_service import DataService
+from ..services.keyword_service import extract_analytics_keywords
 from ..utils.validators import (
     validate_platforms,
     validate_limit,
@@ -20,58 +21,76 @@ from ..utils.validators import (
 )
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
+try:
+    # 与爬虫共用的 MinHash/LSH 近似重复标题索引
+    from title_clusters import TitleClusterIndex
+except ImportError:
+    TitleClusterIndex = None
 
-def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
-    """
-    计算新闻权重（用于排序）
+# 阈值不低于该值时用 LSH 索引挑选候选，更低的阈值仍逐条比较以免漏召回
+LSH_MIN_THRESHOLD = 0.5
 
-    基于 main.py 的权重算法实现，综合考虑：
-    - 排名权重 (60%)：新闻在榜单中的排名
-    - 频次权重 (30%)：新闻出现的次数
-    - 热度权重 (10%)：高排名出现的比例
 
-    Args:
-        news_data: 新闻数据字典，包含 ranks 和 count 字段
-        rank_threshold: 高排名阈值，默认5
+try:
+    # 与 main.py 共用的批量权重计算（可用 NumPy 时向量化）
+    from news_weight import calculate_news_weight, sort_news_by_weight
+except ImportError:
+    def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
+        """
+        计算新闻权重（用于排序）
+
+        基于 main.py 的权重算法实现，综合考虑：
+        - 排名权重 (60%)：新闻在榜单中的排名
+        - 频次权重 (30%)：新闻出现的次数
+        - 热度权重 (10%)：高排名出现的比例
+
+        Args:
+            news_data: 新闻数据字典，包含 ranks 和 count 字段
+            rank_threshold: 高排名阈值，默认5
+
+        Returns:
+            权重分数（0-100之间的浮点数）
+        """
+        ranks = news_data.get("ranks", [])
+        if not ranks:
+            return 0.0
 
-    Returns:
-        权重分数（0-100之间的浮点数）
-    """
-    ranks = news_data.get("ranks", [])
-    if not ranks:
-        return 0.0
+        count = news_data.get("count", len(ranks))
 
-    count = news_data.get("count", len(ranks))
+        # 权重配置（与 config.yaml 保持一致）
+        RANK_WEIGHT = 0.6
+        FREQUENCY_WEIGHT = 0.3
+        HOTNESS_WEIGHT = 0.1
 
-    # 权重配置（与 config.yaml 保持一致）
-    RANK_WEIGHT = 0.6
-    FREQUENCY_WEIGHT = 0.3
-    HOTNESS_WEIGHT = 0.1
+        # 1. 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+        rank_scores = []
+        for rank in ranks:
+            score = 11 - min(rank, 10)
+            rank_scores.append(score)
 
-    # 1. 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+        rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+        # 2. 频次权重：min(出现次数, 10) × 10
+        frequency_weight = min(count, 10) * 10
 
-    # 2. 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
+        # 3. 热度加成：高排名次数 / 总出现次数 × 100
+        high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
+        hotness_ratio = high_rank_count / len(ranks) if ranks else 0
+        hotness_weight = hotness_ratio * 100
 
-    # 3. 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
+        # 综合权重
+        total_weight = (
+            rank_weight * RANK_WEIGHT
+            + frequency_weight * FREQUENCY_WEIGHT
+            + hotness_weight * HOTNESS_WEIGHT
+        )
 
-    # 综合权重
-    total_weight = (
-        rank_weight * RANK_WEIGHT
-        + frequency_weight * FREQUENCY_WEIGHT
-        + hotness_weight * HOTNESS_WEIGHT
-    )
+        return total_weight
 
-    return total_weight
+    def sort_news_by_weight(items: List[Dict], rank_threshold: int = 5) -> List[Dict]:
+        """按权重原地排序（从高到低）"""
+        items.sort(key=lambda x: calculate_news_weight(x, rank_threshold), reverse=True)
+        return items
 
 
 class AnalyticsTools:
@@ -255,7 +274,7 @@ class AnalyticsTools:
             date_range: 日期范围（可选）
                        - **格式**: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
                        - **默认**: 不指定时默认分析最近7天
-            granularity: 时间粒度，仅支持 day（天）
+            granularity: 时间粒度，day（按天）或 hour（按每次爬取）
 
         Returns:
             趋势分析结果字典
@@ -288,12 +307,11 @@ class AnalyticsTools:
             # 验证参数
             topic = validate_keyword(topic)
 
-            # 验证粒度参数（只支持day）
-            if granularity != "day":
-                from ..utils.errors import InvalidParameterError
+            # 验证粒度参数
+            if granularity not in ("day", "hour"):
                 raise InvalidParameterError(
                     f"不支持的粒度参数: {granularity}",
-                    suggestion="当前仅支持 'day' 粒度，因为底层数据按天聚合"
+                    suggestion="支持 'day'（按天）和 'hour'（按每次爬取）"
                 )
 
             # 处理日期范围（不指定时默认最近7天）
@@ -306,38 +324,44 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
+            # 多天查询时并行预加载未缓存的日期
+            self.data_service.keywords.preload_series(start_date, end_date)
+
             # 收集趋势数据
             trend_data = []
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
+                date_str = current_date.strftime("%Y-%m-%d")
+                series = self.data_service.keywords.get_day_series(current_date)
+
+                if series is None:
+                    # 按小时统计时没有数据的日期没有爬取批次
+                    if granularity == "day":
+                        trend_data.append({
+                            "date": date_str,
+                            "count": 0,
+                            "sample_titles": []
+                        })
+                else:
                     # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
-
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
+                    matched = series.topic_docs(topic)
 
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
+                    if granularity == "day":
+                        trend_data.append({
+                            "date": date_str,
+                            "count": len(matched),
+                            "sample_titles": series.titles_of(matched)  # 只保留前3个样本
+                        })
+                    else:
+                        for label, crawl_matched in zip(
+                            series.crawl_labels(), series.docs_by_crawl(matched)
+                        ):
+                            trend_data.append({
+                                "date": f"{date_str} {label}",
+                                "count": len(crawl_matched),
+                                "sample_titles": series.titles_of(crawl_matched)
+                            })
 
                 # 按天增加时间
                 current_date += timedelta(days=1)
@@ -440,6 +464,9 @@ class AnalyticsTools:
             else:
                 start_date = end_date = datetime.now()
 
+            # 多天查询时并行预加载未缓存的日期
+            self.data_service.parser.preload_date_range(start_date, end_date)
+
             # 收集各平台数据
             platform_stats = defaultdict(lambda: {
                 "total_news": 0,
@@ -455,6 +482,7 @@ class AnalyticsTools:
                     all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
                         date=current_date
                     )
+                    day_keywords = self._get_day_keywords(current_date)
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -468,7 +496,7 @@ class AnalyticsTools:
                                 platform_stats[platform_name]["topic_mentions"] += 1
 
                             # 提取关键词（简单分词）
-                            keywords = self._extract_keywords(title)
+                            keywords = self._extract_keywords(title, day_keywords=day_keywords)
                             platform_stats[platform_name]["top_keywords"].update(keywords)
 
                 except DataNotFoundError:
@@ -557,53 +585,20 @@ class AnalyticsTools:
             min_frequency = validate_limit(min_frequency, default=3, max_limit=100)
             top_n = validate_top_n(top_n, default=20)
 
-            # 读取今天的数据
-            all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+            # 读取今天的数据（无数据时抛出 DataNotFoundError）
+            self.data_service.parser.read_all_titles_for_date()
 
-            # 关键词共现统计
-            cooccurrence = Counter()
-            keyword_titles = defaultdict(list)
-
-            for platform_id, titles in all_titles.items():
-                for title in titles.keys():
-                    # 提取关键词
-                    keywords = self._extract_keywords(title)
-
-                    # 记录每个关键词出现的标题
-                    for kw in keywords:
-                        keyword_titles[kw].append(title)
-
-                    # 计算两两共现
-                    if len(keywords) >= 2:
-                        for i, kw1 in enumerate(keywords):
-                            for kw2 in keywords[i+1:]:
-                                # 统一排序，避免重复
-                                pair = tuple(sorted([kw1, kw2]))
-                                cooccurrence[pair] += 1
-
-            # 过滤低频共现
-            filtered_pairs = [
-                (pair, count) for pair, count in cooccurrence.items()
-                if count >= min_frequency
-            ]
-
-            # 排序并取TOP N
-            top_pairs = sorted(filtered_pairs, key=lambda x: x[1], reverse=True)[:top_n]
+            # 当天的共现矩阵只为新标题增量更新
+            matrix = self.data_service.keywords.get_day_cooccurrence()
 
             # 构建结果
             result_pairs = []
-            for (kw1, kw2), count in top_pairs:
-                # 找出同时包含两个关键词的标题样本
-                titles_with_both = [
-                    title for title in keyword_titles[kw1]
-                    if kw2 in self._extract_keywords(title)
-                ]
-
+            for (kw1, kw2), count in matrix.top_pairs(min_frequency, top_n):
                 result_pairs.append({
                     "keyword1": kw1,
                     "keyword2": kw2,
                     "cooccurrence_count": count,
-                    "sample_titles": titles_with_both[:3]
+                    "sample_titles": matrix.sample_titles((kw1, kw2), 3)
                 })
 
             return {
@@ -691,6 +686,9 @@ class AnalyticsTools:
                 # 默认今天
                 start_date = end_date = datetime.now()
 
+            # 多天查询时并行预加载未缓存的日期
+            self.data_service.parser.preload_date_range(start_date, end_date)
+
             # 收集新闻数据（支持多天）
             all_news_items = []
             current_date = start_date
@@ -755,10 +753,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                deduplicated_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                sort_news_by_weight(deduplicated_news)
 
             # 限制返回数量
             selected_news = deduplicated_news[:limit]
@@ -956,6 +951,14 @@ class AnalyticsTools:
             # 读取数据
             all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date()
 
+            # 只对与参考标题共享 LSH 分桶的标题计算相似度
+            candidate_keys = None
+            if TitleClusterIndex is not None and threshold >= LSH_MIN_THRESHOLD:
+                index = self._get_title_cluster_index(all_titles)
+                candidate_keys = {
+                    index.keys[doc_id] for doc_id in index.candidates(reference_title)
+                }
+
             # 计算相似度
             similar_items = []
 
@@ -965,6 +968,8 @@ class AnalyticsTools:
                 for title, info in titles.items():
                     if title == reference_title:
                         continue
+                    if candidate_keys is not None and (platform_id, title) not in candidate_keys:
+                        continue
 
                     # 计算相似度
                     similarity = self._calculate_similarity(reference_title, title)
@@ -1116,10 +1121,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                related_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                sort_news_by_weight(related_news)
             else:
                 # 按排名排序
                 related_news.sort(key=lambda x: x["rank"])
@@ -1202,6 +1204,9 @@ class AnalyticsTools:
                     end_date = datetime.now()
                     start_date = end_date - timedelta(days=6)
 
+            # 多天查询时并行预加载未缓存的日期
+            self.data_service.parser.preload_date_range(start_date, end_date)
+
             # 收集数据
             all_keywords = Counter()
             all_platforms_news = defaultdict(int)
@@ -1213,6 +1218,7 @@ class AnalyticsTools:
                     all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
                         date=current_date
                     )
+                    day_keywords = self._get_day_keywords(current_date)
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -1226,7 +1232,7 @@ class AnalyticsTools:
                             })
 
                             # 提取关键词
-                            keywords = self._extract_keywords(title)
+                            keywords = self._extract_keywords(title, day_keywords=day_keywords)
                             all_keywords.update(keywords)
 
                 except DataNotFoundError:
@@ -1371,6 +1377,9 @@ class AnalyticsTools:
             else:
                 start_date = end_date = datetime.now()
 
+            # 多天查询时并行预加载未缓存的日期
+            self.data_service.parser.preload_date_range(start_date, end_date)
+
             # 统计各平台活跃度
             platform_activity = defaultdict(lambda: {
                 "total_updates": 0,
@@ -1507,32 +1516,19 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
+            # 多天查询时并行预加载未缓存的日期
+            self.data_service.keywords.preload_series(start_date, end_date)
+
             # 收集话题历史数据
             lifecycle_data = []
             current_date = start_date
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count
-                    })
-
-                except DataNotFoundError:
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0
-                    })
+                # 统计该日的话题出现次数
+                series = self.data_service.keywords.get_day_series(current_date)
+                lifecycle_data.append({
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "count": len(series.topic_docs(topic)) if series else 0
+                })
 
                 current_date += timedelta(days=1)
 
@@ -1659,37 +1655,15 @@ class AnalyticsTools:
 
             time_window = validate_limit(time_window, default=24, max_limit=72)
 
-            # 读取当前和之前的数据
-            current_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
-
-            # 读取昨天的数据作为基准
-            yesterday = datetime.now() - timedelta(days=1)
-            try:
-                previous_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=yesterday
-                )
-            except DataNotFoundError:
-                previous_all_titles = {}
-
-            # 统计当前的关键词频率
-            current_keywords = Counter()
-            current_keyword_titles = defaultdict(list)
+            # 当前的关键词频率
+            current_series = self._get_day_series()
+            current_keywords = current_series.keyword_counts
 
-            for _, titles in current_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    current_keywords.update(keywords)
-
-                    for kw in keywords:
-                        current_keyword_titles[kw].append(title)
-
-            # 统计之前的关键词频率
-            previous_keywords = Counter()
-
-            for _, titles in previous_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    previous_keywords.update(keywords)
+            # 昨天的关键词频率作为基准
+            previous_series = self.data_service.keywords.get_day_series(
+                datetime.now() - timedelta(days=1)
+            )
+            previous_keywords = previous_series.keyword_counts if previous_series else {}
 
             # 检测异常热度
             viral_topics = []
@@ -1715,7 +1689,7 @@ class AnalyticsTools:
                         "current_count": current_count,
                         "previous_count": previous_count,
                         "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
-                        "sample_titles": current_keyword_titles[keyword][:3],
+                        "sample_titles": current_series.keyword_titles(keyword),
                         "alert_level": "高" if growth_rate > threshold * 2 else "中"
                     })
 
@@ -1801,49 +1775,24 @@ class AnalyticsTools:
             for days_ago in range(3, 0, -1):
                 date = datetime.now() - timedelta(days=days_ago)
 
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=date
-                    )
-
-                    # 统计关键词
-                    keywords_count = Counter()
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            keywords = self._extract_keywords(title)
-                            keywords_count.update(keywords)
-
-                    # 记录每个关键词的历史数据
-                    for keyword, count in keywords_count.items():
+                # 记录每个关键词的历史数据
+                series = self.data_service.keywords.get_day_series(date)
+                if series is not None:
+                    for keyword, count in series.keyword_counts.items():
                         keyword_trends[keyword].append(count)
 
-                except DataNotFoundError:
-                    pass
-
             # 添加今天的数据
             try:
-                all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
-
-                keywords_count = Counter()
-                keyword_titles = defaultdict(list)
-
-                for _, titles in all_titles.items():
-                    for title in titles.keys():
-                        keywords = self._extract_keywords(title)
-                        keywords_count.update(keywords)
-
-                        for kw in keywords:
-                            keyword_titles[kw].append(title)
-
-                for keyword, count in keywords_count.items():
-                    keyword_trends[keyword].append(count)
-
+                today_series = self._get_day_series()
             except DataNotFoundError:
                 raise DataNotFoundError(
                     "未找到今天的数据",
                     suggestion="请等待爬虫任务完成"
                 )
 
+            for keyword, count in today_series.keyword_counts.items():
+                keyword_trends[keyword].append(count)
+
             # 预测潜力话题
             predicted_topics = []
 
@@ -1885,7 +1834,7 @@ class AnalyticsTools:
                             "confidence": round(confidence, 2),
                             "trend_data": trend_data,
                             "prediction": "上升趋势，可能成为热点",
-                            "sample_titles": keyword_titles.get(keyword, [])[:3]
+                            "sample_titles": today_series.keyword_titles(keyword)
                         })
 
             # 按置信度和增长率排序
@@ -1920,33 +1869,83 @@ class AnalyticsTools:
 
     # ==================== 辅助方法 ====================
 
-    def _extract_keywords(self, title: str, min_length: int = 2) -> List[str]:
+    def _extract_keywords(
+        self,
+        title: str,
+        min_length: int = 2,
+        day_keywords: Optional[Dict[str, List[str]]] = None
+    ) -> List[str]:
         """
         从标题中提取关键词（简单实现）
 
         Args:
             title: 标题文本
             min_length: 最小关键词长度
+            day_keywords: 标题所在日期的关键词表（见 _get_day_keywords），命中时不再分词
 
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'[^\w\s]', ' ', title)
+        if day_keywords is not None and min_length == 2:
+            keywords = day_keywords.get(title)
+            if keywords is not None:
+                return keywords
+        return extract_analytics_keywords(title, min_length)
+
+    def _get_day_keywords(self, date: datetime = None) -> Dict[str, List[str]]:
+        """
+        获取某天全部标题的关键词表（已结束的日期从磁盘加载）
+
+        Args:
+            date: 日期对象，默认为今天
 
-        # 简单分词（按空格和常见分隔符）
-        words = re.split(r'[\s，。！？、]+', title)
+        Returns:
+            {标题: 关键词列表}
+        """
+        return self.data_service.keywords.get_day_keywords(date, "analytics")
 
-        # 过滤停用词和短词
-        stopwords = {'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'}
+    def _get_day_series(self, date: datetime = None):
+        """
+        获取某天的关键词时间序列
 
-        keywords = [
-            word.strip() for word in words
-            if word.strip() and len(word.strip()) >= min_length and word.strip() not in stopwords
-        ]
+        Args:
+            date: 日期对象，默认为今天
 
-        return keywords
+        Returns:
+            DayKeywordSeries 实例
+
+        Raises:
+            DataNotFoundError: 该日期没有数据
+        """
+        series = self.data_service.keywords.get_day_series(date)
+        if series is None:
+            date_str = self.data_service.parser.get_date_folder_name(date)
+            raise DataNotFoundError(
+                f"未找到 {date_str} 的数据",
+                suggestion="请先运行爬虫或检查日期是否正确"
+            )
+        return series
+
+    def _get_title_cluster_index(self, all_titles: Dict):
+        """
+        获取当天标题的 MinHash/LSH 索引（按标题总数缓存，新一轮爬取后自动重建）
+
+        Args:
+            all_titles: {platform_id: {title: info}}
+
+        Returns:
+            TitleClusterIndex，键为 (platform_id, title)
+        """
+        total = sum(len(titles) for titles in all_titles.values())
+        cache_key = f"title_cluster_index:{datetime.now().strftime('%Y-%m-%d')}:{total}"
+        index = self.data_service.cache.get(cache_key)
+        if index is None:
+            index = TitleClusterIndex()
+            for platform_id, titles in all_titles.items():
+                for title in titles:
+                    index.add((platform_id, title), title)
+            self.data_service.cache.set(cache_key, index, ttl=900)
+        return index
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """
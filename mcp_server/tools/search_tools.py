@@ -4,13 +4,13 @@
 提供模糊搜索、链接查询、历史相关新闻检索等高级搜索功能。
 """
 
-import re
 from collections import Counter
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple
 
 from ..services.data_service import DataService
+from ..services.keyword_service import SEARCH_STOPWORDS, extract_search_keywords
 from ..utils.validators import validate_keyword, validate_limit
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
@@ -27,13 +27,7 @@ class SearchTools:
         """
         self.data_service = DataService(project_root)
         # 中文停用词列表
-        self.stopwords = {
-            '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一',
-            '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有',
-            '看', '好', '自己', '这', '那', '来', '被', '与', '为', '对', '将', '从',
-            '以', '及', '等', '但', '或', '而', '于', '中', '由', '可', '可以', '已',
-            '已经', '还', '更', '最', '再', '因为', '所以', '如果', '虽然', '然而'
-        }
+        self.stopwords = SEARCH_STOPWORDS
 
     def search_news_unified(
         self,
@@ -120,12 +114,26 @@ class SearchTools:
                 # 使用最新可用日期
                 start_date = end_date = latest
 
+            # 多天查询时并行预加载未缓存的日期
+            self.data_service.parser.preload_date_range(start_date, end_date)
+
             # 收集所有匹配的新闻
             all_matches = []
             current_date = start_date
 
             while current_date <= end_date:
                 try:
+                    # 关键词/实体模式优先走全文索引
+                    if search_mode in ("keyword", "entity"):
+                        index = self.data_service.parser.get_search_index(current_date)
+                        if index is not None:
+                            all_matches.extend(self._search_by_index(
+                                index, query, search_mode == "entity",
+                                platforms, current_date, include_url
+                            ))
+                            current_date += timedelta(days=1)
+                            continue
+
                     all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
                         date=current_date,
                         platform_ids=platforms
@@ -187,8 +195,8 @@ class SearchTools:
             if sort_by == "relevance":
                 all_matches.sort(key=lambda x: x.get("similarity_score", 1.0), reverse=True)
             elif sort_by == "weight":
-                from .analytics import calculate_news_weight
-                all_matches.sort(key=lambda x: calculate_news_weight(x), reverse=True)
+                from .analytics import sort_news_by_weight
+                sort_news_by_weight(all_matches)
             elif sort_by == "date":
                 all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
 
@@ -239,6 +247,52 @@ class SearchTools:
                 }
             }
 
+    def _search_by_index(
+        self,
+        index,
+        query: str,
+        case_sensitive: bool,
+        platforms: Optional[List[str]],
+        current_date: datetime,
+        include_url: bool
+    ) -> List[Dict]:
+        """
+        通过全文索引搜索（结果与逐条包含匹配一致）
+
+        Args:
+            index: 当天的 DaySearchIndex
+            query: 搜索关键词
+            case_sensitive: 是否区分大小写（实体模式）
+            platforms: 平台过滤列表
+            current_date: 当前日期
+            include_url: 是否包含URL链接
+
+        Returns:
+            匹配的新闻列表
+        """
+        matches = []
+        for doc in index.search(query, case_sensitive=case_sensitive, platform_ids=platforms):
+            ranks = doc["ranks"]
+            news_item = {
+                "title": doc["title"],
+                "platform": doc["platform"],
+                "platform_name": doc["platform_name"],
+                "date": current_date.strftime("%Y-%m-%d"),
+                "similarity_score": 1.0,
+                "ranks": ranks,
+                "count": len(ranks),
+                "rank": ranks[0] if ranks else 999
+            }
+
+            # 条件性添加 URL 字段
+            if include_url:
+                news_item["url"] = doc["url"]
+                news_item["mobileUrl"] = doc["mobileUrl"]
+
+            matches.append(news_item)
+
+        return matches
+
     def _search_by_keyword_mode(
         self,
         query: str,
@@ -311,13 +365,14 @@ class SearchTools:
             匹配的新闻列表
         """
         matches = []
+        day_keywords = self.data_service.keywords.get_day_keywords(current_date, "search")
 
         for platform_id, titles in all_titles.items():
             platform_name = id_to_name.get(platform_id, platform_id)
 
             for title, info in titles.items():
                 # 模糊匹配
-                is_match, similarity = self._fuzzy_match(query, title, threshold)
+                is_match, similarity = self._fuzzy_match(query, title, threshold, day_keywords)
 
                 if is_match:
                     news_item = {
@@ -402,7 +457,13 @@ class SearchTools:
         # 使用 difflib.SequenceMatcher 计算序列相似度
         return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
 
-    def _fuzzy_match(self, query: str, text: str, threshold: float = 0.3) -> Tuple[bool, float]:
+    def _fuzzy_match(
+        self,
+        query: str,
+        text: str,
+        threshold: float = 0.3,
+        day_keywords: Optional[Dict[str, List[str]]] = None
+    ) -> Tuple[bool, float]:
         """
         模糊匹配函数
 
@@ -410,6 +471,7 @@ class SearchTools:
             query: 查询文本
             text: 待匹配文本
             threshold: 匹配阈值
+            day_keywords: 待匹配文本所在日期的关键词表
 
         Returns:
             (是否匹配, 相似度分数)
@@ -425,7 +487,7 @@ class SearchTools:
 
         # 分词后的部分匹配
         query_words = set(self._extract_keywords(query))
-        text_words = set(self._extract_keywords(text))
+        text_words = set(self._extract_keywords(text, day_keywords=day_keywords))
 
         if not query_words or not text_words:
             return False, 0.0
@@ -439,31 +501,28 @@ class SearchTools:
 
         return False, similarity
 
-    def _extract_keywords(self, text: str, min_length: int = 2) -> List[str]:
+    def _extract_keywords(
+        self,
+        text: str,
+        min_length: int = 2,
+        day_keywords: Optional[Dict[str, List[str]]] = None
+    ) -> List[str]:
         """
         从文本中提取关键词
 
         Args:
             text: 输入文本
             min_length: 最小词长
+            day_keywords: 文本所在日期的关键词表，命中时不再分词
 
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        text = re.sub(r'http[s]?://\S+', '', text)
-        text = re.sub(r'\[.*?\]', '', text)  # 移除方括号内容
-
-        # 使用正则表达式分词（中文和英文）
-        words = re.findall(r'[\w]+', text)
-
-        # 过滤停用词和短词
-        keywords = [
-            word for word in words
-            if word and len(word) >= min_length and word not in self.stopwords
-        ]
-
-        return keywords
+        if day_keywords is not None and min_length == 2:
+            keywords = day_keywords.get(text)
+            if keywords is not None:
+                return keywords
+        return extract_search_keywords(text, min_length)
 
     def _calculate_keyword_overlap(self, keywords1: List[str], keywords2: List[str]) -> float:
         """
@@ -572,6 +631,9 @@ class SearchTools:
                     suggestion="请提供更详细的文本内容"
                 )
 
+            # 多天查询时并行预加载未缓存的日期
+            self.data_service.parser.preload_date_range(search_start, search_end)
+
             # 收集所有相关新闻
             all_related_news = []
             current_date = search_start
@@ -580,6 +642,7 @@ class SearchTools:
                 try:
                     # 读取该日期的数据
                     all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
+                    day_keywords = self.data_service.keywords.get_day_keywords(current_date, "search")
 
                     # 搜索相关新闻
                     for platform_id, titles in all_titles.items():
@@ -590,7 +653,7 @@ class SearchTools:
                             title_similarity = self._calculate_similarity(reference_text, title)
 
                             # 提取标题关键词
-                            title_keywords = self._extract_keywords(title)
+                            title_keywords = self._extract_keywords(title, day_keywords=day_keywords)
 
                             # 计算关键词重合度
                             keyword_overlap = self._calculate_keyword_overlap(
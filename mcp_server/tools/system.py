@@ -90,11 +90,17 @@ class SystemManagementTools:
             import json
             import time
             import random
-            import requests
             from datetime import datetime
             import pytz
             import yaml
 
+            try:
+                # 与 main.py 共用连接池（项目根目录下的 http_transport 模块）
+                from http_transport import get_transport
+                http = get_transport()
+            except ImportError:
+                import requests as http
+
             # 参数验证
             platforms = validate_platforms(platforms)
 
@@ -174,7 +180,7 @@ class SystemManagementTools:
 
                 while retries <= max_retries and not success:
                     try:
-                        response = requests.get(url, headers=headers, timeout=10)
+                        response = http.get(url, headers=headers, timeout=10)
                         response.raise_for_status()
 
                         data_text = response.text
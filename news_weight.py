@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+News Weight Engine
+
+One implementation of the news weight used to order report entries
+(main.py) and MCP search / analytics results:
+
+    rank weight      Σ(11 - min(rank, 10)) / appearances
+    frequency weight min(count, 10) × 10
+    hotness weight   appearances with rank <= rank_threshold / appearances × 100
+
+    weight = rank × RANK_WEIGHT + frequency × FREQUENCY_WEIGHT + hotness × HOTNESS_WEIGHT
+
+Weights are computed in batches: all candidates' ranks are flattened into
+one array and the per-item sums are segment reductions. NumPy is used when
+it is installed and the batch is large enough to amortise array setup;
+otherwise a pure-Python loop gives identical results.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_WEIGHT_CONFIG = {
+    "RANK_WEIGHT": 0.6,
+    "FREQUENCY_WEIGHT": 0.3,
+    "HOTNESS_WEIGHT": 0.1,
+}
+
+# Below this many items the Python loop beats building arrays
+NUMPY_MIN_BATCH = 256
+
+
+def _weights_python(
+    ranks_list: Sequence[Sequence[int]],
+    counts: Sequence[int],
+    rank_threshold: int,
+    weight_config: Dict,
+) -> List[float]:
+    rank_factor = weight_config["RANK_WEIGHT"]
+    frequency_factor = weight_config["FREQUENCY_WEIGHT"]
+    hotness_factor = weight_config["HOTNESS_WEIGHT"]
+
+    weights = []
+    for ranks, count in zip(ranks_list, counts):
+        if not ranks:
+            weights.append(0.0)
+            continue
+        appearances = len(ranks)
+        rank_weight = sum(11 - min(rank, 10) for rank in ranks) / appearances
+        frequency_weight = min(count, 10) * 10
+        hotness_weight = sum(1 for rank in ranks if rank <= rank_threshold) / appearances * 100
+        weights.append(
+            rank_weight * rank_factor
+            + frequency_weight * frequency_factor
+            + hotness_weight * hotness_factor
+        )
+    return weights
+
+
+def _weights_numpy(
+    ranks_list: Sequence[Sequence[int]],
+    counts: Sequence[int],
+    rank_threshold: int,
+    weight_config: Dict,
+) -> List[float]:
+    lengths = np.fromiter((len(ranks) for ranks in ranks_list), dtype=np.int64, count=len(ranks_list))
+    flat = np.fromiter(
+        (rank for ranks in ranks_list for rank in ranks), dtype=np.float64, count=int(lengths.sum())
+    )
+    segments = np.repeat(np.arange(len(ranks_list)), lengths)
+
+    rank_sums = np.bincount(segments, weights=11 - np.minimum(flat, 10), minlength=len(ranks_list))
+    hot_counts = np.bincount(
+        segments, weights=(flat <= rank_threshold).astype(np.float64), minlength=len(ranks_list)
+    )
+    present = lengths > 0
+    safe_lengths = np.where(present, lengths, 1)
+
+    rank_weight = rank_sums / safe_lengths
+    frequency_weight = np.minimum(np.asarray(counts, dtype=np.float64), 10) * 10
+    hotness_weight = hot_counts / safe_lengths * 100
+
+    weights = (
+        rank_weight * weight_config["RANK_WEIGHT"]
+        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
+        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+    )
+    return np.where(present, weights, 0.0).tolist()
+
+
+def calculate_weights(
+    ranks_list: Sequence[Sequence[int]],
+    counts: Sequence[int],
+    rank_threshold: int = 5,
+    weight_config: Optional[Dict] = None,
+) -> List[float]:
+    """
+    Compute the weights of a batch of news items
+
+    Args:
+        ranks_list: Ranks of each item
+        counts: Appearance count of each item
+        rank_threshold: Ranks at or above this (numerically <=) count as hot
+        weight_config: RANK_WEIGHT / FREQUENCY_WEIGHT / HOTNESS_WEIGHT,
+            defaults to DEFAULT_WEIGHT_CONFIG
+
+    Returns:
+        One weight per item, 0.0 for items without ranks
+    """
+    weight_config = weight_config or DEFAULT_WEIGHT_CONFIG
+    if np is not None and len(ranks_list) >= NUMPY_MIN_BATCH:
+        return _weights_numpy(ranks_list, counts, rank_threshold, weight_config)
+    return _weights_python(ranks_list, counts, rank_threshold, weight_config)
+
+
+def news_weights(
+    items: Sequence[Dict],
+    rank_threshold: int = 5,
+    weight_config: Optional[Dict] = None,
+) -> List[float]:
+    """
+    Compute the weights of news dicts
+
+    Args:
+        items: Dicts with "ranks" and optionally "count" (defaults to the
+            number of ranks)
+        rank_threshold: See calculate_weights
+        weight_config: See calculate_weights
+
+    Returns:
+        One weight per item
+    """
+    ranks_list = [item.get("ranks") or [] for item in items]
+    counts = [
+        item.get("count", len(ranks)) for item, ranks in zip(items, ranks_list)
+    ]
+    return calculate_weights(ranks_list, counts, rank_threshold, weight_config)
+
+
+def calculate_news_weight(
+    news_data: Dict,
+    rank_threshold: int = 5,
+    weight_config: Optional[Dict] = None,
+) -> float:
+    """Compute the weight of a single news dict"""
+    return news_weights([news_data], rank_threshold, weight_config)[0]
+
+
+def sort_news_by_weight(
+    items: List[Dict],
+    rank_threshold: int = 5,
+    weight_config: Optional[Dict] = None,
+) -> List[Dict]:
+    """
+    Sort news dicts in place by weight, highest first (stable)
+
+    Returns:
+        The same list
+    """
+    weights = news_weights(items, rank_threshold, weight_config)
+    order = sorted(range(len(items)), key=lambda i: weights[i], reverse=True)
+    items[:] = [items[i] for i in order]
+    return items
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+In-Process Scheduler
+
+Drives the long-running daemon mode. Schedules are either a standard
+5-field cron expression ("*/30 * * * *") or a plain interval in minutes
+("30"). Ticks run on the calling thread, so they never overlap; a tick that
+overruns its slot simply skips the missed slots.
+"""
+
+import signal
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Set
+
+import pytz
+
+
+class CronSchedule:
+    """Standard 5-field cron expression (minute hour day month weekday)"""
+
+    # Weekday allows 7 as an alias for Sunday (0)
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str, timezone: str = "UTC"):
+        """
+        Initialize the schedule
+
+        Args:
+            expression: Cron expression, supports *, */n, a-b, a-b/n and a,b lists
+            timezone: Timezone the expression is evaluated in
+
+        Raises:
+            ValueError: Invalid expression
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression}")
+
+        self.expression = expression
+        self.timezone = pytz.timezone(timezone)
+        self.minutes, self.hours, self.days, self.months, self.weekdays = [
+            self._parse_field(field, low, high)
+            for field, (low, high) in zip(fields, self.FIELD_RANGES)
+        ]
+        self.weekdays = {day % 7 for day in self.weekdays}
+        # Cron semantics: when both day fields are restricted either may match
+        self._day_restricted = fields[2] != "*"
+        self._weekday_restricted = fields[4] != "*"
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> Set[int]:
+        """Parse one cron field into the set of allowed values"""
+        values = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_str = part.split("/", 1)
+                step = int(step_str)
+                if step <= 0:
+                    raise ValueError(f"Invalid cron step: {field}")
+
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start_str, end_str = part.split("-", 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field out of range: {field}")
+
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Check the day-of-month / day-of-week fields"""
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_run(self, after: float) -> float:
+        """
+        Get the next fire time strictly after a timestamp
+
+        Args:
+            after: Unix timestamp
+
+        Returns:
+            Unix timestamp of the next matching minute
+        """
+        moment = datetime.fromtimestamp(after, self.timezone).replace(
+            second=0, microsecond=0, tzinfo=None
+        ) + timedelta(minutes=1)
+
+        # Four years covers every valid combination (e.g. Feb 29)
+        limit = moment + timedelta(days=366 * 4)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            if moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+                continue
+            return self.timezone.localize(moment).timestamp()
+
+        raise ValueError(f"Cron expression never fires: {self.expression}")
+
+    def __str__(self) -> str:
+        return f"cron '{self.expression}'"
+
+
+class IntervalSchedule:
+    """Fixed interval between tick starts"""
+
+    def __init__(self, minutes: float):
+        if minutes <= 0:
+            raise ValueError(f"Interval must be positive: {minutes}")
+        self.seconds = minutes * 60
+
+    def next_run(self, after: float) -> float:
+        """Get the next fire time after a timestamp"""
+        return after + self.seconds
+
+    def __str__(self) -> str:
+        return f"every {self.seconds / 60:g} min"
+
+
+def parse_schedule(schedule: str, timezone: str = "UTC"):
+    """
+    Parse a schedule string
+
+    Args:
+        schedule: Cron expression or interval in minutes
+        timezone: Timezone cron expressions are evaluated in
+
+    Returns:
+        CronSchedule or IntervalSchedule
+
+    Raises:
+        ValueError: Invalid schedule
+    """
+    schedule = str(schedule).strip()
+    try:
+        return IntervalSchedule(float(schedule))
+    except ValueError:
+        return CronSchedule(schedule, timezone)
+
+
+class DaemonScheduler:
+    """Runs a job on a schedule until stopped, one tick at a time"""
+
+    def __init__(self, schedule, job: Callable[[], None]):
+        """
+        Initialize the scheduler
+
+        Args:
+            schedule: CronSchedule / IntervalSchedule
+            job: Callable run on every tick; exceptions are logged, not raised
+        """
+        self.schedule = schedule
+        self.job = job
+        self.ticks = 0
+        self._last_start: Optional[float] = None
+        self._stop_event = threading.Event()
+
+    def stop(self, *_args) -> None:
+        """Request shutdown; a running tick is allowed to finish"""
+        if not self._stop_event.is_set():
+            print("Shutdown requested, stopping after the current tick...")
+        self._stop_event.set()
+
+    def install_signal_handlers(self) -> None:
+        """Stop gracefully on SIGTERM / SIGINT"""
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self.stop)
+
+    def _run_tick(self) -> None:
+        """Run one tick, keeping the daemon alive on errors"""
+        self.ticks += 1
+        self._last_start = time.time()
+        start = time.monotonic()
+        try:
+            self.job()
+        except Exception as e:
+            print(f"Tick {self.ticks} failed: {e}")
+        print(f"Tick {self.ticks} finished in {time.monotonic() - start:.1f}s")
+
+    def run(self, immediate: bool = False, max_ticks: Optional[int] = None) -> None:
+        """
+        Run until stopped
+
+        Args:
+            immediate: Run one tick right away before waiting for the schedule
+            max_ticks: Stop after this many ticks (None runs forever)
+        """
+        if immediate:
+            self._run_tick()
+
+        while not self._stop_event.is_set():
+            if max_ticks is not None and self.ticks >= max_ticks:
+                break
+
+            next_time = self.schedule.next_run(self._last_start or time.time())
+            # An overrunning tick skips the slots it missed instead of queueing them
+            while next_time <= time.time():
+                next_time = self.schedule.next_run(next_time)
+            print(
+                "Next run at "
+                f"{datetime.fromtimestamp(next_time, pytz.UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC"
+            )
+            if self._stop_event.wait(max(0.0, next_time - time.time())):
+                break
+            self._run_tick()
+
+        print(f"Daemon stopped after {self.ticks} ticks")
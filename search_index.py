@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Full-Text Title Index
+
+Per-day inverted index over crawled titles, stored as a snapshot
+(output/<date>/.search_index.json) plus an append-only journal of folded
+files (.search_index.log): each crawl only parses and appends its own txt
+file, and the snapshot is rewritten once the journal outgrows it. The MCP
+search tools answer substring queries from it instead of lower-casing and
+scanning every title of every day.
+
+The crawler and the MCP server (several tool threads) update the same
+files: writers within a process take a per-day lock, snapshots are written
+to a unique temporary file and renamed into place, and a file missing from
+the index (e.g. a journal entry lost to another process compacting) is
+simply folded again on the next update.
+
+Tokenization is CJK-aware: runs of CJK characters become character bigrams
+(a lone CJK character is kept as a unigram), everything else becomes
+lower-cased word tokens. Queries are planned into token clauses whose
+postings give a candidate set, and candidates are then verified with a plain
+substring test, so results are exactly those of the linear scan.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+INDEX_FILE = ".search_index.json"
+JOURNAL_FILE = ".search_index.log"
+
+# One lock per index file, shared by every writer in this process
+_index_locks: Dict[str, threading.Lock] = {}
+_index_locks_guard = threading.Lock()
+
+
+def _index_lock(index_path: Path) -> threading.Lock:
+    key = os.path.abspath(index_path)
+    with _index_locks_guard:
+        lock = _index_locks.get(key)
+        if lock is None:
+            lock = _index_locks[key] = threading.Lock()
+        return lock
+
+_CJK_CLASS = (
+    "\u3040-\u30ff"  # Hiragana / Katakana
+    "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"  # CJK ideographs
+    "\uac00-\ud7af"  # Hangul
+)
+_CJK_RE = re.compile(f"[{_CJK_CLASS}]+")
+_QUERY_RE = re.compile(f"[{_CJK_CLASS}]+|(?:(?![{_CJK_CLASS}])[^\\W_])+")
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    Split a title into index tokens
+
+    Args:
+        text: Title text
+
+    Returns:
+        CJK bigrams (unigram for a single character) and lower-cased words
+    """
+    text = text.lower()
+    tokens = set()
+    for run in _CJK_RE.findall(text):
+        if len(run) == 1:
+            tokens.add(run)
+        else:
+            tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+    tokens.update(_WORD_RE.findall(_CJK_RE.sub(" ", text)))
+    return tokens
+
+
+def plan_query(query: str) -> List[Tuple[str, str]]:
+    """
+    Turn a substring query into token clauses
+
+    Word pieces at the edges of the query may be partial words in a title,
+    so they become prefix / suffix / contains clauses over the vocabulary;
+    pieces bounded on both sides must be whole tokens.
+
+    Args:
+        query: Lower-cased query
+
+    Returns:
+        [(kind, token)] with kind in exact / prefix / suffix / contains
+    """
+    clauses = []
+    for match in _QUERY_RE.finditer(query):
+        piece = match.group()
+        if _CJK_RE.fullmatch(piece):
+            if len(piece) == 1:
+                clauses.append(("contains", piece))
+            else:
+                clauses.extend(("exact", piece[i:i + 2]) for i in range(len(piece) - 1))
+            continue
+
+        left_bounded = match.start() > 0
+        right_bounded = match.end() < len(query)
+        if left_bounded and right_bounded:
+            clauses.append(("exact", piece))
+        elif left_bounded:
+            clauses.append(("prefix", piece))
+        elif right_bounded:
+            clauses.append(("suffix", piece))
+        else:
+            clauses.append(("contains", piece))
+    return clauses
+
+
+class DaySearchIndex:
+    """Inverted index over one day's titles"""
+
+    MIN_COMPACT_BYTES = 1024 * 1024
+
+    def __init__(self, index_path: Path):
+        """
+        Load (or start) a day index
+
+        Args:
+            index_path: output/<date>/.search_index.json
+        """
+        self.index_path = Path(index_path)
+        self.journal_path = self.index_path.with_name(JOURNAL_FILE)
+        self._reset()
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
+        self._pending: List[str] = []
+        self._snapshot_needed = False
+        self._load()
+
+    def _reset(self) -> None:
+        self.files: List[str] = []
+        # file name -> [mtime_ns, size] when it was folded
+        self.signatures: Dict[str, List[int]] = {}
+        self.id_to_name: Dict[str, str] = {}
+        # doc: [platform_id, title, ranks, url, mobile_url]
+        self.docs: List[List] = []
+        self.postings: Dict[str, List[int]] = {}
+        self._doc_ids: Dict[Tuple[str, str], int] = {}
+        self._vocabulary: Optional[List[str]] = None
+
+    def _load(self) -> None:
+        """Load the snapshot and replay the journal, starting empty when corrupt"""
+        try:
+            if self.index_path.exists():
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+                self.files = state["files"]
+                self.signatures = state["signatures"]
+                self.id_to_name = state["id_to_name"]
+                self.docs = state["docs"]
+                self.postings = state["postings"]
+                self._doc_ids = {(doc[0], doc[1]): i for i, doc in enumerate(self.docs)}
+                self._snapshot_bytes = self.index_path.stat().st_size
+
+            if self.journal_path.exists():
+                self._journal_bytes = self.journal_path.stat().st_size
+                with open(self.journal_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            # Torn line of a concurrent append, its file is folded again
+                            continue
+                        if entry["name"] not in self.signatures:
+                            self._fold(
+                                entry["name"], entry["signature"], entry["titles"], entry["names"]
+                            )
+        except Exception as e:
+            print(f"Failed to load search index {self.index_path}, rebuilding: {e}")
+            self._reset()
+            self._snapshot_needed = True
+
+    def add_file(
+        self,
+        file_name: str,
+        titles_by_id: Dict,
+        id_to_name: Dict,
+        signature: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Fold one crawl file into the index
+
+        Args:
+            file_name: txt file name
+            titles_by_id: {platform_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: {platform_id: platform_name}
+            signature: [mtime_ns, size] of the file, checked by update
+        """
+        signature = signature or [0, 0]
+        self._pending.append(json.dumps(
+            {"name": file_name, "signature": signature, "names": id_to_name, "titles": titles_by_id},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ))
+        self._fold(file_name, signature, titles_by_id, id_to_name)
+
+    def _fold(
+        self, file_name: str, signature: List[int], titles_by_id: Dict, id_to_name: Dict
+    ) -> None:
+        self.id_to_name.update(id_to_name)
+        for platform_id, titles in titles_by_id.items():
+            for title, info in titles.items():
+                key = (platform_id, title)
+                doc_id = self._doc_ids.get(key)
+                if doc_id is not None:
+                    self.docs[doc_id][2].extend(info.get("ranks", []))
+                    continue
+
+                doc_id = self._doc_ids[key] = len(self.docs)
+                self.docs.append([
+                    platform_id,
+                    title,
+                    list(info.get("ranks", [])),
+                    info.get("url", ""),
+                    info.get("mobileUrl", ""),
+                ])
+                for token in tokenize(title):
+                    self.postings.setdefault(token, []).append(doc_id)
+
+        self.files.append(file_name)
+        self.signatures[file_name] = signature
+        self._vocabulary = None
+
+    def update(
+        self, txt_files: Iterable[Path], parse: Callable[[Path], Tuple[Dict, Dict]]
+    ) -> bool:
+        """
+        Fold txt files that are not indexed yet
+
+        A file missing from disk or rewritten since it was folded, or a new
+        file sorting before the last indexed one, triggers a rebuild
+        (folding order decides rank order).
+
+        Args:
+            txt_files: The day's txt files
+            parse: Parser returning (titles_by_id, id_to_name) for a txt file
+
+        Returns:
+            True if the index changed
+        """
+        signatures = {}
+        for file_path in sorted(txt_files):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            signatures[file_path] = [stat.st_mtime_ns, stat.st_size]
+        indexed = self.signatures
+        last_indexed = max(self.files, default="")
+        present = [f for f in signatures if f.name in indexed]
+
+        if (
+            len(present) != len(indexed)
+            or any(signatures[f] != indexed[f.name] for f in present)
+            or any(f.name < last_indexed for f in signatures if f.name not in indexed)
+        ):
+            self._reset()
+            self._pending = []
+            self._snapshot_needed = True
+            indexed = self.signatures
+
+        for file_path, signature in signatures.items():
+            if file_path.name in indexed:
+                continue
+            titles_by_id, id_to_name = parse(file_path)
+            self.add_file(file_path.name, titles_by_id, id_to_name, signature)
+        return bool(self._pending) or self._snapshot_needed
+
+    def _write_snapshot(self) -> None:
+        """Write the whole index and drop the journal"""
+        content = json.dumps(
+            {
+                "files": self.files,
+                "signatures": self.signatures,
+                "id_to_name": self.id_to_name,
+                "docs": self.docs,
+                "postings": self.postings,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        # Unique temporary name: other threads and processes may be saving the same day
+        with tempfile.NamedTemporaryFile(
+            dir=self.index_path.parent, prefix=self.index_path.name, suffix=".tmp", delete=False
+        ) as f:
+            f.write(content)
+        try:
+            os.replace(f.name, self.index_path)
+        except OSError:
+            os.unlink(f.name)
+            raise
+        self.journal_path.unlink(missing_ok=True)
+        self._snapshot_bytes = len(content)
+        self._journal_bytes = 0
+
+    def save(self) -> None:
+        """Append newly folded files to the journal, rewriting the snapshot once the journal outgrows it"""
+        if not self._pending and not self._snapshot_needed:
+            return
+        try:
+            data = "".join(line + "\n" for line in self._pending).encode("utf-8")
+            journal_bytes = self._journal_bytes + len(data)
+            if self._snapshot_needed or journal_bytes > max(
+                self._snapshot_bytes, self.MIN_COMPACT_BYTES
+            ):
+                self._write_snapshot()
+            else:
+                # One write per save, so concurrent appends do not interleave lines
+                with open(self.journal_path, "ab") as f:
+                    f.write(data)
+                self._journal_bytes = journal_bytes
+            self._pending = []
+            self._snapshot_needed = False
+        except Exception as e:
+            print(f"Failed to save search index {self.index_path}: {e}")
+
+    def _clause_docs(self, kind: str, token: str) -> Set[int]:
+        if kind == "exact":
+            return set(self.postings.get(token, ()))
+
+        if self._vocabulary is None:
+            self._vocabulary = list(self.postings)
+        if kind == "prefix":
+            matched = [t for t in self._vocabulary if t.startswith(token)]
+        elif kind == "suffix":
+            matched = [t for t in self._vocabulary if t.endswith(token)]
+        else:
+            matched = [t for t in self._vocabulary if token in t]
+
+        docs: Set[int] = set()
+        for t in matched:
+            docs.update(self.postings[t])
+        return docs
+
+    def search(
+        self,
+        query: str,
+        case_sensitive: bool = False,
+        platform_ids: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Find titles containing a query string
+
+        Args:
+            query: Substring to look for
+            case_sensitive: Match case exactly (entity search)
+            platform_ids: Platform filter, None for all
+
+        Returns:
+            [{platform, platform_name, title, ranks, url, mobileUrl}] in index order
+        """
+        query_lower = query.lower()
+        candidates: Optional[Set[int]] = None
+        clause_sets = sorted(
+            (self._clause_docs(kind, token) for kind, token in plan_query(query_lower)),
+            key=len,
+        )
+        for docs in clause_sets:
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return []
+
+        doc_ids = sorted(candidates) if candidates is not None else range(len(self.docs))
+        platform_filter = set(platform_ids) if platform_ids else None
+
+        results = []
+        for doc_id in doc_ids:
+            platform_id, title, ranks, url, mobile_url = self.docs[doc_id]
+            if platform_filter is not None and platform_id not in platform_filter:
+                continue
+            if case_sensitive:
+                if query not in title:
+                    continue
+            elif query_lower not in title.lower():
+                continue
+            results.append({
+                "platform": platform_id,
+                "platform_name": self.id_to_name.get(platform_id, platform_id),
+                "title": title,
+                "ranks": ranks,
+                "url": url,
+                "mobileUrl": mobile_url,
+            })
+        return results
+
+
+def update_day_index(
+    date_dir: Path, parse: Callable[[Path], Tuple[Dict, Dict]]
+) -> Optional[DaySearchIndex]:
+    """
+    Bring a day's index up to date with its txt files and persist it
+
+    Args:
+        date_dir: output/<date>
+        parse: Parser returning (titles_by_id, id_to_name) for a txt file
+
+    Returns:
+        The day index, or None when the day has no txt directory
+    """
+    txt_dir = Path(date_dir) / "txt"
+    if not txt_dir.exists():
+        return None
+
+    index_path = Path(date_dir) / INDEX_FILE
+    with _index_lock(index_path):
+        index = DaySearchIndex(index_path)
+        if index.update(txt_dir.glob("*.txt"), parse):
+            index.save()
+    return index
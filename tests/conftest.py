@@ -0,0 +1,24 @@
+"""
+Shared test setup
+
+main.py loads config/config.yaml at import time and keeps its state under
+relative "output" paths, so tests import it with CONFIG_PATH pointing at the
+repository config and run inside a temporary working directory.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("CONFIG_PATH", str(ROOT / "config" / "config.yaml"))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run the test inside an empty project directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,148 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import main
+from main import DayAggregate
+
+
+def write_crawl(txt_dir: Path, name: str, titles: dict) -> None:
+    """Write a crawl file, titles is {source_id: [title, ...]} in rank order"""
+    with open(txt_dir / f"{name}.txt", "w", encoding="utf-8") as f:
+        for source_id, source_titles in titles.items():
+            f.write(f"{source_id} | Name of {source_id}\n")
+            for rank, title in enumerate(source_titles, 1):
+                f.write(f"{rank}. {title} [URL:https://example.com/{source_id}/{rank}]\n")
+            f.write("\n")
+
+
+def full_fold(txt_dir: Path) -> tuple:
+    """Fold every txt file from scratch, what the aggregate must reproduce"""
+    all_results, id_to_name, title_info = {}, {}, {}
+    for file_path in sorted(txt_dir.glob("*.txt")):
+        titles_by_id, file_id_to_name = main.parse_file_titles(file_path)
+        id_to_name.update(file_id_to_name)
+        for source_id, title_data in titles_by_id.items():
+            main.process_source_data(source_id, title_data, file_path.stem, all_results, title_info)
+    return all_results, id_to_name, title_info
+
+
+def normalized(result: tuple) -> str:
+    return json.dumps(result, sort_keys=True, ensure_ascii=False)
+
+
+@pytest.fixture
+def txt_dir(workdir):
+    txt_dir = Path("output") / main.format_date_folder() / "txt"
+    txt_dir.mkdir(parents=True)
+    return txt_dir
+
+
+def crawl(txt_dir: Path, index: int) -> None:
+    write_crawl(
+        txt_dir,
+        f"{index:02d}-00",
+        {
+            "weibo": [f"weibo story {index + i}" for i in range(3)],
+            "zhihu": [f"知乎 {index // 2 + i}" for i in range(2)],
+        },
+    )
+
+
+def test_journal_round_trip(txt_dir):
+    for index in range(3):
+        crawl(txt_dir, index)
+        result = main.read_all_today_titles()
+        assert normalized(result) == normalized(full_fold(txt_dir))
+
+    aggregate = DayAggregate(txt_dir.parent)
+    # Small day: everything since the first snapshot is in the journal
+    assert aggregate.journal_file.exists()
+    assert normalized(aggregate.view()) == normalized(full_fold(txt_dir))
+    assert sorted(aggregate.files) == sorted(path.name for path in txt_dir.glob("*.txt"))
+
+    assert normalized(main.read_all_today_titles(["zhihu"])) == normalized(
+        ({"zhihu": result[0]["zhihu"]}, {"zhihu": "Name of zhihu"}, {"zhihu": result[2]["zhihu"]})
+    )
+
+
+def test_only_new_files_are_parsed(txt_dir, monkeypatch):
+    crawl(txt_dir, 0)
+    crawl(txt_dir, 1)
+    aggregate = DayAggregate(txt_dir.parent)
+    main.read_all_today_titles(day_aggregate=aggregate)
+
+    parsed = []
+    parse = main.parse_file_titles_cached
+    monkeypatch.setattr(
+        main,
+        "parse_file_titles_cached",
+        lambda file_path, file_cache=None: parsed.append(file_path.name)
+        or parse(file_path, file_cache),
+    )
+    crawl(txt_dir, 2)
+    main.read_all_today_titles(day_aggregate=aggregate)
+    assert parsed == ["02-00.txt"]
+
+    main.read_all_today_titles()
+    assert parsed == ["02-00.txt"]
+
+
+def test_journal_is_compacted(txt_dir, monkeypatch):
+    monkeypatch.setattr(DayAggregate, "MIN_COMPACT_BYTES", 0)
+    aggregate = DayAggregate(txt_dir.parent)
+    for index in range(6):
+        crawl(txt_dir, index)
+        main.read_all_today_titles(day_aggregate=aggregate)
+        # The journal never grows past the snapshot
+        journal_bytes = (
+            aggregate.journal_file.stat().st_size if aggregate.journal_file.exists() else 0
+        )
+        assert journal_bytes <= aggregate.snapshot_file.stat().st_size
+
+    assert normalized(DayAggregate(txt_dir.parent).view()) == normalized(full_fold(txt_dir))
+
+
+def test_changed_file_rebuilds(txt_dir):
+    for index in range(3):
+        crawl(txt_dir, index)
+    main.read_all_today_titles()
+
+    write_crawl(txt_dir, "01-00", {"weibo": ["rewritten story"]})
+    os.utime(txt_dir / "01-00.txt", ns=(1, 1))
+    assert normalized(main.read_all_today_titles()) == normalized(full_fold(txt_dir))
+
+    (txt_dir / "00-00.txt").unlink()
+    assert normalized(main.read_all_today_titles()) == normalized(full_fold(txt_dir))
+
+    # A late file that sorts before the last folded one
+    write_crawl(txt_dir, "00-30", {"toutiao": ["late story"]})
+    assert normalized(main.read_all_today_titles()) == normalized(full_fold(txt_dir))
+
+
+def test_identical_rewrite_is_not_a_change(txt_dir, monkeypatch):
+    crawl(txt_dir, 0)
+    main.read_all_today_titles()
+    content = (txt_dir / "00-00.txt").read_bytes()
+    (txt_dir / "00-00.txt").write_bytes(content)
+    os.utime(txt_dir / "00-00.txt", ns=(1, 1))
+
+    monkeypatch.setattr(DayAggregate, "_fold", lambda *args: pytest.fail("file re-parsed"))
+    main.read_all_today_titles()
+    # The refreshed signature is persisted, the next load does not hash again
+    assert DayAggregate(txt_dir.parent).files["00-00.txt"][:2] == [1, len(content)]
+
+
+def test_corrupt_journal_rebuilds(txt_dir):
+    for index in range(2):
+        crawl(txt_dir, index)
+        main.read_all_today_titles()
+
+    aggregate = DayAggregate(txt_dir.parent)
+    with open(aggregate.journal_file, "a", encoding="utf-8") as f:
+        f.write('{"name": "torn')
+
+    assert normalized(main.read_all_today_titles()) == normalized(full_fold(txt_dir))
+    assert normalized(DayAggregate(txt_dir.parent).view()) == normalized(full_fold(txt_dir))
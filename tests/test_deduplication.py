@@ -0,0 +1,211 @@
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import pytz
+
+import main
+from main import BloomFilter, DeduplicationManager
+
+
+class Clock:
+    def __init__(self):
+        self.now = datetime(2026, 1, 1, 12, 0, tzinfo=pytz.UTC)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, hours: float) -> None:
+        self.now += timedelta(hours=hours)
+
+
+@pytest.fixture
+def clock(workdir, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(main, "get_utc_time", clock)
+    return clock
+
+
+def seen_all(manager, titles):
+    return [manager.is_seen("weibo", title) for title in titles]
+
+
+def test_bloom_filter_round_trip():
+    bloom = BloomFilter(1000, 0.01)
+    for key in range(0, 5000, 5):
+        bloom.add(key)
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+    assert (restored.size, restored.hash_count, restored.count) == (
+        bloom.size,
+        bloom.hash_count,
+        bloom.count,
+    )
+    assert all(key in restored for key in range(0, 5000, 5))
+    false_positives = sum(key in restored for key in range(1, 50000, 5))
+    assert false_positives < 10000 * 0.03
+
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(bloom.to_bytes()[:-1])
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(b"garbage")
+
+
+def test_journal_round_trip(clock):
+    titles = [f"title {i}" for i in range(10)]
+    manager = DeduplicationManager(retention_hours=72)
+    for title in titles[:5]:
+        manager.add("weibo", title)
+    manager.save()
+    assert manager.journal_file.stat().st_size == 5 * DeduplicationManager._RECORD.size
+
+    clock.advance(1)
+    manager = DeduplicationManager(retention_hours=72)
+    assert seen_all(manager, titles) == [True] * 5 + [False] * 5
+    for title in titles[3:]:
+        manager.add("weibo", title)
+    manager.save()
+
+    manager = DeduplicationManager(retention_hours=72)
+    assert all(seen_all(manager, titles))
+    assert not manager.is_seen("zhihu", titles[0])
+
+
+def test_torn_journal_record_is_ignored(clock):
+    manager = DeduplicationManager()
+    manager.add("weibo", "kept")
+    manager.save()
+    with open(manager.journal_file, "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    manager = DeduplicationManager()
+    assert manager.is_seen("weibo", "kept")
+
+
+def test_compaction_writes_snapshot(clock, monkeypatch):
+    monkeypatch.setattr(DeduplicationManager, "MIN_COMPACT_RECORDS", 4)
+    titles = [f"title {i}" for i in range(5)]
+    manager = DeduplicationManager()
+    for title in titles:
+        manager.add("weibo", title)
+    manager.save()
+    assert manager.journal_file.exists() and not manager.snapshot_file.exists()
+
+    # Moving every title to a newer hour doubles the journal past the live entries
+    clock.advance(1)
+    for title in titles:
+        manager.touch("weibo", title)
+    manager.save()
+    assert manager.snapshot_file.read_bytes().startswith(DeduplicationManager.MAGIC)
+    assert not manager.journal_file.exists()
+
+    clock.advance(1)
+    manager = DeduplicationManager()
+    assert all(seen_all(manager, titles))
+    assert set(manager._buckets) == {int(clock.now.timestamp() // 3600) - 1}
+
+
+def test_prune_drops_expired_titles(clock, monkeypatch):
+    manager = DeduplicationManager(retention_hours=2)
+    manager.add("weibo", "old")
+    manager.add("weibo", "refreshed")
+    manager.save()
+
+    clock.advance(2)
+    manager = DeduplicationManager(retention_hours=2)
+    manager.touch("weibo", "refreshed")
+    manager.add("weibo", "new")
+    manager.save()
+
+    clock.advance(1)
+    manager = DeduplicationManager(retention_hours=2)
+    assert not manager.is_seen("weibo", "old")
+    assert manager.is_seen("weibo", "refreshed")
+    assert manager.is_seen("weibo", "new")
+
+    # Once the pruned records outweigh the live ones the files are compacted
+    monkeypatch.setattr(DeduplicationManager, "MIN_COMPACT_RECORDS", 1)
+    clock.advance(3)
+    manager = DeduplicationManager(retention_hours=2)
+    assert seen_all(manager, ["old", "refreshed", "new"]) == [False] * 3
+    manager.save()
+    assert not manager.journal_file.exists()
+    assert manager.snapshot_file.stat().st_size == len(DeduplicationManager.MAGIC) + 4
+
+
+def test_legacy_state_is_migrated(clock):
+    legacy = Path("output") / DeduplicationManager.LEGACY_STATE_FILE
+    legacy.parent.mkdir()
+    timestamp = clock.now.timestamp()
+    legacy.write_text(
+        json.dumps(
+            {"history": {"weibo": {"legacy": timestamp, "expired": timestamp - 10 * 3600}}}
+        ),
+        encoding="utf-8",
+    )
+
+    manager = DeduplicationManager(retention_hours=5)
+    assert manager.is_seen("weibo", "legacy")
+    assert not manager.is_seen("weibo", "expired")
+    manager.save()
+    assert not legacy.exists()
+    assert DeduplicationManager(retention_hours=5).is_seen("weibo", "legacy")
+
+
+def test_bloom_slices_answer_without_exact_store(clock):
+    titles = [f"title {i}" for i in range(200)]
+    options = {"retention_hours": 48, "bloom_enabled": True, "bloom_slice_capacity": 1000}
+    manager = DeduplicationManager(**options)
+    for title in titles:
+        manager.add("weibo", title)
+    manager.save()
+    assert sorted(path.name for path in manager.bloom_dir.iterdir()) == [
+        f"{int(clock.now.timestamp() // 3600) // 24}.bloom"
+    ]
+
+    manager = DeduplicationManager(**options)
+    assert all(seen_all(manager, titles))
+    assert sum(seen_all(manager, [f"new {i}" for i in range(200)])) <= 2
+    assert not manager._loaded
+
+    # Confirming mode loads the exact store and never reports a new title as seen
+    manager = DeduplicationManager(**options, bloom_confirm_hits=True)
+    assert all(seen_all(manager, titles))
+    assert not any(seen_all(manager, [f"new {i}" for i in range(200)]))
+    assert manager._loaded
+
+
+def test_bloom_slices_expire_with_retention(clock):
+    manager = DeduplicationManager(retention_hours=24, bloom_enabled=True, bloom_slice_hours=12)
+    manager.add("weibo", "first")
+    manager.save()
+
+    clock.advance(48)
+    manager = DeduplicationManager(retention_hours=24, bloom_enabled=True, bloom_slice_hours=12)
+    assert not manager.is_seen("weibo", "first")
+    manager.add("weibo", "second")
+    manager.save()
+    current_slice = int(clock.now.timestamp() // 3600) // 12
+    assert [path.name for path in manager.bloom_dir.iterdir()] == [f"{current_slice}.bloom"]
+
+
+def test_disabling_bloom_removes_slices(clock):
+    manager = DeduplicationManager(bloom_enabled=True)
+    manager.add("weibo", "title")
+    manager.save()
+    assert manager.bloom_dir.exists()
+
+    manager = DeduplicationManager(bloom_enabled=False)
+    manager.save()
+    assert not manager.bloom_dir.exists()
+    assert manager.is_seen("weibo", "title")
+
+
+def test_missing_bloom_slices_are_rebuilt(clock):
+    manager = DeduplicationManager()
+    manager.add("weibo", "title")
+    manager.save()
+
+    manager = DeduplicationManager(bloom_enabled=True)
+    assert manager.is_seen("weibo", "title")
+    assert not manager.is_seen("weibo", "other")
@@ -0,0 +1,105 @@
+from frequency_rules import (
+    REGEX,
+    SUBSTRING,
+    WORD,
+    AhoCorasick,
+    TermMatcher,
+    WordGroupMatcher,
+    parse_frequency_rules,
+    parse_term,
+)
+
+RULES = """华为
++发布
+!广告
+
+[AI]|人工智能
+/gpt-?\\d+/
+
+苹果
+"""
+
+
+def test_parse_frequency_rules():
+    groups, filter_words = parse_frequency_rules(RULES)
+    assert filter_words == ["广告"]
+    assert groups == [
+        {"required": ["发布"], "normal": ["华为"], "filter_words": ["广告"], "group_key": "华为"},
+        {
+            "required": [],
+            "normal": ["[AI]|人工智能", "/gpt-?\\d+/"],
+            "filter_words": [],
+            "group_key": "[AI]|人工智能 /gpt-?\\d+/",
+        },
+        {"required": [], "normal": ["苹果"], "filter_words": [], "group_key": "苹果"},
+    ]
+
+
+def test_parse_frequency_rules_group_key_falls_back_to_required():
+    groups, _ = parse_frequency_rules("+芯片\n+出口")
+    assert groups[0]["group_key"] == "芯片 出口"
+    assert parse_frequency_rules("!only filter")[0] == []
+
+
+def test_parse_term():
+    assert parse_term("Huawei") == [(SUBSTRING, "Huawei")]
+    assert parse_term("[AI]") == [(WORD, "AI")]
+    assert parse_term("/a|b/") == [(REGEX, "a|b")]
+    assert parse_term("华为 | Huawei | [HW]") == [
+        (SUBSTRING, "华为"),
+        (SUBSTRING, "Huawei"),
+        (WORD, "HW"),
+    ]
+    # Too short to be a whole word, kept literally
+    assert parse_term("[]") == [(SUBSTRING, "[]")]
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers", ""])
+    found = automaton.find_all("ushers")
+    assert {automaton.patterns[i] for i in found} == {"he", "she", "hers", ""}
+
+
+def test_term_matcher_substrings_are_case_insensitive():
+    matcher = TermMatcher(["Huawei", "华为"])
+    assert matcher.find("HUAWEI Mate") == {"Huawei"}
+    assert matcher.find("华为发布会") == {"华为"}
+    assert matcher.find("Apple") == set()
+
+
+def test_term_matcher_whole_words():
+    matcher = TermMatcher(["[AI]", "[C++]"])
+    assert matcher.find("New AI model") == {"[AI]"}
+    assert matcher.find("ai.") == {"[AI]"}
+    assert matcher.find("MAIL and AIGC") == set()
+    assert matcher.find("learn C++ now") == {"[C++]"}
+    assert matcher.find("C++20") == set()
+
+
+def test_term_matcher_whole_words_in_cjk_text():
+    matcher = TermMatcher(["[AI]", "[华为]", "[华为P70]"])
+    assert matcher.find("使用AI技术") == {"[AI]"}
+    assert matcher.find("华为手机") == {"[华为]"}
+    assert matcher.find("新款华为P70") == {"[华为]", "[华为P70]"}
+    assert matcher.find("华为P70s") == {"[华为]"}
+
+
+def test_term_matcher_regex_and_alternation():
+    matcher = TermMatcher(["/gpt-?\\d+/", "华为|[HW]", "/(/"])
+    assert matcher.find("GPT4 released") == {"/gpt-?\\d+/"}
+    assert matcher.find("HW news") == {"华为|[HW]"}
+    assert matcher.find("华为") == {"华为|[HW]"}
+    # Invalid regexes never match
+    assert matcher.find("(") == set()
+
+
+def test_word_group_matcher():
+    groups, filter_words = parse_frequency_rules(RULES)
+    matcher = WordGroupMatcher(groups, filter_words)
+    assert matcher.match("华为发布新机") == (False, 0)
+    # Required word missing
+    assert matcher.match("华为手机") == (False, None)
+    assert matcher.match("华为发布广告") == (True, None)
+    assert matcher.match("OpenAI GPT-5 来了") == (False, 1)
+    assert matcher.match("苹果与AI") == (False, 1)
+    assert matcher.match("苹果") == (False, 2)
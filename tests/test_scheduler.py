@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+import pytz
+
+from scheduler import CronSchedule, IntervalSchedule, parse_schedule
+
+UTC = pytz.UTC
+
+
+def ts(*args) -> float:
+    return UTC.localize(datetime(*args)).timestamp()
+
+
+def test_parse_schedule_interval():
+    schedule = parse_schedule("30")
+    assert isinstance(schedule, IntervalSchedule)
+    assert schedule.next_run(1000.0) == 1000.0 + 30 * 60
+    assert isinstance(parse_schedule(" 1.5 "), IntervalSchedule)
+
+
+def test_parse_schedule_cron():
+    schedule = parse_schedule("*/15 * * * *")
+    assert isinstance(schedule, CronSchedule)
+    assert schedule.minutes == {0, 15, 30, 45}
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["0", "-5", "* * * *", "60 * * * *", "* 24 * * *", "*/0 * * * *", "5-1 * * * *", "x * * * *"],
+)
+def test_parse_schedule_rejects_invalid(expression):
+    with pytest.raises(ValueError):
+        parse_schedule(expression)
+
+
+def test_cron_fields():
+    schedule = CronSchedule("0,30 9-17/4 1 1-3 7")
+    assert schedule.minutes == {0, 30}
+    assert schedule.hours == {9, 13, 17}
+    assert schedule.days == {1}
+    assert schedule.months == {1, 2, 3}
+    # 7 is Sunday
+    assert schedule.weekdays == {0}
+
+
+def test_cron_next_run_is_strictly_after():
+    schedule = parse_schedule("*/30 * * * *")
+    assert schedule.next_run(ts(2026, 1, 1, 10, 0)) == ts(2026, 1, 1, 10, 30)
+    assert schedule.next_run(ts(2026, 1, 1, 10, 29, 59)) == ts(2026, 1, 1, 10, 30)
+    assert schedule.next_run(ts(2026, 1, 1, 23, 30)) == ts(2026, 1, 2, 0, 0)
+
+
+def test_cron_next_run_rolls_over_months_and_leap_days():
+    assert parse_schedule("0 0 1 * *").next_run(ts(2026, 1, 15)) == ts(2026, 2, 1)
+    assert parse_schedule("0 12 29 2 *").next_run(ts(2026, 3, 1)) == ts(2028, 2, 29, 12)
+
+
+def test_cron_day_or_weekday():
+    # Both day fields restricted: either one may match (the 13th, or a Friday)
+    schedule = parse_schedule("0 0 13 * 5")
+    # 2026-01-02 is a Friday
+    assert schedule.next_run(ts(2026, 1, 1)) == ts(2026, 1, 2)
+    assert schedule.next_run(ts(2026, 1, 12)) == ts(2026, 1, 13)
+    # Only the weekday restricted: every Monday
+    assert parse_schedule("0 8 * * 1").next_run(ts(2026, 1, 1)) == ts(2026, 1, 5, 8)
+
+
+def test_cron_timezone():
+    schedule = parse_schedule("0 9 * * *", "Asia/Shanghai")
+    assert schedule.next_run(ts(2026, 1, 1, 0, 0)) == ts(2026, 1, 1, 1, 0)
+
+
+def test_cron_never_fires():
+    with pytest.raises(ValueError):
+        parse_schedule("0 0 31 2 *").next_run(ts(2026, 1, 1))
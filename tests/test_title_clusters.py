@@ -0,0 +1,70 @@
+from title_clusters import MinHasher, TitleClusterIndex, jaccard, title_shingles
+
+SAME_STORY = [
+    "SpaceX Starship completes first orbital flight test",
+    "SpaceX Starship completes its first orbital flight test",
+    "Starship completes first orbital flight test, says SpaceX",
+]
+OTHER = [
+    "Central bank raises interest rates by half a point",
+    "Local team wins the championship after overtime thriller",
+]
+
+
+def build(titles):
+    index = TitleClusterIndex()
+    for position, title in enumerate(titles):
+        index.add(position, title)
+    return index
+
+
+def test_jaccard():
+    assert jaccard({"a", "b"}, {"b", "c"}) == 1 / 3
+    assert jaccard(set(), {"a"}) == 0.0
+
+
+def test_minhash_estimates_similarity():
+    hasher = MinHasher(num_perm=128)
+    a = title_shingles(SAME_STORY[0])
+    b = title_shingles(SAME_STORY[1])
+    agreement = sum(x == y for x, y in zip(hasher.signature(a), hasher.signature(b))) / 128
+    assert abs(agreement - jaccard(a, b)) < 0.2
+    assert hasher.signature(a) == MinHasher(num_perm=128).signature(a)
+
+
+def test_similar():
+    index = build(SAME_STORY + OTHER)
+    results = index.similar(SAME_STORY[0], 0.5)
+    assert [key for key, _ in results][:1] == [0]
+    assert {key for key, _ in results} <= {0, 1, 2}
+    assert all(a[1] >= b[1] for a, b in zip(results, results[1:]))
+    assert index.similar("", 0.5) == []
+
+
+def test_clusters_group_near_duplicates_only():
+    index = build(SAME_STORY + OTHER)
+    assert index.clusters(0.5) == [[0, 1, 2], [3], [4]]
+    # Pairs below the threshold are not linked
+    assert index.clusters(0.95) == [[0], [1], [2], [3], [4]]
+
+
+def test_clusters_can_merge():
+    index = build(SAME_STORY)
+    clusters = index.clusters(0.5, can_merge=lambda a, b: False)
+    assert clusters == [[0], [1], [2]]
+
+
+def test_clusters_distinct_keys():
+    titles = SAME_STORY[:2] + [SAME_STORY[0]]
+    platforms = ["weibo", "weibo", "zhihu"]
+    index = build(titles)
+    clusters = index.clusters(0.5, distinct=lambda doc_id: platforms[doc_id])
+    # Never two titles of one platform in a cluster, also not through a third member
+    for members in clusters:
+        assert len({platforms[doc_id] for doc_id in members}) == len(members)
+    assert [0, 2] in clusters
+
+
+def test_clusters_exact_duplicates():
+    index = build(["Same title here", "Same title here", "Same title here"])
+    assert index.clusters(0.9) == [[0, 1, 2]]
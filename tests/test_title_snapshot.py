@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from title_snapshot import (
+    MAGIC,
+    fresh_snapshot_for,
+    read_snapshot,
+    snapshot_path_for,
+    write_snapshot,
+)
+
+SOURCES = [
+    (
+        "weibo",
+        "微博",
+        [
+            (1, "第一条 热搜", "https://weibo.com/1", ""),
+            (2, "Second title", "https://weibo.com/2", "https://m.weibo.com/2"),
+        ],
+    ),
+    ("empty", "Empty", []),
+    ("hackernews", "", [(1, "Show HN: 第一条 热搜", "", ""), (-3, "Negative rank", "", "")]),
+]
+
+
+def test_round_trip(tmp_path):
+    snap_path = tmp_path / "snap" / "10-30.snap"
+    write_snapshot(snap_path, SOURCES, ["zhihu", "toutiao"])
+
+    assert snap_path.read_bytes().startswith(MAGIC)
+    titles_by_id, id_to_name, failed_ids = read_snapshot(snap_path)
+    assert list(titles_by_id) == ["weibo", "hackernews"]
+    assert id_to_name == {"weibo": "微博", "hackernews": "hackernews"}
+    assert failed_ids == ["zhihu", "toutiao"]
+    assert titles_by_id["weibo"] == {
+        "第一条 热搜": {"ranks": [1], "url": "https://weibo.com/1", "mobileUrl": ""},
+        "Second title": {
+            "ranks": [2],
+            "url": "https://weibo.com/2",
+            "mobileUrl": "https://m.weibo.com/2",
+        },
+    }
+    assert titles_by_id["hackernews"]["Negative rank"]["ranks"] == [-3]
+    assert not snap_path.with_suffix(".tmp").exists()
+
+
+def test_empty_snapshot(tmp_path):
+    snap_path = tmp_path / "empty.snap"
+    write_snapshot(snap_path, [])
+    assert read_snapshot(snap_path) == ({}, {}, [])
+
+
+def test_nul_characters_are_dropped(tmp_path):
+    snap_path = tmp_path / "nul.snap"
+    write_snapshot(snap_path, [("a", "A", [(1, "bad\x00title", "", "")])])
+    titles_by_id, _, _ = read_snapshot(snap_path)
+    assert list(titles_by_id["a"]) == ["badtitle"]
+
+
+def test_corrupt_snapshots_are_rejected(tmp_path):
+    snap_path = tmp_path / "x.snap"
+    write_snapshot(snap_path, SOURCES)
+    data = snap_path.read_bytes()
+
+    snap_path.write_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        read_snapshot(snap_path)
+
+    snap_path.write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError):
+        read_snapshot(snap_path)
+
+
+def test_fresh_snapshot_for(tmp_path):
+    txt_path = tmp_path / "2026-01-01" / "txt" / "10-30.txt"
+    txt_path.parent.mkdir(parents=True)
+    txt_path.write_text("weibo | 微博\n1. title\n\n", encoding="utf-8")
+    snap_path = snapshot_path_for(txt_path)
+    assert snap_path == tmp_path / "2026-01-01" / "snap" / "10-30.snap"
+    assert fresh_snapshot_for(txt_path) is None
+
+    write_snapshot(snap_path, SOURCES)
+    os.utime(txt_path, ns=(1_000_000_000, 1_000_000_000))
+    assert fresh_snapshot_for(txt_path) == snap_path
+
+    # A txt file edited after the crawl wins over its snapshot
+    stat = snap_path.stat()
+    os.utime(txt_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert fresh_snapshot_for(txt_path) is None
+
+
+def test_snapshot_matches_txt_parse(workdir):
+    import main
+
+    results = {
+        "weibo": {
+            "第二条": {"ranks": [2], "url": "https://weibo.com/2", "mobileUrl": ""},
+            "第一条": {"ranks": [1], "url": "", "mobileUrl": "https://m.weibo.com/1"},
+        },
+        "hackernews": {"Show HN: thing": {"ranks": [1], "url": "https://x.test", "mobileUrl": ""}},
+    }
+    txt_file = main.save_titles_to_file(results, {"weibo": "微博"}, [])
+    from_snapshot = main.parse_file_titles(txt_file)
+
+    os.remove(snapshot_path_for(txt_file))
+    assert main.parse_file_titles(txt_file) == from_snapshot
+    assert from_snapshot[1] == {"weibo": "微博", "hackernews": "hackernews"}
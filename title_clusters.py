@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Title Clustering
+
+The same story appears on several platforms with slightly different
+wording. Titles are reduced to shingle sets (CJK character bigrams and
+lower-cased words, the tokens of search_index.tokenize), summarised as
+MinHash signatures and bucketed with banded LSH, so only titles sharing a
+band are ever compared. Candidates are verified with the exact Jaccard
+similarity of their shingle sets; the cost is roughly linear in the number
+of titles instead of pairwise.
+
+main.py merges each cluster of a crawl into one report entry; the MCP
+server's find_similar_news uses the same index to pick candidates.
+"""
+
+import hashlib
+import struct
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from search_index import tokenize
+
+
+def title_shingles(title: str) -> Set[str]:
+    """Shingle set of a title"""
+    return tokenize(title)
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two shingle sets"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """MinHash signatures with num_perm independent 32-bit hash functions
+
+    Each shingle is hashed once per 16 functions with salted blake2b (one
+    64-byte digest holds 16 values); rows are memoised since shingles repeat
+    across titles, and the signature is the element-wise minimum.
+    """
+
+    _VALUES_PER_DIGEST = 16
+
+    def __init__(self, num_perm: int = 32, seed: int = 1):
+        self.num_perm = num_perm
+        digests = -(-num_perm // self._VALUES_PER_DIGEST)
+        self._salts = [
+            f"{seed}:{i}".encode("utf-8")[:16] for i in range(digests)
+        ]
+        self._row_format = struct.Struct(f"<{digests * self._VALUES_PER_DIGEST}I")
+        self._rows: Dict[str, Tuple[int, ...]] = {}
+
+    def _row(self, shingle: str) -> Tuple[int, ...]:
+        row = self._rows.get(shingle)
+        if row is None:
+            data = shingle.encode("utf-8")
+            digest = b"".join(
+                hashlib.blake2b(data, digest_size=64, salt=salt).digest() for salt in self._salts
+            )
+            row = self._row_format.unpack(digest)[: self.num_perm]
+            if len(self._rows) < 500000:
+                self._rows[shingle] = row
+        return row
+
+    def signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        """
+        Get the signature of a shingle set
+
+        Args:
+            shingles: Non-empty shingle set
+
+        Returns:
+            num_perm minimum hash values
+        """
+        return tuple(map(min, zip(*map(self._row, shingles))))
+
+
+class TitleClusterIndex:
+    """Banded MinHash LSH index over titles
+
+    With bands x rows signature values, two titles with Jaccard similarity
+    s share at least one band with probability 1 - (1 - s^rows)^bands; the
+    default 16 x 2 finds pairs at s = 0.5 with probability ~0.99.
+    """
+
+    # Bands shared by more titles than this come from very common shingles
+    # (stop words); true near-duplicates also share rarer bands, so these
+    # buckets are not expanded into pairs when clustering
+    MAX_BUCKET_PAIRS_SIZE = 64
+
+    def __init__(self, bands: int = 16, rows: int = 2, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        self.hasher = MinHasher(bands * rows, seed)
+        self.keys: List[Hashable] = []
+        self.titles: List[str] = []
+        self.shingles: List[Set[str]] = []
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _bands_of(self, shingles: Set[str]) -> List[Tuple[int, Tuple[int, ...]]]:
+        signature = self.hasher.signature(shingles)
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def add(self, key: Hashable, title: str) -> int:
+        """
+        Index a title
+
+        Args:
+            key: Caller's identifier, returned by queries
+            title: Title text
+
+        Returns:
+            Document id of the title
+        """
+        doc_id = len(self.keys)
+        shingles = title_shingles(title)
+        self.keys.append(key)
+        self.titles.append(title)
+        self.shingles.append(shingles)
+        if shingles:
+            for band in self._bands_of(shingles):
+                self._buckets.setdefault(band, []).append(doc_id)
+        return doc_id
+
+    def candidates(self, title: str) -> Set[int]:
+        """Get the ids of indexed titles sharing at least one band with a title"""
+        shingles = title_shingles(title)
+        if not shingles:
+            return set()
+        found: Set[int] = set()
+        for band in self._bands_of(shingles):
+            found.update(self._buckets.get(band, ()))
+        return found
+
+    def similar(self, title: str, threshold: float) -> List[Tuple[Hashable, float]]:
+        """
+        Find indexed titles similar to a title
+
+        Args:
+            title: Query title
+            threshold: Minimum Jaccard similarity
+
+        Returns:
+            [(key, similarity)] sorted by similarity, highest first
+        """
+        shingles = title_shingles(title)
+        results = []
+        for doc_id in self.candidates(title):
+            similarity = jaccard(shingles, self.shingles[doc_id])
+            if similarity >= threshold:
+                results.append((self.keys[doc_id], similarity))
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results
+
+    def clusters(
+        self,
+        threshold: float,
+        can_merge: Optional[Callable[[int, int], bool]] = None,
+        distinct: Optional[Callable[[int], Hashable]] = None,
+    ) -> List[List[int]]:
+        """
+        Group indexed titles into near-duplicate clusters
+
+        Args:
+            threshold: Minimum Jaccard similarity of a linked pair
+            can_merge: Optional predicate on two document ids, e.g. to keep
+                clusters within one keyword group
+            distinct: Optional key of a document id; a cluster never holds
+                two documents with the same key (e.g. the same platform),
+                also not through other members
+
+        Returns:
+            Clusters of document ids, each in insertion order, ordered by
+            their first member; singletons included
+        """
+        parent = list(range(len(self.keys)))
+        # Keys of every member, per cluster root (only with distinct)
+        root_keys: Dict[int, Set[Hashable]] = {}
+
+        def find(doc_id: int) -> int:
+            while parent[doc_id] != doc_id:
+                parent[doc_id] = parent[parent[doc_id]]
+                doc_id = parent[doc_id]
+            return doc_id
+
+        checked: Set[Tuple[int, int]] = set()
+        for members in self._buckets.values():
+            if len(members) < 2 or len(members) > self.MAX_BUCKET_PAIRS_SIZE:
+                continue
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    pair = (first, second)
+                    if pair in checked:
+                        continue
+                    checked.add(pair)
+                    root_first, root_second = find(first), find(second)
+                    if root_first == root_second:
+                        continue
+                    if can_merge is not None and not can_merge(first, second):
+                        continue
+                    if distinct is not None:
+                        keys_first = root_keys.setdefault(root_first, {distinct(root_first)})
+                        keys_second = root_keys.setdefault(root_second, {distinct(root_second)})
+                        if keys_first & keys_second:
+                            continue
+                    if jaccard(self.shingles[first], self.shingles[second]) >= threshold:
+                        root, child = min(root_first, root_second), max(root_first, root_second)
+                        parent[child] = root
+                        if distinct is not None:
+                            root_keys[root] = keys_first | keys_second
+                            del root_keys[child]
+
+        grouped: Dict[int, List[int]] = {}
+        for doc_id in range(len(self.keys)):
+            grouped.setdefault(find(doc_id), []).append(doc_id)
+        return sorted(grouped.values(), key=lambda members: members[0])
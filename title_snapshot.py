@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Binary Title Snapshots
+
+Machine-oriented companion to the txt crawl output. Every crawl writes
+output/<date>/snap/<HH-MM>.snap next to output/<date>/txt/<HH-MM>.txt in the
+same pass; readers prefer the snapshot and fall back to parsing the txt file,
+which stays the human-readable artifact.
+
+Layout (little-endian, columnar, all strings interned once):
+
+    magic          8 bytes  b"TRSNAP\\x01\\n"
+    header         5 x u32  n_strings, strings_bytes, n_sources, n_rows, n_failed
+    strings        utf-8, NUL separated
+    sources        u32[n_sources] id string, u32[n_sources] name string
+    rows           u32[n_rows] source position, u32[n_rows] title string,
+                   i32[n_rows] rank, u32[n_rows] url string,
+                   u32[n_rows] mobile url string
+    failed         u32[n_failed] failed id string
+
+Loading is a handful of bulk array reads plus one decode/split, with no
+per-line string scanning.
+"""
+
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"TRSNAP\x01\n"
+SNAPSHOT_DIR = "snap"
+SNAPSHOT_SUFFIX = ".snap"
+
+_HEADER = struct.Struct("<5I")
+_U32 = "I" if array("I").itemsize == 4 else "L"
+_I32 = "i" if array("i").itemsize == 4 else "l"
+
+
+def snapshot_path_for(txt_path: Path) -> Path:
+    """
+    Get the snapshot path belonging to a txt file
+
+    Args:
+        txt_path: output/<date>/txt/<HH-MM>.txt
+
+    Returns:
+        output/<date>/snap/<HH-MM>.snap
+    """
+    txt_path = Path(txt_path)
+    return txt_path.parent.parent / SNAPSHOT_DIR / f"{txt_path.stem}{SNAPSHOT_SUFFIX}"
+
+
+def fresh_snapshot_for(txt_path: Path) -> Optional[Path]:
+    """
+    Get the snapshot of a txt file if it is at least as new as the txt file
+
+    A txt file edited after the crawl is newer than its snapshot, in which
+    case the txt file wins.
+
+    Args:
+        txt_path: txt file path
+
+    Returns:
+        Snapshot path, or None when missing or stale
+    """
+    snap_path = snapshot_path_for(txt_path)
+    try:
+        if snap_path.stat().st_mtime_ns >= Path(txt_path).stat().st_mtime_ns:
+            return snap_path
+    except OSError:
+        pass
+    return None
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_snapshot(
+    snap_path: Path,
+    sources: Iterable[Tuple[str, str, List[Tuple[int, str, str, str]]]],
+    failed_ids: Optional[List[str]] = None,
+) -> None:
+    """
+    Write a snapshot
+
+    Args:
+        snap_path: Target path, parent directories are created
+        sources: (source_id, name, [(rank, title, url, mobile_url), ...]) in
+            output order; titles must already be cleaned
+        failed_ids: Source ids that failed this crawl
+    """
+    strings: List[str] = []
+    index: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        value = (value or "").replace("\x00", "")
+        position = index.get(value)
+        if position is None:
+            position = index[value] = len(strings)
+            strings.append(value)
+        return position
+
+    source_ids, source_names = array(_U32), array(_U32)
+    row_source, row_title, row_rank = array(_U32), array(_U32), array(_I32)
+    row_url, row_mobile = array(_U32), array(_U32)
+
+    for source_id, name, rows in sources:
+        if not rows:
+            continue
+        position = len(source_ids)
+        source_ids.append(intern(source_id))
+        source_names.append(intern(name or source_id))
+        for rank, title, url, mobile_url in rows:
+            row_source.append(position)
+            row_title.append(intern(title))
+            row_rank.append(int(rank))
+            row_url.append(intern(url))
+            row_mobile.append(intern(mobile_url))
+
+    failed = array(_U32, (intern(failed_id) for failed_id in failed_ids or []))
+    blob = "\x00".join(strings).encode("utf-8")
+
+    snap_path = Path(snap_path)
+    snap_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = snap_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(
+            _HEADER.pack(len(strings), len(blob), len(source_ids), len(row_source), len(failed))
+        )
+        f.write(blob)
+        for column in (
+            source_ids, source_names,
+            row_source, row_title, row_rank, row_url, row_mobile,
+            failed,
+        ):
+            f.write(_to_bytes(column))
+    tmp_path.replace(snap_path)
+
+
+def read_snapshot(snap_path: Path) -> Tuple[Dict, Dict, List[str]]:
+    """
+    Read a snapshot
+
+    Args:
+        snap_path: Snapshot path
+
+    Returns:
+        (titles_by_id, id_to_name, failed_ids), titles_by_id in the same
+        {source_id: {title: {ranks, url, mobileUrl}}} shape as the txt parsers
+
+    Raises:
+        ValueError: Not a snapshot or truncated
+    """
+    data = Path(snap_path).read_bytes()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"Not a title snapshot: {snap_path}")
+
+    offset = len(MAGIC)
+    n_strings, strings_bytes, n_sources, n_rows, n_failed = _HEADER.unpack_from(data, offset)
+    offset += _HEADER.size
+
+    expected = offset + strings_bytes + 4 * (2 * n_sources + 5 * n_rows + n_failed)
+    if len(data) != expected:
+        raise ValueError(f"Truncated title snapshot: {snap_path}")
+
+    strings = data[offset:offset + strings_bytes].decode("utf-8").split("\x00")
+    offset += strings_bytes
+    if len(strings) != max(n_strings, 1):
+        raise ValueError(f"Corrupt string table in title snapshot: {snap_path}")
+
+    def column(typecode: str, count: int) -> array:
+        nonlocal offset
+        values = _from_bytes(typecode, data[offset:offset + 4 * count])
+        offset += 4 * count
+        return values
+
+    source_ids = [strings[i] for i in column(_U32, n_sources)]
+    source_names = [strings[i] for i in column(_U32, n_sources)]
+    row_source = column(_U32, n_rows)
+    row_title = column(_U32, n_rows)
+    row_rank = column(_I32, n_rows)
+    row_url = column(_U32, n_rows)
+    row_mobile = column(_U32, n_rows)
+    failed_ids = [strings[i] for i in column(_U32, n_failed)]
+
+    id_to_name = dict(zip(source_ids, source_names))
+    source_titles = [{} for _ in source_ids]
+    titles_by_id = dict(zip(source_ids, source_titles))
+
+    for position, title, rank, url, mobile_url in zip(
+        row_source, row_title, row_rank, row_url, row_mobile
+    ):
+        source_titles[position][strings[title]] = {
+            "ranks": [rank],
+            "url": strings[url],
+            "mobileUrl": strings[mobile_url],
+        }
+
+    return titles_by_id, id_to_name, failed_ids